@@ -9,20 +9,17 @@ This script allows you to run Python AzViz without installing it:
 """
 
 import sys
+from importlib.util import find_spec
 from pathlib import Path
 
-# Add src directory to Python path so we can import azviz
-project_root = Path(__file__).parent
-src_path = project_root / "src"
-sys.path.insert(0, str(src_path))
+# Only fall back to the source tree when azviz is not already importable
+# (e.g. installed with `pip install -e .`), so a single copy is ever loaded
+if "azviz" not in sys.modules and find_spec("azviz") is None:
+    sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 # Import and run the CLI
 try:
     from azviz.cli import main
-
-    if __name__ == "__main__":
-        main()
-
 except ImportError as e:
     print(f"❌ Error importing azviz: {e}")
     print(
@@ -32,6 +29,6 @@ except ImportError as e:
     print("   # or")
     print("   pip install -e .")
     sys.exit(1)
-except Exception as e:
-    print(f"❌ Error: {e}")
-    sys.exit(1)
+
+if __name__ == "__main__":
+    main()
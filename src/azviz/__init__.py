@@ -6,8 +6,10 @@ Azure resource topology diagrams.
 
 from __future__ import annotations
 
+# _version.py is the single source of truth for the version; pyproject.toml
+# reads it at build time, so source checkouts (azviz_wrapper.py) report it too
+from ._version import __version__
 from .core.azviz import AzViz
 from .core.models import LabelVerbosity, OutputFormat, Theme
 
-__version__ = "1.1.4"
-__all__ = ["AzViz", "LabelVerbosity", "OutputFormat", "Theme"]
+__all__ = ["AzViz", "LabelVerbosity", "OutputFormat", "Theme", "__version__"]
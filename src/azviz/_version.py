@@ -0,0 +1,3 @@
+"""Version of the python-azviz package, read by setuptools at build time."""
+
+__version__ = "1.1.4"
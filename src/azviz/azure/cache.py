@@ -0,0 +1,98 @@
+"""On-disk TTL cache for Azure discovery responses."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheEntry:
+    """Cached value together with the time it becomes stale."""
+
+    value: Any
+    stale_at: float
+
+    @property
+    def is_stale(self) -> bool:
+        """Whether the entry has outlived its TTL."""
+        return time.time() >= self.stale_at
+
+
+class ResponseCache:
+    """Pickle-backed cache keyed by hashable tuples.
+
+    Expired entries are kept on disk so they can still be served when a fresh
+    ARM request fails (stale-if-error); they are overwritten on the next
+    successful request.
+    """
+
+    def __init__(self, cache_dir: str | Path, ttl: int = 60):
+        """Initialize response cache.
+
+        Args:
+            cache_dir: Directory holding the cache files. Created if missing.
+            ttl: Time to live of new entries in seconds.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+
+    def _path_for(self, key: tuple) -> Path:
+        """Get the cache file path for a key."""
+        digest = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{digest}.pkl"
+
+    def get(self, key: tuple) -> CacheEntry | None:
+        """Get a cache entry, including stale ones.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            CacheEntry or None if the key is not cached or unreadable.
+        """
+        path = self._path_for(key)
+        try:
+            with path.open("rb") as f:
+                # Entries are only ever written by this process' user
+                entry = pickle.load(f)  # noqa: S301
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable cache entry {path.name}: {e}")
+            return None
+        return entry if isinstance(entry, CacheEntry) else None
+
+    def set(self, key: tuple, value: Any) -> None:
+        """Store a value under a key.
+
+        Args:
+            key: Cache key.
+            value: Picklable value to store.
+        """
+        entry = CacheEntry(value=value, stale_at=time.time() + self.ttl)
+        path = self._path_for(key)
+        try:
+            # Write to a temporary file first so concurrent readers never see
+            # a partially written entry
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            Path(tmp_name).replace(path)
+        except Exception as e:
+            logger.warning(f"Could not write cache entry {path.name}: {e}")
+
+    def clear(self) -> None:
+        """Remove all cache entries."""
+        for path in self.cache_dir.glob("*.pkl"):
+            path.unlink(missing_ok=True)
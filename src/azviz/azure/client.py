@@ -2,47 +2,627 @@
 
 from __future__ import annotations
 
+import functools
 import logging
-from typing import Any
-
-from azure.core.exceptions import AzureError
-from azure.identity import (
-    AzureCliCredential,
-    ChainedTokenCredential,
-    DefaultAzureCredential,
-    ManagedIdentityCredential,
+import re
+import sys
+import threading
+import weakref
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+from urllib.parse import urlsplit
+
+from azure.core.exceptions import (
+    AzureError,
+    HttpResponseError,
+    ResourceNotFoundError,
 )
-from azure.mgmt.compute import ComputeManagementClient
-from azure.mgmt.network import NetworkManagementClient
-from azure.mgmt.network.models import TopologyParameters
-from azure.mgmt.resource import ResourceManagementClient
-from azure.mgmt.storage import StorageManagementClient
-from azure.mgmt.subscription import SubscriptionClient
 
+try:
+    # Optional (the "fast" extra); parses large raw ARM responses several
+    # times faster than the standard library
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads  # type: ignore[assignment]
+
+from ..core.filters import build_type_filter, is_type_selected
 from ..core.models import (
     AzureResource,
     DependencyType,
     NetworkTopology,
+    TopologyAssociation,
+    TopologyEntry,
 )
+from .cache import ResponseCache
+from .credential import CachedTokenCredential
+from .throttle import ReadQuotaThrottle
+
+# Azure SDK management packages are imported where they are first used:
+# each one eagerly loads hundreds of models, which dominates CLI start-up
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Self
+
+    from azure.core.pipeline.transport import RequestsTransport
+    from azure.identity import DefaultAzureCredential
+    from azure.mgmt.compute import ComputeManagementClient
+    from azure.mgmt.network import NetworkManagementClient
+    from azure.mgmt.resource import ResourceManagementClient
+    from azure.mgmt.resourcegraph import ResourceGraphClient
+    from azure.mgmt.storage import StorageManagementClient
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent ARM requests issued by a single fan-out
+_MAX_WORKERS = 16
+
+# Connections kept open to management.azure.com, shared by all SDK clients;
+# sized for nested fan-outs (resource groups x per-resource lookups)
+_HTTP_POOL_SIZE = 64
+
+# ARM $batch endpoint accepts at most 20 requests per call
+_ARM_BATCH_URL = "/batch?api-version=2020-06-01"
+_ARM_BATCH_SIZE = 20
+_COMPUTE_API_VERSION = "2023-03-01"
+
+_ARM_SCOPE = "https://management.azure.com/.default"
+
+# Rows requested per Resource Graph page; kept well below the 1000 row cap so
+# large subscriptions do not burn through the per-tenant query quota
+_RESOURCE_GRAPH_PAGE_SIZE = 300
+
+# Every subnet of every VNet in the subscription, one row per subnet. The
+# resourceGroup column is lowercased, so the group is parsed from the VNet id
+_SUBNETS_QUERY = (
+    "Resources"
+    " | where type =~ 'microsoft.network/virtualnetworks'"
+    " | mv-expand subnet = properties.subnets"
+    " | where isnotempty(subnet)"
+    " | project id, vnet = name, subnetName = tostring(subnet.name),"
+    " prefix = coalesce(tostring(subnet.properties.addressPrefix),"
+    " tostring(subnet.properties.addressPrefixes[0])),"
+    " loc = location"
+)
+
+# (location, access note, tenant note) and tags of placeholders for external
+# resources that could not be fetched, by whether they look cross-tenant
+_PLACEHOLDER_NOTES = {
+    True: (
+        "external-tenant",
+        "External resource (outside tenant)",
+        "This resource is in a different Azure tenant and cannot be accessed",
+    ),
+    False: (
+        "external",
+        "External resource (limited access)",
+        "This resource could not be accessed due to permissions",
+    ),
+}
+_PLACEHOLDER_TAGS = {
+    is_cross_tenant: {
+        "external_dependency": "true",
+        "cross_tenant": str(is_cross_tenant).lower(),
+        "access_status": "placeholder",
+    }
+    for is_cross_tenant in (True, False)
+}
+
+# API version used to read OpenShift cluster profiles
+_OPENSHIFT_API_VERSION = "2023-11-22"
+
+# API version used to read private DNS zone virtual network links
+_PRIVATE_DNS_API_VERSION = "2020-06-01"
+
+# External resource IDs looked up per Resource Graph query; keeps the KQL
+# text well below the service's query size limit
+_RESOURCE_GRAPH_ID_BATCH = 100
+
+# /subscriptions/{sub}/resourceGroups/{rg}/providers/{ns}/{type}/{name}
+# optionally followed by /{subtype}/{subname}
+_ARM_ID_RE = re.compile(
+    r"^/subscriptions/(?P<sub>[^/]+)/resourceGroups/(?P<rg>[^/]+)"
+    r"/providers/(?P<ns>[^/]+)/(?P<type>[^/]+)/(?P<name>[^/]+)"
+    r"(?:/(?P<subtype>[^/]+)/(?P<subname>[^/]+))?",
+    re.IGNORECASE,
+)
+
+_SUBSCRIPTION_ID_RE = re.compile(
+    r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$",
+    re.IGNORECASE,
+)
+
+# (subscription ID, display name) by lower-case subscription ID, per underlying
+# credential: clients sharing a credential resolve a known ID without listing
+# again, while a client with other credentials still checks its own access
+_subscription_names_by_credential: weakref.WeakKeyDictionary[
+    Any, dict[str, tuple[str, str]]
+] = weakref.WeakKeyDictionary()
+
+# Retry settings for azure-core's RetryPolicy, applied once per pipeline so
+# throttled (429) and transient (408/5xx) responses are retried honoring
+# Retry-After; callers do not add their own retry loops
+_RETRY_OPTIONS = {
+    "retry_total": 6,
+    "retry_backoff_factor": 1.0,
+    "retry_backoff_max": 60,
+}
+
+# Lookups failing with these statuses (403 AuthorizationFailed, 404 not
+# found) fail the same way when repeated; throttling and 5xx errors do not
+_DEFINITIVE_FAILURE_STATUS_CODES = frozenset({403, 404})
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+# Resource types whose provider namespace does not reflect their logical category
+_SPECIAL_CATEGORY_MAPPINGS = {
+    "microsoft.redhatopenshift/openshiftclusters": "Container",
+    "microsoft.containerservice/managedclusters": "Container",
+    "microsoft.kubernetes/connectedclusters": "Container",
+}
+
+
+# NetworkTopology list receiving each top-level network resource kind
+_TOPOLOGY_BUCKETS = {
+    "virtualnetworks": "virtual_networks",
+    "networkinterfaces": "network_interfaces",
+    "publicipaddresses": "public_ips",
+    "loadbalancers": "load_balancers",
+    "networksecuritygroups": "network_security_groups",
+}
+
+
+@functools.lru_cache(maxsize=512)
+def _extract_category(resource_type: str) -> str:
+    """Extract category from Azure resource type.
+
+    Results are cached since a subscription only contains a few dozen
+    distinct resource types.
+
+    Args:
+        resource_type: Full Azure resource type (e.g., Microsoft.Compute/virtualMachines).
+
+    Returns:
+        Resource category (e.g., Compute).
+    """
+    if not resource_type:
+        return "Unknown"
+
+    special_category = _SPECIAL_CATEGORY_MAPPINGS.get(resource_type.lower())
+    if special_category:
+        return special_category
+
+    provider, separator, _ = resource_type.partition("/")
+    if separator:
+        return provider.replace("Microsoft.", "").title()
+    return "Unknown"
+
+
+def _is_definitive_failure(error: Exception) -> bool:
+    """Check whether a failed ARM lookup would fail again if repeated.
+
+    Args:
+        error: Exception raised by the lookup.
+
+    Returns:
+        True for not found and authorization failures, False for throttling,
+        transient server errors, timeouts and anything else.
+    """
+    if isinstance(error, ResourceNotFoundError):
+        return True
+    return (
+        isinstance(error, HttpResponseError)
+        and error.status_code in _DEFINITIVE_FAILURE_STATUS_CODES
+    )
+
+
+def _cached(fn: _F) -> _F:
+    """Serve an AzureClient method from the response cache when enabled.
+
+    Fresh entries are returned without calling ARM. If the ARM call fails, a
+    stale entry is returned instead of raising (stale-if-error).
+
+    Args:
+        fn: AzureClient method whose positional/keyword arguments form the key.
+
+    Returns:
+        Wrapped method.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(self: AzureClient, *args: Any, **kwargs: Any) -> Any:
+        cache = self._cache
+        if cache is None:
+            return fn(self, *args, **kwargs)
+
+        key = (self.subscription_id, fn.__name__, args, tuple(sorted(kwargs.items())))
+        entry = cache.get(key)
+        if entry is not None and not entry.is_stale:
+            logger.debug(f"Cache hit for {fn.__name__}{args}")
+            return entry.value
+
+        try:
+            value = fn(self, *args, **kwargs)
+        except AzureError as e:
+            if entry is None:
+                raise
+            logger.warning(
+                f"{fn.__name__} failed ({e}), serving stale cached response",
+            )
+            return entry.value
+
+        cache.set(key, value)
+        return value
+
+    return cast("_F", wrapper)
+
+
+def _build_azure_resource(
+    resource: Any,
+    resource_group_name: str,
+    subscription_id: str,
+) -> AzureResource:
+    """Convert a generic ARM resource from a listing into an AzureResource.
+
+    Args:
+        resource: GenericResourceExpanded returned by resources.list_by_resource_group.
+        resource_group_name: Name of the resource group (expected to be interned).
+        subscription_id: Subscription ID (expected to be interned).
+
+    Returns:
+        AzureResource without dependencies.
+    """
+    return AzureResource(
+        name=resource.name,
+        resource_type=sys.intern(resource.type),
+        category=_extract_category(resource.type),
+        location=sys.intern(resource.location or ""),
+        resource_group=resource_group_name,
+        subscription_id=subscription_id,
+        properties=resource.properties or {},
+        tags=resource.tags or {},
+        dependencies=[],
+    )
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_arm_id(resource_id: str) -> dict[str, str] | None:
+    """Split an ARM resource ID into its components.
+
+    Results are cached since the same VNet and subnet IDs are referenced by
+    many resources. Callers must not modify the returned dictionary.
+
+    Args:
+        resource_id: Azure resource ID.
+
+    Returns:
+        Dictionary with sub, rg, ns, type, name, subtype and subname keys
+        (subtype and subname are empty for top-level resources), or None if
+        the ID is not a provider resource ID.
+    """
+    match = _ARM_ID_RE.match(resource_id)
+    return match.groupdict(default="") if match else None
+
+
+def _subnet_names_from_id(subnet_id: str) -> tuple[str, str] | None:
+    """Get VNet and subnet names from a subnet resource ID.
+
+    Args:
+        subnet_id: Subnet resource ID.
+
+    Returns:
+        Tuple of (vnet_name, subnet_name), or None if the ID is not a subnet ID.
+    """
+    parsed = _parse_arm_id(subnet_id)
+    if (
+        parsed is None
+        or parsed["type"].lower() != "virtualnetworks"
+        or parsed["subtype"].lower() != "subnets"
+    ):
+        return None
+    return parsed["name"], parsed["subname"]
+
+
+def _host_label(uri: str) -> str:
+    """Get the first label of a URI's host name.
+
+    Args:
+        uri: URI such as https://account.blob.core.windows.net/.
+
+    Returns:
+        First host label ("account"), or an empty string if the URI has no host.
+    """
+    return uri.partition("//")[2].partition(".")[0]
+
+
+def _url_host(url: str) -> str | None:
+    """Get the host name of a URL, keeping its case.
+
+    Args:
+        url: URL such as https://api.cluster.eastus.aroapp.io:6443/, with or
+            without a scheme.
+
+    Returns:
+        Host name without user info or port, or None if the URL has no host.
+    """
+    netloc = urlsplit(url if "://" in url else f"https://{url}").netloc
+    return netloc.rpartition("@")[2].partition(":")[0] or None
+
+
+def _name_pattern(*terms: str) -> re.Pattern[str]:
+    """Compile a pattern matching names that contain any of the terms.
+
+    Args:
+        *terms: Literal substrings to look for.
+
+    Returns:
+        Compiled alternation of the escaped terms.
+    """
+    return re.compile("|".join(re.escape(term) for term in terms))
+
+
+def _select_by_types(
+    resources: Iterable[AzureResource],
+    *resource_types: str,
+) -> list[list[AzureResource]]:
+    """Split resources of several types into per-type lists in one pass.
+
+    Args:
+        resources: Resources to scan.
+        *resource_types: Resource types to collect.
+
+    Returns:
+        One list per requested type, in argument order, each keeping the
+        order of resources.
+    """
+    buckets: dict[str, list[AzureResource]] = {t: [] for t in resource_types}
+    for r in resources:
+        bucket = buckets.get(r.resource_type)
+        if bucket is not None:
+            bucket.append(r)
+    return [buckets[t] for t in resource_types]
+
+
+def _create_transport() -> RequestsTransport:
+    """Create the HTTP transport shared by all management clients.
+
+    Each SDK client otherwise opens its own session with a 10 connection
+    pool, so concurrent discovery keeps tearing down and re-opening TLS
+    connections to the same host.
+
+    Returns:
+        Requests transport backed by one pooled session.
+    """
+    import requests
+    from azure.core.pipeline.transport import RequestsTransport
+
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=_HTTP_POOL_SIZE,
+        pool_maxsize=_HTTP_POOL_SIZE,
+    )
+    session.mount("https://", adapter)
+    # The session outlives any single client, so clients must not close it
+    return RequestsTransport(session=session, session_owner=False)
+
+
+def _index_by_name(
+    resources: Iterable[AzureResource],
+    resource_type: str,
+) -> dict[str, AzureResource]:
+    """Index resources of one type by name.
+
+    Args:
+        resources: Resources to index.
+        resource_type: Resource type to keep.
+
+    Returns:
+        Dictionary mapping names to resources. The first resource wins when
+        names repeat, like a linear search would.
+    """
+    index: dict[str, AzureResource] = {}
+    for r in resources:
+        if r.resource_type == resource_type:
+            index.setdefault(r.name, r)
+    return index
+
 
 class AzureClient:
     """Azure Management API client for resource discovery."""
 
+    # Resource types enriched with a per-resource detail lookup during listing
+    _DETAIL_RESOURCE_TYPES = frozenset(
+        {
+            "Microsoft.Compute/virtualMachines",
+            "Microsoft.Compute/disks",
+            "Microsoft.Storage/storageAccounts",
+            "Microsoft.Network/networkInterfaces",
+            "Microsoft.Network/publicIPAddresses",
+            "Microsoft.Network/virtualNetworks",
+        },
+    )
+
+    # Resource types whose full model the discovery passes read for every
+    # resource of that type; fetched while the resource group is being listed
+    _PREFETCH_MODEL_TYPES = frozenset(
+        {
+            "microsoft.compute/virtualmachines",
+            "microsoft.compute/disks",
+            "microsoft.compute/sshpublickeys",
+            "microsoft.compute/virtualmachinescalesets",
+            "microsoft.network/networkinterfaces",
+            "microsoft.network/publicipaddresses",
+            "microsoft.network/privateendpoints",
+            "microsoft.network/privatelinkservices",
+            "microsoft.network/networksecuritygroups",
+            "microsoft.network/routetables",
+            "microsoft.network/applicationgateways",
+            "microsoft.storage/storageaccounts",
+        },
+    )
+
+    # Resource types whose list-by-resource-group call returns the same full
+    # model as get(); one paged list replaces a GET per resource
+    _LISTED_MODEL_TYPES = (
+        "Microsoft.Compute/virtualMachines",
+        "Microsoft.Network/networkSecurityGroups",
+    )
+
+    # Resource types that can have user-assigned managed identities
+    _IDENTITY_USER_TYPES = frozenset(
+        {
+            "Microsoft.Compute/virtualMachines",
+            "Microsoft.Compute/virtualMachineScaleSets",
+            "Microsoft.ContainerService/managedClusters",
+            "Microsoft.RedHatOpenShift/OpenShiftClusters",
+            "Microsoft.Web/sites",
+            "Microsoft.Storage/storageAccounts",
+        },
+    )
+
+    # Method filling in display properties, keyed by resource type
+    _ENHANCED_PROPERTY_HANDLERS: dict[str, str] = {
+        "Microsoft.Compute/disks": "_extract_disk_properties",
+        "Microsoft.Storage/storageAccounts": "_extract_storage_account_properties",
+        "Microsoft.Network/publicIPAddresses": "_extract_public_ip_properties",
+    }
+
+    # (client attribute, operations attribute, method, keyword arguments) used
+    # to fetch the full SDK model of a resource, keyed by lowercase resource type.
+    # VMs are fetched without the instance view: discovery only reads the
+    # hardware, storage, OS and network profiles, and power states come from
+    # the listing or the $batch instance view requests.
+    _MODEL_GETTERS: dict[str, tuple[str, str, str, dict[str, str]]] = {
+        "microsoft.compute/virtualmachines": (
+            "compute_client",
+            "virtual_machines",
+            "get",
+            {},
+        ),
+        "microsoft.compute/disks": ("compute_client", "disks", "get", {}),
+        "microsoft.compute/sshpublickeys": (
+            "compute_client",
+            "ssh_public_keys",
+            "get",
+            {},
+        ),
+        "microsoft.compute/virtualmachinescalesets": (
+            "compute_client",
+            "virtual_machine_scale_sets",
+            "get",
+            {},
+        ),
+        "microsoft.network/networkinterfaces": (
+            "network_client",
+            "network_interfaces",
+            "get",
+            {},
+        ),
+        "microsoft.network/publicipaddresses": (
+            "network_client",
+            "public_ip_addresses",
+            "get",
+            {},
+        ),
+        "microsoft.network/privateendpoints": (
+            "network_client",
+            "private_endpoints",
+            "get",
+            {},
+        ),
+        "microsoft.network/privatelinkservices": (
+            "network_client",
+            "private_link_services",
+            "get",
+            {},
+        ),
+        "microsoft.network/virtualnetworks": (
+            "network_client",
+            "virtual_networks",
+            "get",
+            {},
+        ),
+        "microsoft.network/networksecuritygroups": (
+            "network_client",
+            "network_security_groups",
+            "get",
+            {},
+        ),
+        "microsoft.network/routetables": ("network_client", "route_tables", "get", {}),
+        "microsoft.network/applicationgateways": (
+            "network_client",
+            "application_gateways",
+            "get",
+            {},
+        ),
+        "microsoft.storage/storageaccounts": (
+            "storage_client",
+            "storage_accounts",
+            "get_properties",
+            {},
+        ),
+    }
+
     def __init__(
         self,
         subscription_identifier: str | None = None,
         credential: Any | None = None,
+        cache_dir: str | Path | None = None,
+        cache_ttl: int = 60,
     ):
         """Initialize Azure client.
 
         Args:
             subscription_identifier: Azure subscription ID or name. If None, will use first available.
             credential: Azure credential object. If None, will use DefaultAzureCredential.
+            cache_dir: Directory for caching discovery responses on disk. If None, caching is disabled.
+            cache_ttl: Seconds a cached discovery response stays fresh.
         """
-        self.credential = credential or self._get_default_credential()
+        # A credential passed in by the caller may be shared with other
+        # clients, so close() only closes the one created here
+        self._owns_credential = credential is None
+
+        # All management clients share one token cache instead of each asking
+        # the credential chain for its own token
+        credential = credential or self._get_default_credential()
+        if not isinstance(credential, CachedTokenCredential):
+            credential = CachedTokenCredential(credential)
+        self.credential = credential
+        self._subscription_names = _subscription_names_by_credential.setdefault(
+            credential.credential,
+            {},
+        )
+        self._cache = ResponseCache(cache_dir, cache_ttl) if cache_dir else None
+
+        # Acquire the first ARM token in the background so the credential chain
+        # probe overlaps the remaining setup; subscription lookups wait for it
+        # so the chain is only probed once
+        self._token_prefetch = threading.Thread(
+            target=self._prefetch_token,
+            name="azviz-token-prefetch",
+            daemon=True,
+        )
+        self._token_prefetch.start()
+
+        from azure.mgmt.subscription import SubscriptionClient
+
+        # Options shared by every management client: one connection pool,
+        # pacing based on the remaining ARM read quota and retry settings
+        self._client_options: dict[str, Any] = {
+            "transport": _create_transport(),
+            "raw_response_hook": ReadQuotaThrottle(),
+            **_RETRY_OPTIONS,
+        }
+        self._subscription_client = SubscriptionClient(
+            self.credential,
+            **self._client_options,
+        )
+        self._network_watchers_by_location: dict[str, dict[str, str]] | None = None
+        self._subscription_subnets: list[dict[str, str]] | None = None
+        self._resource_models: dict[tuple[str, str, str], Future] = {}
+        self._external_models: dict[str, Future] = {}
+        self._resource_models_lock = threading.Lock()
 
         # Resolve subscription identifier to ID and name
         if not subscription_identifier:
@@ -52,42 +632,128 @@ class AzureClient:
             self.subscription_id, self.subscription_name = (
                 self._resolve_subscription_identifier(subscription_identifier)
             )
+        # Lowercased ID prefix shared by all resources of this subscription
+        self._own_sub_prefix = f"/subscriptions/{self.subscription_id}/".lower()
 
-        # Initialize management clients
-        self.resource_client = ResourceManagementClient(
+        logger.info(
+            f"Initialized Azure client for subscription: {self.subscription_name} ({self.subscription_id})",
+        )
+
+    def __enter__(self) -> Self:
+        """Enter a context that closes the client on exit."""
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        """Close the client when leaving the context."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the shared HTTP session and the credential created by the client.
+
+        The management clients do not own the shared transport, so its
+        pooled connections are only released here. A credential passed to
+        __init__ is left open for the caller.
+        """
+        self._client_options["transport"].session.close()
+        if self._owns_credential:
+            self.credential.close()
+
+    @functools.cached_property
+    def resource_client(self) -> ResourceManagementClient:
+        """Resource management client, created on first use."""
+        from azure.mgmt.resource import ResourceManagementClient
+
+        return ResourceManagementClient(
             credential=self.credential,
             subscription_id=self.subscription_id,
+            **self._client_options,
         )
-        self.network_client = NetworkManagementClient(
+
+    @functools.cached_property
+    def network_client(self) -> NetworkManagementClient:
+        """Network management client, created on first use."""
+        from azure.mgmt.network import NetworkManagementClient
+
+        return NetworkManagementClient(
             credential=self.credential,
             subscription_id=self.subscription_id,
+            **self._client_options,
         )
-        self.compute_client = ComputeManagementClient(
+
+    @functools.cached_property
+    def compute_client(self) -> ComputeManagementClient:
+        """Compute management client, created on first use."""
+        from azure.mgmt.compute import ComputeManagementClient
+
+        return ComputeManagementClient(
             credential=self.credential,
             subscription_id=self.subscription_id,
+            **self._client_options,
         )
-        self.storage_client = StorageManagementClient(
+
+    @functools.cached_property
+    def storage_client(self) -> StorageManagementClient:
+        """Storage management client, created on first use."""
+        from azure.mgmt.storage import StorageManagementClient
+
+        return StorageManagementClient(
             credential=self.credential,
             subscription_id=self.subscription_id,
+            **self._client_options,
         )
 
-        logger.info(
-            f"Initialized Azure client for subscription: {self.subscription_name} ({self.subscription_id})",
-        )
+    @functools.cached_property
+    def resource_graph_client(self) -> ResourceGraphClient | None:
+        """Resource Graph client, or None if azure-mgmt-resourcegraph is not installed."""
+        try:
+            from azure.mgmt.resourcegraph import ResourceGraphClient
+        except ImportError:
+            logger.debug("azure-mgmt-resourcegraph not installed, using ARM listings")
+            return None
 
-    def _get_default_credential(self) -> ChainedTokenCredential:
-        """Get default Azure credential chain."""
-        return ChainedTokenCredential(
-            AzureCliCredential(),
-            ManagedIdentityCredential(),
-            DefaultAzureCredential(),
+        return ResourceGraphClient(
+            credential=self.credential,
+            **self._client_options,
         )
 
+    def _get_default_credential(self) -> DefaultAzureCredential:
+        """Get default Azure credential chain.
+
+        DefaultAzureCredential already tries environment, managed identity and
+        Azure CLI credentials, so it is not wrapped in another chain.
+        """
+        from azure.identity import DefaultAzureCredential
+
+        return DefaultAzureCredential(exclude_interactive_browser_credential=True)
+
+    def _prefetch_token(self) -> None:
+        """Acquire an ARM access token so it is cached before the first request."""
+        try:
+            self.credential.get_token(_ARM_SCOPE)
+        except Exception as e:
+            # Surfaced again, with context, by the first real ARM call
+            logger.debug(f"Token prefetch failed: {e}")
+
+    def _list_subscriptions(self) -> list[Any]:
+        """List subscriptions visible to the credential and remember their names.
+
+        Returns:
+            List of subscription models.
+        """
+        self._token_prefetch.join()
+        subscriptions = list(self._subscription_client.subscriptions.list())
+        for sub in subscriptions:
+            if sub.subscription_id is not None and sub.display_name is not None:
+                self._subscription_names[sub.subscription_id.lower()] = (
+                    sub.subscription_id,
+                    sub.display_name,
+                )
+        return subscriptions
+
     def _get_subscription_info(self) -> tuple[str, str]:
         """Get first available subscription ID and name."""
         try:
-            subscription_client = SubscriptionClient(self.credential)
-            subscriptions = list(subscription_client.subscriptions.list())
+            subscriptions = self._list_subscriptions()
             if not subscriptions:
                 raise ValueError("No Azure subscriptions found")
             first_sub = subscriptions[0]
@@ -112,37 +778,41 @@ class AzureClient:
         Raises:
             ValueError: If subscription cannot be found or resolved.
         """
+        # Check if it's a valid subscription ID (UUID format)
+        is_subscription_id = bool(_SUBSCRIPTION_ID_RE.match(subscription_identifier))
+        if is_subscription_id:
+            known = self._subscription_names.get(subscription_identifier.lower())
+            if known is not None:
+                return known
+
         try:
-            subscription_client = SubscriptionClient(self.credential)
-            subscriptions = list(subscription_client.subscriptions.list())
+            if is_subscription_id:
+                # It's likely a subscription ID, get it directly instead of
+                # listing every subscription in the tenant
+                self._token_prefetch.join()
+                try:
+                    sub = self._subscription_client.subscriptions.get(
+                        subscription_identifier,
+                    )
+                except ResourceNotFoundError as e:
+                    raise ValueError(
+                        f"Subscription ID '{subscription_identifier}' not found",
+                    ) from e
+                if sub.subscription_id is None or sub.display_name is None:
+                    raise ValueError(
+                        f"Subscription display name is None for ID '{subscription_identifier}'"
+                    )
+                self._subscription_names[sub.subscription_id.lower()] = (
+                    sub.subscription_id,
+                    sub.display_name,
+                )
+                return sub.subscription_id, sub.display_name
+
+            subscriptions = self._list_subscriptions()
 
             if not subscriptions:
                 raise ValueError("No Azure subscriptions found")
 
-            # Check if it's a valid subscription ID (UUID format)
-            import re
-
-            uuid_pattern = re.compile(
-                r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$",
-                re.IGNORECASE,
-            )
-
-            if uuid_pattern.match(subscription_identifier):
-                # It's likely a subscription ID, try to get it directly
-                for sub in subscriptions:
-                    if (
-                        sub.subscription_id is not None
-                        and sub.subscription_id.lower()
-                        == subscription_identifier.lower()
-                    ):
-                        if sub.display_name is None:
-                            raise ValueError(
-                                f"Subscription display name is None for ID '{subscription_identifier}'"
-                            )
-                        return sub.subscription_id, sub.display_name
-                raise ValueError(
-                    f"Subscription ID '{subscription_identifier}' not found",
-                )
             # It's likely a subscription name, search by display name
             for sub in subscriptions:
                 if (
@@ -194,14 +864,16 @@ class AzureClient:
             True if authentication successful, False otherwise.
         """
         try:
-            # Test by listing resource groups
-            list(self.resource_client.resource_groups.list())
+            # Test by reading the first page of resource groups; one request
+            # is enough to prove the token and subscription access
+            next(iter(self.resource_client.resource_groups.list(top=1)), None)
             logger.info("Azure authentication test successful")
             return True
         except AzureError as e:
             logger.error(f"Azure authentication failed: {e}")
             return False
 
+    @_cached
     def get_resource_groups(self) -> list[dict[str, Any]]:
         """Get all resource groups in subscription.
 
@@ -224,97 +896,142 @@ class AzureClient:
             logger.error(f"Failed to get resource groups: {e}")
             raise
 
+    def _query_resource_graph(
+        self,
+        query: str,
+        *,
+        subscriptions: list[str] | None = None,
+    ) -> list[dict[str, Any]] | None:
+        """Run a KQL query against Azure Resource Graph.
+
+        Args:
+            query: KQL query text.
+            subscriptions: Subscriptions to query. Defaults to this client's
+                subscription.
+
+        Returns:
+            All result rows as dictionaries, or None if Resource Graph support
+            is not installed.
+        """
+        client = self.resource_graph_client
+        if client is None:
+            return None
+
+        from azure.mgmt.resourcegraph.models import QueryRequest, QueryRequestOptions
+
+        rows: list[dict[str, Any]] = []
+        skip_token = None
+        while True:
+            response = client.resources(
+                QueryRequest(
+                    subscriptions=subscriptions or [self.subscription_id],
+                    query=query,
+                    options=QueryRequestOptions(
+                        top=_RESOURCE_GRAPH_PAGE_SIZE,
+                        skip_token=skip_token,
+                        result_format="objectArray",
+                    ),
+                ),
+            )
+            rows.extend(cast("list[dict[str, Any]]", response.data))
+            skip_token = response.skip_token
+            if not skip_token:
+                return rows
+
+    def get_resources_in_groups(
+        self,
+        resource_group_names: list[str],
+        show_power_state: bool = True,
+        include_types: Iterable[str] | None = None,
+        exclude_types: Iterable[str] | None = None,
+    ) -> dict[str, list[AzureResource]]:
+        """Get all resources in several resource groups concurrently.
+
+        Args:
+            resource_group_names: Names of the resource groups.
+            show_power_state: Whether to fetch VM power state information.
+            include_types: Resource types to keep (supports wildcards). If None, keeps all.
+            exclude_types: Resource types to skip (supports wildcards).
+
+        Returns:
+            Dictionary mapping each resource group name to its resources, in the
+            order the names were given.
+        """
+        if not resource_group_names:
+            return {}
+
+        # Sorted tuples keep the response cache key stable across runs
+        include = tuple(sorted(include_types)) if include_types else None
+        exclude = tuple(sorted(exclude_types)) if exclude_types else None
+
+        results: dict[str, list[AzureResource]] = {}
+        max_workers = min(_MAX_WORKERS, len(resource_group_names))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self.get_resources_in_group,
+                    rg_name,
+                    show_power_state,
+                    include,
+                    exclude,
+                ): rg_name
+                for rg_name in resource_group_names
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+
+        return {rg_name: results[rg_name] for rg_name in resource_group_names}
+
+    @_cached
     def get_resources_in_group(
         self,
         resource_group_name: str,
         show_power_state: bool = True,
+        include_types: Iterable[str] | None = None,
+        exclude_types: Iterable[str] | None = None,
     ) -> list[AzureResource]:
         """Get all resources in a resource group.
 
         Args:
             resource_group_name: Name of the resource group.
             show_power_state: Whether to fetch VM power state information.
+            include_types: Resource types to keep (supports wildcards). If None, keeps all.
+            exclude_types: Resource types to skip (supports wildcards).
 
         Returns:
             List of AzureResource objects.
         """
         try:
-            resources = []
-            for resource in self.resource_client.resources.list_by_resource_group(
-                resource_group_name
-            ):
-                # Get additional properties for compute resources
-                properties = resource.properties or {}
-
-                # Enhance VM properties
-                if (
-                    show_power_state
-                    and resource.type == "Microsoft.Compute/virtualMachines"
+            # List VMs (with their instance views for power states) and NSGs
+            # before the resources: each paged call fills the model cache, so
+            # the model warm-up and discovery passes need no per-resource GET
+            power_states: dict[str, str] = {}
+            for resource_type in self._LISTED_MODEL_TYPES:
+                if not is_type_selected(resource_type, include_types, exclude_types):
+                    continue
+                if show_power_state and resource_type == (
+                    "Microsoft.Compute/virtualMachines"
                 ):
-                    vm_power_state = self._get_vm_power_state(
-                        resource_group_name, resource.name
-                    )
-                    if vm_power_state:
-                        properties["power_state"] = vm_power_state
-
-                    # Get detailed VM properties
-                    vm_details = self._get_vm_details(
-                        resource_group_name, resource.name
-                    )
-                    if vm_details:
-                        properties.update(vm_details)
-
-                # Enhance disk properties
-                elif resource.type == "Microsoft.Compute/disks":
-                    disk_details = self._get_disk_details(
-                        resource_group_name, resource.name
-                    )
-                    if disk_details:
-                        properties.update(disk_details)
-
-                # Enhance storage account properties
-                elif resource.type == "Microsoft.Storage/storageAccounts":
-                    storage_details = self._get_storage_details(
-                        resource_group_name, resource.name
-                    )
-                    if storage_details:
-                        properties.update(storage_details)
-
-                # Enhance network interface properties
-                elif resource.type == "Microsoft.Network/networkInterfaces":
-                    nic_details = self._get_nic_details(
-                        resource_group_name, resource.name
-                    )
-                    if nic_details:
-                        properties.update(nic_details)
-
-                # Enhance public IP properties
-                elif resource.type == "Microsoft.Network/publicIPAddresses":
-                    pip_details = self._get_public_ip_details(
-                        resource_group_name, resource.name
-                    )
-                    if pip_details:
-                        properties.update(pip_details)
+                    power_states = self._list_vm_power_states(resource_group_name)
+                else:
+                    self._list_resource_models(resource_group_name, resource_type)
+
+            resources = list(
+                self.iter_resources_in_group(
+                    resource_group_name,
+                    show_power_state,
+                    include_types,
+                    exclude_types,
+                    prefetch_models=True,
+                ),
+            )
 
-                # Enhance virtual network properties
-                elif resource.type == "Microsoft.Network/virtualNetworks":
-                    vnet_details = self._get_vnet_details(
-                        resource_group_name, resource.name
-                    )
-                    if vnet_details:
-                        properties.update(vnet_details)
-                azure_resource = AzureResource(
-                    name=resource.name,
-                    resource_type=resource.type,
-                    category=self._extract_category(resource.type),
-                    location=resource.location,
-                    resource_group=resource_group_name,
-                    subscription_id=self.subscription_id,
-                    properties=properties,
-                    tags=resource.tags or {},
-                    dependencies=[],
+            if show_power_state:
+                self._attach_vm_power_states(
+                    resource_group_name,
+                    resources,
+                    power_states,
                 )
-                resources.append(azure_resource)
 
             # Extract detailed properties for enhanced features
             self._extract_enhanced_properties(resources)
@@ -389,147 +1106,596 @@ class AzureClient:
             )
             raise
 
+    def iter_resources_in_group(
+        self,
+        resource_group_name: str,
+        show_power_state: bool = True,
+        include_types: Iterable[str] | None = None,
+        exclude_types: Iterable[str] | None = None,
+        prefetch_models: bool = False,
+    ) -> Iterator[AzureResource]:
+        """Stream resources in a resource group as ARM pages arrive.
+
+        Per-resource details (SKU, addressing, OS) are fetched on a background
+        pool while listing continues. Resources are yielded in listing order
+        once their details are merged. VM power state and relationship
+        discovery are not included; use get_resources_in_group for those.
+
+        Include types without wildcards are filtered by ARM ($filter), so
+        other resources are never transferred. Remaining patterns are applied
+        before any per-resource work is done.
+
+        Args:
+            resource_group_name: Name of the resource group.
+            show_power_state: Whether to fetch VM details.
+            include_types: Resource types to keep (supports wildcards). If None, keeps all.
+            exclude_types: Resource types to skip (supports wildcards).
+            prefetch_models: Whether to also fetch the SDK models used by
+                relationship discovery while listing continues. The iterator
+                then finishes only once those fetches are done.
+
+        Yields:
+            AzureResource objects.
+        """
+        # Share one string object per repeated value across all resources
+        subscription_id = sys.intern(self.subscription_id)
+        resource_group_name = sys.intern(resource_group_name)
+
+        include_types = list(include_types or ())
+        exclude_types = list(exclude_types or ())
+
+        pending: deque[tuple[AzureResource, Future | None]] = deque()
+        with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+            for resource in self.resource_client.resources.list_by_resource_group(
+                resource_group_name,
+                filter=build_type_filter(include_types),
+            ):
+                if not is_type_selected(resource.type, include_types, exclude_types):
+                    continue
+
+                azure_resource = _build_azure_resource(
+                    resource,
+                    resource_group_name,
+                    subscription_id,
+                )
+
+                future = None
+                if resource.type in self._DETAIL_RESOURCE_TYPES and (
+                    show_power_state
+                    or resource.type != "Microsoft.Compute/virtualMachines"
+                ):
+                    future = executor.submit(
+                        self._get_resource_details,
+                        resource_group_name,
+                        resource.type,
+                        resource.name,
+                    )
+                pending.append((azure_resource, future))
+
+                # Warm the model cache for the discovery passes while later
+                # pages are still being listed
+                if (
+                    prefetch_models
+                    and resource.type.lower() in self._PREFETCH_MODEL_TYPES
+                ):
+                    executor.submit(
+                        self._warm_resource_model,
+                        resource.type,
+                        resource_group_name,
+                        resource.name,
+                    )
+
+                # Hand out every leading resource whose details are already in
+                while pending and (pending[0][1] is None or pending[0][1].done()):
+                    yield self._merge_resource_details(*pending.popleft())
+
+            while pending:
+                yield self._merge_resource_details(*pending.popleft())
+
+    def _merge_resource_details(
+        self,
+        resource: AzureResource,
+        future: Future | None,
+    ) -> AzureResource:
+        """Merge fetched details into a resource's properties.
+
+        Args:
+            resource: Resource to update.
+            future: Pending detail lookup, or None if none was needed.
+
+        Returns:
+            The updated resource.
+        """
+        if future is not None:
+            details = future.result()
+            if details:
+                resource.properties.update(details)
+        return resource
+
+    def _get_resource_details(
+        self,
+        resource_group_name: str,
+        resource_type: str,
+        resource_name: str,
+    ) -> dict[str, Any] | None:
+        """Get detailed properties for a single resource based on its type.
+
+        Args:
+            resource_group_name: Resource group name.
+            resource_type: Azure resource type.
+            resource_name: Resource name.
+
+        Returns:
+            Dictionary of resource details or None if unavailable.
+        """
+        if resource_type == "Microsoft.Compute/virtualMachines":
+            return self._get_vm_details(resource_group_name, resource_name)
+        if resource_type == "Microsoft.Compute/disks":
+            return self._get_disk_details(resource_group_name, resource_name)
+        if resource_type == "Microsoft.Storage/storageAccounts":
+            return self._get_storage_details(resource_group_name, resource_name)
+        if resource_type == "Microsoft.Network/networkInterfaces":
+            return self._get_nic_details(resource_group_name, resource_name)
+        if resource_type == "Microsoft.Network/publicIPAddresses":
+            return self._get_public_ip_details(resource_group_name, resource_name)
+        if resource_type == "Microsoft.Network/virtualNetworks":
+            return self._get_vnet_details(resource_group_name, resource_name)
+        return None
+
+    def _attach_vm_power_states(
+        self,
+        resource_group_name: str,
+        resources: list[AzureResource],
+        power_states: dict[str, str],
+    ) -> None:
+        """Fetch power states for all VMs in a group and store them in properties.
+
+        Args:
+            resource_group_name: Resource group name.
+            resources: Resources of the group.
+            power_states: Power states already known from _list_vm_power_states.
+        """
+        vms = [
+            r
+            for r in resources
+            if r.resource_type == "Microsoft.Compute/virtualMachines"
+        ]
+        if not vms:
+            return
+
+        # The VM list call covers every VM in the group; only VMs it missed
+        # (e.g. created since the listing) are looked up through $batch
+        power_states = dict(power_states)
+        missing = [vm.name for vm in vms if vm.name not in power_states]
+        if missing:
+            power_states.update(
+                self._get_vm_power_states_batch(resource_group_name, missing),
+            )
+
+        for vm in vms:
+            power_state = power_states.get(vm.name)
+            if power_state is None:
+                # Fall back to a direct lookup if neither call covered it
+                power_state = self._get_vm_power_state(resource_group_name, vm.name)
+            if power_state:
+                vm.properties["power_state"] = power_state
+
+    def _list_resource_models(
+        self,
+        resource_group_name: str,
+        resource_type: str,
+    ) -> None:
+        """Fill the model cache with all resources of a type in a resource group.
+
+        Args:
+            resource_group_name: Resource group name.
+            resource_type: Azure resource type (one of _LISTED_MODEL_TYPES).
+        """
+        client_attr, operations_attr, _, _ = self._MODEL_GETTERS[resource_type.lower()]
+        operations = getattr(getattr(self, client_attr), operations_attr)
+        try:
+            models = list(operations.list(resource_group_name=resource_group_name))
+        except AzureError as e:
+            logger.debug(
+                f"Could not list {resource_type} in group '{resource_group_name}': {e}",
+            )
+            return
+
+        for model in models:
+            if model.name:
+                self._store_resource_model(
+                    resource_type,
+                    resource_group_name,
+                    model.name,
+                    model,
+                )
+
+    def _list_vm_power_states(self, resource_group_name: str) -> dict[str, str]:
+        """Get power states of all VMs in a resource group with one list call.
+
+        The listed VM models are stored in the model cache as well.
+
+        Args:
+            resource_group_name: Resource group name.
+
+        Returns:
+            Dictionary mapping VM name to power state.
+        """
+        try:
+            vms = list(
+                self.compute_client.virtual_machines.list(
+                    resource_group_name=resource_group_name,
+                    expand="instanceView",
+                ),
+            )
+        except AzureError as e:
+            logger.debug(
+                f"Could not list VM power states for group '{resource_group_name}': {e}",
+            )
+            return {}
+
+        power_states: dict[str, str] = {}
+        for vm in vms:
+            if not vm.name:
+                continue
+            self._store_resource_model(
+                "Microsoft.Compute/virtualMachines",
+                resource_group_name,
+                vm.name,
+                vm,
+            )
+            statuses = vm.instance_view.statuses if vm.instance_view else None
+            for status in statuses or []:
+                if status.code and status.code.startswith("PowerState/"):
+                    power_states[vm.name] = status.code.split("/")[-1]
+                    break
+        return power_states
+
+    def _get_vm_power_states_batch(
+        self,
+        resource_group_name: str,
+        vm_names: list[str],
+    ) -> dict[str, str]:
+        """Get power states of several VMs through the ARM batch endpoint.
+
+        Args:
+            resource_group_name: Resource group name.
+            vm_names: Virtual machine names.
+
+        Returns:
+            Dictionary mapping VM name to power state for the VMs that reported one.
+        """
+        urls = [
+            f"/subscriptions/{self.subscription_id}/resourceGroups/{resource_group_name}"
+            f"/providers/Microsoft.Compute/virtualMachines/{vm_name}/instanceView"
+            f"?api-version={_COMPUTE_API_VERSION}"
+            for vm_name in vm_names
+        ]
+
+        power_states = {}
+        for vm_name, instance_view in zip(vm_names, self._arm_batch(urls), strict=True):
+            if not instance_view:
+                continue
+            for status in instance_view.get("statuses") or []:
+                code = status.get("code") or ""
+                if code.startswith("PowerState/"):
+                    power_states[vm_name] = code.split("/")[-1]
+                    break
+        return power_states
+
+    def _arm_batch(self, urls: list[str]) -> list[dict[str, Any] | None]:
+        """Issue GET requests through the ARM batch endpoint.
+
+        Args:
+            urls: Relative ARM URLs including the api-version query parameter.
+
+        Returns:
+            Response bodies in the order of the URLs, None for failed requests.
+        """
+        from azure.core.rest import HttpRequest
+
+        results: list[dict[str, Any] | None] = [None] * len(urls)
+        for offset in range(0, len(urls), _ARM_BATCH_SIZE):
+            chunk = urls[offset : offset + _ARM_BATCH_SIZE]
+            body = {
+                "requests": [
+                    {"httpMethod": "GET", "name": str(offset + i), "url": url}
+                    for i, url in enumerate(chunk)
+                ],
+            }
+            try:
+                response = self.compute_client.send_request(
+                    HttpRequest("POST", _ARM_BATCH_URL, json=body),
+                )
+                response.raise_for_status()
+                for item in _json_loads(response.content).get("responses", []):
+                    if item.get("httpStatusCode") == 200:
+                        results[int(item["name"])] = item.get("content")
+            except Exception as e:
+                logger.warning(f"ARM batch request failed: {e}")
+        return results
+
+    def _warm_resource_model(
+        self,
+        resource_type: str,
+        resource_group_name: str,
+        resource_name: str,
+    ) -> None:
+        """Fetch a resource's SDK model into the per-client memo.
+
+        Failures are ignored here; the discovery pass that needs the model
+        retries the lookup and reports the error.
+
+        Args:
+            resource_type: Azure resource type (a key of _MODEL_GETTERS).
+            resource_group_name: Resource group name.
+            resource_name: Resource name.
+        """
+        try:
+            self._get_resource_model(resource_type, resource_group_name, resource_name)
+        except Exception as e:
+            logger.debug(f"Model prefetch failed for '{resource_name}': {e}")
+
+    def _store_resource_model(
+        self,
+        resource_type: str,
+        resource_group_name: str,
+        resource_name: str,
+        model: Any,
+    ) -> None:
+        """Add a model obtained from a list call to the model cache.
+
+        Args:
+            resource_type: Azure resource type (a key of _MODEL_GETTERS).
+            resource_group_name: Resource group name.
+            resource_name: Resource name.
+            model: SDK model of the resource.
+        """
+        key = (
+            resource_type.lower(),
+            resource_group_name.lower(),
+            resource_name.lower(),
+        )
+        future: Future = Future()
+        future.set_result(model)
+        with self._resource_models_lock:
+            # A lookup already in flight or done keeps its own result
+            self._resource_models.setdefault(key, future)
+
+    def _get_resource_model(
+        self,
+        resource_type: str,
+        resource_group_name: str,
+        resource_name: str,
+    ) -> Any:
+        """Get the full SDK model of a resource, fetching it at most once.
+
+        Several discovery passes need the same VM, NIC or VNet. The first
+        caller issues the GET; concurrent and later callers share its result.
+        Failed lookups are not remembered, so they are retried next time.
+
+        Args:
+            resource_type: Azure resource type (a key of _MODEL_GETTERS).
+            resource_group_name: Resource group name.
+            resource_name: Resource name.
+
+        Returns:
+            SDK model returned by the operations group's get().
+
+        Raises:
+            AzureError: If the resource cannot be fetched.
+        """
+        key = (
+            resource_type.lower(),
+            resource_group_name.lower(),
+            resource_name.lower(),
+        )
+        client_name, operations_name, method_name, get_kwargs = self._MODEL_GETTERS[
+            key[0]
+        ]
+        operations = getattr(getattr(self, client_name), operations_name)
+        return self._fetch_once(
+            self._resource_models,
+            key,
+            lambda: getattr(operations, method_name)(
+                resource_group_name,
+                resource_name,
+                **get_kwargs,
+            ),
+        )
+
+    def _fetch_once(
+        self,
+        memo: dict[Any, Future],
+        key: Any,
+        fetch: Callable[[], Any],
+        *,
+        remember_failure: Callable[[Exception], bool] | None = None,
+    ) -> Any:
+        """Run a fetch at most once per key and share its outcome.
+
+        The first caller for a key runs the fetch; concurrent and later
+        callers wait for and share its result.
+
+        Args:
+            memo: Dictionary of futures to use, guarded by _resource_models_lock.
+            key: Key identifying the fetched object.
+            fetch: Function performing the fetch.
+            remember_failure: Predicate selecting failures that later callers
+                get instead of fetching again. If None, every failure is
+                retried by the next caller.
+
+        Returns:
+            Result of the fetch.
+
+        Raises:
+            Exception: Whatever the fetch raised.
+        """
+        with self._resource_models_lock:
+            future = memo.get(key)
+            is_owner = future is None
+            if future is None:
+                future = Future()
+                memo[key] = future
+
+        if is_owner:
+            try:
+                future.set_result(fetch())
+            except Exception as e:
+                future.set_exception(e)
+                if remember_failure is None or not remember_failure(e):
+                    with self._resource_models_lock:
+                        memo.pop(key, None)
+
+        return future.result()
+
     def _extract_enhanced_properties(self, resources: list[AzureResource]) -> None:
         """Extract detailed properties for enhanced features (VMs, disks, storage, network).
 
+        Resources are dispatched to the handler for their type in a single
+        pass; handlers only update their own resource, so they run
+        concurrently.
+
         Args:
             resources: List of Azure resources to analyze.
         """
+        work = [
+            (getattr(self, handler_name), r)
+            for r in resources
+            if (handler_name := self._ENHANCED_PROPERTY_HANDLERS.get(r.resource_type))
+        ]
+        if not work:
+            return
+
         try:
-            # Extract properties for managed disks
-            disks = [
-                r for r in resources if r.resource_type == "Microsoft.Compute/disks"
-            ]
+            max_workers = min(_MAX_WORKERS, len(work))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(handler, r) for handler, r in work]
+                for future in futures:
+                    future.result()
+        except AzureError as e:
+            logger.warning(f"Failed to extract enhanced properties: {e}")
 
-            for disk in disks:
-                try:
-                    disk_details = self.compute_client.disks.get(
-                        disk.resource_group,
-                        disk.name,
-                    )
+    def _extract_disk_properties(self, disk: AzureResource) -> None:
+        """Extract managed disk properties.
 
-                    # Extract disk properties
-                    if disk_details.sku and disk_details.sku.name:
-                        disk.properties["sku_name"] = disk_details.sku.name
+        Args:
+            disk: Managed disk resource to update.
+        """
+        try:
+            disk_details = self._get_resource_model(
+                "Microsoft.Compute/disks",
+                disk.resource_group,
+                disk.name,
+            )
 
-                    if disk_details.disk_size_gb:
-                        disk.properties["disk_size_gb"] = disk_details.disk_size_gb
+            # Extract disk properties
+            if disk_details.sku and disk_details.sku.name:
+                disk.properties["sku_name"] = disk_details.sku.name
 
-                    if disk_details.disk_state:
-                        disk.properties["disk_state"] = disk_details.disk_state
+            if disk_details.disk_size_gb:
+                disk.properties["disk_size_gb"] = disk_details.disk_size_gb
 
-                    if disk_details.os_type:
-                        disk.properties["os_type"] = disk_details.os_type
+            if disk_details.disk_state:
+                disk.properties["disk_state"] = disk_details.disk_state
 
-                    if (
-                        disk_details.creation_data
-                        and disk_details.creation_data.create_option
-                    ):
-                        disk.properties["create_option"] = (
-                            disk_details.creation_data.create_option
-                        )
+            if disk_details.os_type:
+                disk.properties["os_type"] = disk_details.os_type
 
-                    logger.debug(
-                        f"Extracted disk properties for {disk.name}: "
-                        f"size={disk_details.disk_size_gb}GB, "
-                        f"sku={disk_details.sku.name if disk_details.sku else 'unknown'}, "
-                        f"state={disk_details.disk_state}"
-                    )
+            if disk_details.creation_data and disk_details.creation_data.create_option:
+                disk.properties["create_option"] = (
+                    disk_details.creation_data.create_option
+                )
 
-                except AzureError as e:
-                    logger.debug(f"Could not get details for disk '{disk.name}': {e}")
+            logger.debug(
+                f"Extracted disk properties for {disk.name}: "
+                f"size={disk_details.disk_size_gb}GB, "
+                f"sku={disk_details.sku.name if disk_details.sku else 'unknown'}, "
+                f"state={disk_details.disk_state}"
+            )
 
-            # Extract properties for storage accounts
-            storage_accounts = [
-                r
-                for r in resources
-                if r.resource_type == "Microsoft.Storage/storageAccounts"
-            ]
+        except AzureError as e:
+            logger.debug(f"Could not get details for disk '{disk.name}': {e}")
 
-            for storage_account in storage_accounts:
-                try:
-                    storage_details = (
-                        self.storage_client.storage_accounts.get_properties(
-                            storage_account.resource_group,
-                            storage_account.name,
-                        )
-                    )
+    def _extract_storage_account_properties(
+        self,
+        storage_account: AzureResource,
+    ) -> None:
+        """Extract storage account properties.
 
-                    # Extract storage account properties
-                    if storage_details.sku and storage_details.sku.name:
-                        storage_account.properties["sku_name"] = (
-                            storage_details.sku.name
-                        )
+        Args:
+            storage_account: Storage account resource to update.
+        """
+        try:
+            storage_details = self._get_resource_model(
+                "Microsoft.Storage/storageAccounts",
+                storage_account.resource_group,
+                storage_account.name,
+            )
 
-                    if storage_details.sku and storage_details.sku.tier:
-                        storage_account.properties["sku_tier"] = (
-                            storage_details.sku.tier
-                        )
+            # Extract storage account properties
+            if storage_details.sku and storage_details.sku.name:
+                storage_account.properties["sku_name"] = storage_details.sku.name
 
-                    if storage_details.kind:
-                        storage_account.properties["kind"] = storage_details.kind
+            if storage_details.sku and storage_details.sku.tier:
+                storage_account.properties["sku_tier"] = storage_details.sku.tier
 
-                    if storage_details.access_tier:
-                        storage_account.properties["access_tier"] = (
-                            storage_details.access_tier
-                        )
+            if storage_details.kind:
+                storage_account.properties["kind"] = storage_details.kind
 
-                    if storage_details.enable_https_traffic_only is not None:
-                        storage_account.properties["https_only"] = (
-                            storage_details.enable_https_traffic_only
-                        )
+            if storage_details.access_tier:
+                storage_account.properties["access_tier"] = storage_details.access_tier
 
-                    logger.debug(
-                        f"Extracted storage account properties for {storage_account.name}: "
-                        f"sku={storage_details.sku.name if storage_details.sku else 'unknown'}, "
-                        f"kind={storage_details.kind}, "
-                        f"tier={storage_details.access_tier}"
-                    )
+            if storage_details.enable_https_traffic_only is not None:
+                storage_account.properties["https_only"] = (
+                    storage_details.enable_https_traffic_only
+                )
 
-                except AzureError as e:
-                    logger.debug(
-                        f"Could not get details for storage account '{storage_account.name}': {e}"
-                    )
+            logger.debug(
+                f"Extracted storage account properties for {storage_account.name}: "
+                f"sku={storage_details.sku.name if storage_details.sku else 'unknown'}, "
+                f"kind={storage_details.kind}, "
+                f"tier={storage_details.access_tier}"
+            )
 
-            # Extract properties for public IP addresses
-            public_ips = [
-                r
-                for r in resources
-                if r.resource_type == "Microsoft.Network/publicIPAddresses"
-            ]
+        except AzureError as e:
+            logger.debug(
+                f"Could not get details for storage account '{storage_account.name}': {e}"
+            )
 
-            for public_ip in public_ips:
-                try:
-                    pip_details = self.network_client.public_ip_addresses.get(
-                        public_ip.resource_group,
-                        public_ip.name,
-                    )
+    def _extract_public_ip_properties(self, public_ip: AzureResource) -> None:
+        """Extract public IP address properties.
 
-                    # Extract public IP properties
-                    if pip_details.ip_address:
-                        public_ip.properties["ipAddress"] = pip_details.ip_address
+        Args:
+            public_ip: Public IP address resource to update.
+        """
+        try:
+            pip_details = self._get_resource_model(
+                "Microsoft.Network/publicIPAddresses",
+                public_ip.resource_group,
+                public_ip.name,
+            )
 
-                    if pip_details.public_ip_allocation_method:
-                        public_ip.properties["allocation_method"] = (
-                            pip_details.public_ip_allocation_method
-                        )
+            # Extract public IP properties
+            if pip_details.ip_address:
+                public_ip.properties["ipAddress"] = pip_details.ip_address
 
-                    if pip_details.sku and pip_details.sku.name:
-                        public_ip.properties["sku_name"] = pip_details.sku.name
+            if pip_details.public_ip_allocation_method:
+                public_ip.properties["allocation_method"] = (
+                    pip_details.public_ip_allocation_method
+                )
 
-                    logger.debug(
-                        f"Extracted public IP properties for {public_ip.name}: "
-                        f"ip={pip_details.ip_address}, "
-                        f"allocation={pip_details.public_ip_allocation_method}"
-                    )
+            if pip_details.sku and pip_details.sku.name:
+                public_ip.properties["sku_name"] = pip_details.sku.name
 
-                except AzureError as e:
-                    logger.debug(
-                        f"Could not get details for public IP '{public_ip.name}': {e}"
-                    )
+            logger.debug(
+                f"Extracted public IP properties for {public_ip.name}: "
+                f"ip={pip_details.ip_address}, "
+                f"allocation={pip_details.public_ip_allocation_method}"
+            )
 
         except AzureError as e:
-            logger.warning(f"Failed to extract enhanced properties: {e}")
+            logger.debug(f"Could not get details for public IP '{public_ip.name}': {e}")
 
     def _discover_vm_disk_relationships(self, resources: list[AzureResource]) -> None:
         """Discover VM-disk relationships and add dependencies.
@@ -538,12 +1704,8 @@ class AzureClient:
             resources: List of Azure resources to analyze.
         """
         # Find VMs and disks
-        vms = [
-            r
-            for r in resources
-            if r.resource_type == "Microsoft.Compute/virtualMachines"
-        ]
-        disks = [r for r in resources if r.resource_type == "Microsoft.Compute/disks"]
+        (vms,) = _select_by_types(resources, "Microsoft.Compute/virtualMachines")
+        disks = _index_by_name(resources, "Microsoft.Compute/disks")
 
         if not vms or not disks:
             return
@@ -552,10 +1714,10 @@ class AzureClient:
             # For each VM, get its disk attachments
             for vm in vms:
                 try:
-                    vm_details = self.compute_client.virtual_machines.get(
+                    vm_details = self._get_resource_model(
+                        "Microsoft.Compute/virtualMachines",
                         vm.resource_group,
                         vm.name,
-                        expand="instanceView",
                     )
 
                     # Extract VM size, OS type, and image information
@@ -585,8 +1747,8 @@ class AzureClient:
                             if image_ref.publisher:
                                 vm.properties["image_publisher"] = image_ref.publisher
 
-                    # Get attached disks from storage profile
-                    attached_disk_names = set()
+                    # Get attached disks from storage profile, OS disk first
+                    attached_disk_names: dict[str, None] = {}
 
                     # OS disk
                     if (
@@ -598,7 +1760,7 @@ class AzureClient:
                             disk_name = self._extract_resource_name_from_id(
                                 os_disk.managed_disk.id,
                             )
-                            attached_disk_names.add(disk_name)
+                            attached_disk_names[disk_name] = None
 
                     # Data disks
                     if (
@@ -610,11 +1772,12 @@ class AzureClient:
                                 disk_name = self._extract_resource_name_from_id(
                                     data_disk.managed_disk.id,
                                 )
-                                attached_disk_names.add(disk_name)
+                                attached_disk_names[disk_name] = None
 
                     # Add dependencies for attached disks
-                    for disk in disks:
-                        if disk.name in attached_disk_names:
+                    for disk_name in attached_disk_names:
+                        disk = disks.get(disk_name)
+                        if disk is not None:
                             vm.add_dependency(
                                 disk.name,
                                 DependencyType.EXPLICIT,
@@ -642,78 +1805,75 @@ class AzureClient:
             resources: List of Azure resources to analyze.
         """
         # Find VMs and SSH public keys
-        vms = [
-            r
-            for r in resources
-            if r.resource_type == "Microsoft.Compute/virtualMachines"
-        ]
-        ssh_keys = [
-            r for r in resources if r.resource_type == "Microsoft.Compute/sshPublicKeys"
-        ]
+        vms, ssh_keys = _select_by_types(
+            resources,
+            "Microsoft.Compute/virtualMachines",
+            "Microsoft.Compute/sshPublicKeys",
+        )
 
         if not vms or not ssh_keys:
             return
 
         try:
-            # For each SSH public key, find VMs that use it
+            # Index SSH key resources by their public key data, so each VM
+            # is fetched and matched once instead of once per SSH key
+            keys_by_data: dict[str, list[AzureResource]] = defaultdict(list)
             for ssh_key in ssh_keys:
                 try:
                     # Get SSH key details to extract the public key data
-                    ssh_key_details = self.compute_client.ssh_public_keys.get(
+                    ssh_key_details = self._get_resource_model(
+                        "Microsoft.Compute/sshPublicKeys",
                         ssh_key.resource_group,
                         ssh_key.name,
                     )
+                except Exception as e:
+                    logger.warning(
+                        f"Could not get SSH key details for '{ssh_key.name}': {e}",
+                    )
+                    continue
 
-                    if not ssh_key_details.public_key:
-                        continue
-
-                    # Get the public key data for comparison
-                    ssh_public_key_data = ssh_key_details.public_key.strip()
-
-                    # Check each VM to see if it uses this SSH key
-                    for vm in vms:
-                        try:
-                            vm_details = self.compute_client.virtual_machines.get(
-                                vm.resource_group,
-                                vm.name,
-                            )
+                if ssh_key_details.public_key:
+                    keys_by_data[ssh_key_details.public_key.strip()].append(ssh_key)
 
-                            # Check Linux configuration for SSH keys
-                            if (
-                                vm_details.os_profile
-                                and vm_details.os_profile.linux_configuration
-                                and vm_details.os_profile.linux_configuration.ssh
-                                and vm_details.os_profile.linux_configuration.ssh.public_keys
-                            ):
-                                for public_key_config in vm_details.os_profile.linux_configuration.ssh.public_keys:
-                                    if (
-                                        public_key_config.key_data
-                                        and public_key_config.key_data.strip()
-                                        == ssh_public_key_data
-                                    ):
-                                        # VM uses this SSH key - create dependency
-                                        vm.add_dependency(
-                                            ssh_key.name,
-                                            DependencyType.EXPLICIT,
-                                            "Azure API - SSH key configuration",
-                                        )
-                                        logger.debug(
-                                            f"Added SSH key dependency: {vm.name} -> {ssh_key.name}",
-                                        )
-                                        break
-
-                        except Exception as e:
-                            logger.warning(
-                                f"Could not get VM details for SSH key analysis '{vm.name}': {e}",
-                            )
-                            continue
+            if not keys_by_data:
+                return
 
+            # Check each VM's Linux configuration for known SSH keys
+            for vm in vms:
+                try:
+                    vm_details = self._get_resource_model(
+                        "Microsoft.Compute/virtualMachines",
+                        vm.resource_group,
+                        vm.name,
+                    )
                 except Exception as e:
                     logger.warning(
-                        f"Could not get SSH key details for '{ssh_key.name}': {e}",
+                        f"Could not get VM details for SSH key analysis '{vm.name}': {e}",
                     )
                     continue
 
+                os_profile = vm_details.os_profile
+                linux_configuration = os_profile and os_profile.linux_configuration
+                ssh_configuration = linux_configuration and linux_configuration.ssh
+                if not ssh_configuration or not ssh_configuration.public_keys:
+                    continue
+
+                for public_key_config in ssh_configuration.public_keys:
+                    if not public_key_config.key_data:
+                        continue
+                    for ssh_key in keys_by_data.get(
+                        public_key_config.key_data.strip(), ()
+                    ):
+                        # VM uses this SSH key - create dependency
+                        vm.add_dependency(
+                            ssh_key.name,
+                            DependencyType.EXPLICIT,
+                            "Azure API - SSH key configuration",
+                        )
+                        logger.debug(
+                            f"Added SSH key dependency: {vm.name} -> {ssh_key.name}",
+                        )
+
         except Exception as e:
             logger.warning(f"Failed to discover VM-SSH key relationships: {e}")
 
@@ -724,66 +1884,58 @@ class AzureClient:
             resources: List of Azure resources to analyze.
         """
         # Find gallery resources
-        galleries = [
-            r for r in resources if r.resource_type == "Microsoft.Compute/galleries"
-        ]
-        gallery_images = [
-            r
-            for r in resources
-            if r.resource_type == "Microsoft.Compute/galleries/images"
-        ]
-        gallery_versions = [
-            r
-            for r in resources
-            if r.resource_type == "Microsoft.Compute/galleries/images/versions"
-        ]
+        galleries, gallery_images, gallery_versions = _select_by_types(
+            resources,
+            "Microsoft.Compute/galleries",
+            "Microsoft.Compute/galleries/images",
+            "Microsoft.Compute/galleries/images/versions",
+        )
 
         if not galleries and not gallery_images and not gallery_versions:
             return
 
         try:
+            galleries_by_name = _index_by_name(galleries, "Microsoft.Compute/galleries")
+            images_by_name = _index_by_name(
+                gallery_images,
+                "Microsoft.Compute/galleries/images",
+            )
+
             # Create relationships for gallery images -> galleries
             for gallery_image in gallery_images:
                 # Extract gallery name from the image resource name
                 # Format: gallery_name/image_name
-                if "/" in gallery_image.name:
-                    gallery_name = gallery_image.name.split("/")[0]
-
+                gallery_name, separator, _ = gallery_image.name.partition("/")
+                if separator:
                     # Find the corresponding gallery
-                    for gallery in galleries:
-                        if gallery.name == gallery_name:
-                            gallery_image.add_dependency(
-                                gallery.name,
-                                DependencyType.EXPLICIT,
-                                "Azure API - gallery hierarchy",
-                            )
-                            logger.debug(
-                                f"Added gallery dependency: {gallery_image.name} -> {gallery.name}",
-                            )
-                            break
+                    gallery = galleries_by_name.get(gallery_name)
+                    if gallery is not None:
+                        gallery_image.add_dependency(
+                            gallery.name,
+                            DependencyType.EXPLICIT,
+                            "Azure API - gallery hierarchy",
+                        )
+                        logger.debug(
+                            f"Added gallery dependency: {gallery_image.name} -> {gallery.name}",
+                        )
 
             # Create relationships for gallery image versions -> gallery images
             for gallery_version in gallery_versions:
                 # Extract gallery and image name from version resource name
                 # Format: gallery_name/image_name/version
-                name_parts = gallery_version.name.split("/")
-                if len(name_parts) >= 3:
-                    gallery_name = name_parts[0]
-                    image_name = name_parts[1]
-                    gallery_image_name = f"{gallery_name}/{image_name}"
-
+                gallery_image_name = gallery_version.name.rpartition("/")[0]
+                if "/" in gallery_image_name:
                     # Find the corresponding gallery image
-                    for gallery_image in gallery_images:
-                        if gallery_image.name == gallery_image_name:
-                            gallery_version.add_dependency(
-                                gallery_image.name,
-                                DependencyType.EXPLICIT,
-                                "Azure API - gallery hierarchy",
-                            )
-                            logger.debug(
-                                f"Added gallery image dependency: {gallery_version.name} -> {gallery_image.name}",
-                            )
-                            break
+                    parent_image = images_by_name.get(gallery_image_name)
+                    if parent_image is not None:
+                        gallery_version.add_dependency(
+                            parent_image.name,
+                            DependencyType.EXPLICIT,
+                            "Azure API - gallery hierarchy",
+                        )
+                        logger.debug(
+                            f"Added gallery image dependency: {gallery_version.name} -> {parent_image.name}",
+                        )
 
         except Exception as e:
             logger.warning(f"Failed to discover gallery relationships: {e}")
@@ -797,23 +1949,12 @@ class AzureClient:
             resources: List of Azure resources to analyze.
         """
         # Find managed identities and potential resources that use them
-        managed_identities = [
-            r
-            for r in resources
-            if r.resource_type == "Microsoft.ManagedIdentity/userAssignedIdentities"
-        ]
+        managed_identities = _index_by_name(
+            resources,
+            "Microsoft.ManagedIdentity/userAssignedIdentities",
+        )
         potential_users = [
-            r
-            for r in resources
-            if r.resource_type
-            in [
-                "Microsoft.Compute/virtualMachines",
-                "Microsoft.Compute/virtualMachineScaleSets",
-                "Microsoft.ContainerService/managedClusters",
-                "Microsoft.RedHatOpenShift/OpenShiftClusters",
-                "Microsoft.Web/sites",
-                "Microsoft.Storage/storageAccounts",
-            ]
+            r for r in resources if r.resource_type in self._IDENTITY_USER_TYPES
         ]
 
         if not managed_identities or not potential_users:
@@ -827,7 +1968,8 @@ class AzureClient:
 
                     # Get resource details based on type
                     if resource.resource_type == "Microsoft.Compute/virtualMachines":
-                        resource_details = self.compute_client.virtual_machines.get(
+                        resource_details = self._get_resource_model(
+                            "Microsoft.Compute/virtualMachines",
                             resource.resource_group,
                             resource.name,
                         )
@@ -835,11 +1977,10 @@ class AzureClient:
                         resource.resource_type
                         == "Microsoft.Compute/virtualMachineScaleSets"
                     ):
-                        resource_details = (
-                            self.compute_client.virtual_machine_scale_sets.get(
-                                resource.resource_group,
-                                resource.name,
-                            )
+                        resource_details = self._get_resource_model(
+                            "Microsoft.Compute/virtualMachineScaleSets",
+                            resource.resource_group,
+                            resource.name,
                         )
 
                     # Check for managed identity usage
@@ -865,17 +2006,16 @@ class AzureClient:
                                 )
 
                                 # Find the corresponding managed identity resource
-                                for managed_identity in managed_identities:
-                                    if managed_identity.name == identity_name:
-                                        resource.add_dependency(
-                                            managed_identity.name,
-                                            DependencyType.EXPLICIT,
-                                            "Azure API - managed identity assignment",
-                                        )
-                                        logger.debug(
-                                            f"Added managed identity dependency: {resource.name} -> {managed_identity.name}",
-                                        )
-                                        break
+                                managed_identity = managed_identities.get(identity_name)
+                                if managed_identity is not None:
+                                    resource.add_dependency(
+                                        managed_identity.name,
+                                        DependencyType.EXPLICIT,
+                                        "Azure API - managed identity assignment",
+                                    )
+                                    logger.debug(
+                                        f"Added managed identity dependency: {resource.name} -> {managed_identity.name}",
+                                    )
 
                         # Check for system-assigned identity (would be implicit, no explicit dependency)
                         if (
@@ -905,27 +2045,23 @@ class AzureClient:
             resources: List of Azure resources to analyze.
         """
         # Find Private DNS resources
-        private_dns_zones = [
-            r
-            for r in resources
-            if r.resource_type == "Microsoft.Network/privateDnsZones"
-        ]
-        vnet_links = [
-            r
-            for r in resources
-            if r.resource_type
-            == "Microsoft.Network/privateDnsZones/virtualNetworkLinks"
-        ]
-        vnets = [
-            r
-            for r in resources
-            if r.resource_type == "Microsoft.Network/virtualNetworks"
-        ]
+        private_dns_zones, vnet_links, vnets = _select_by_types(
+            resources,
+            "Microsoft.Network/privateDnsZones",
+            "Microsoft.Network/privateDnsZones/virtualNetworkLinks",
+            "Microsoft.Network/virtualNetworks",
+        )
 
         if not private_dns_zones and not vnet_links:
             return
 
         try:
+            zones_by_name = _index_by_name(
+                private_dns_zones,
+                "Microsoft.Network/privateDnsZones",
+            )
+            vnets_by_name = _index_by_name(vnets, "Microsoft.Network/virtualNetworks")
+
             # Create relationships for VNet links -> Private DNS Zones
             for vnet_link in vnet_links:
                 # Extract DNS zone name from VNet link resource name
@@ -934,135 +2070,43 @@ class AzureClient:
                     dns_zone_name = vnet_link.name.split("/")[0]
 
                     # Find the corresponding Private DNS Zone
-                    for dns_zone in private_dns_zones:
-                        if dns_zone.name == dns_zone_name:
-                            vnet_link.add_dependency(
-                                dns_zone.name,
-                                DependencyType.EXPLICIT,
-                                "Azure API - private DNS zone link",
-                            )
-                            logger.debug(
-                                f"Added Private DNS Zone dependency: {vnet_link.name} -> {dns_zone.name}",
-                            )
-                            break
-
-            # Create relationships for VNet links -> Virtual Networks
-            for vnet_link in vnet_links:
-                try:
-                    # Get VNet link details to find the connected VNet
-                    dns_zone_name = (
-                        vnet_link.name.split("/")[0]
-                        if "/" in vnet_link.name
-                        else vnet_link.name
-                    )
-                    link_name = (
-                        vnet_link.name.split("/")[-1]
-                        if "/" in vnet_link.name
-                        else vnet_link.name
-                    )
-
-                    # Try to use SDK first, fall back to Azure CLI if needed
-                    try:
-                        # Use the network management client to get virtual network links
-                        # Note: This requires azure-mgmt-privatedns which might not be available
-                        vnet_link_details = (
-                            self.network_client.virtual_network_links.get(  # type: ignore[attr-defined]
-                                vnet_link.resource_group,
-                                dns_zone_name,
-                                link_name,
-                            )
+                    dns_zone = zones_by_name.get(dns_zone_name)
+                    if dns_zone is not None:
+                        vnet_link.add_dependency(
+                            dns_zone.name,
+                            DependencyType.EXPLICIT,
+                            "Azure API - private DNS zone link",
                         )
-
-                        if (
-                            hasattr(vnet_link_details, "virtual_network")
-                            and vnet_link_details.virtual_network
-                        ):
-                            vnet_id = vnet_link_details.virtual_network.id
-                            vnet_name = self._extract_resource_name_from_id(vnet_id)
-
-                            # Find the corresponding VNet resource
-                            for vnet in vnets:
-                                if vnet.name == vnet_name:
-                                    vnet_link.add_dependency(
-                                        vnet.name,
-                                        DependencyType.EXPLICIT,
-                                        "Azure API - VNet link connection",
-                                    )
-                                    logger.debug(
-                                        f"Added VNet dependency: {vnet_link.name} -> {vnet.name}",
-                                    )
-                                    break
-                    except AttributeError:
-                        # SDK doesn't have private DNS support, try Azure CLI with better error handling
-                        import json
-                        import subprocess
-
-                        result = subprocess.run(
-                            [
-                                "az",
-                                "network",
-                                "private-dns",
-                                "link",
-                                "vnet",
-                                "show",
-                                "--subscription",
-                                self.subscription_id,
-                                "--resource-group",
-                                vnet_link.resource_group,
-                                "--zone-name",
-                                dns_zone_name,
-                                "--name",
-                                link_name,
-                                "--query",
-                                "virtualNetwork.id",
-                                "-o",
-                                "json",
-                            ],
-                            check=False,
-                            capture_output=True,
-                            text=True,
+                        logger.debug(
+                            f"Added Private DNS Zone dependency: {vnet_link.name} -> {dns_zone.name}",
                         )
 
-                        if result.returncode == 0:
-                            vnet_id = json.loads(result.stdout)
-                            if vnet_id:
-                                # Extract VNet name from resource ID
-                                vnet_name = self._extract_resource_name_from_id(vnet_id)
-
-                                # Find the corresponding VNet resource
-                                for vnet in vnets:
-                                    if vnet.name == vnet_name:
-                                        vnet_link.add_dependency(
-                                            vnet.name,
-                                            DependencyType.EXPLICIT,
-                                            "Azure API - VNet link connection",
-                                        )
-                                        logger.debug(
-                                            f"Added VNet dependency: {vnet_link.name} -> {vnet.name}",
-                                        )
-                                        break
-                        else:
-                            # Log as debug instead of warning if it's a common access issue
-                            error_output = result.stderr
-                            if (
-                                "ResourceNotFound" in error_output
-                                or "ResourceGroupNotFound" in error_output
-                                or "exit status 3" in str(error_output)
-                                or "could not be found" in error_output
-                            ):
-                                logger.debug(
-                                    f"VNet link '{vnet_link.name}' references non-existent resource group or has been deleted - skipping",
-                                )
-                            else:
-                                logger.warning(
-                                    f"Could not get VNet link details for '{vnet_link.name}': {result.stderr}",
-                                )
+            # Create relationships for VNet links -> Virtual Networks; each
+            # link read is independent, so the links are read concurrently
+            linked_vnet_ids: list[str | None] = []
+            if vnet_links:
+                max_workers = min(_MAX_WORKERS, len(vnet_links))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    linked_vnet_ids = list(
+                        executor.map(self._get_linked_vnet_id, vnet_links),
+                    )
 
-                except Exception as e:
+            for vnet_link, vnet_id in zip(vnet_links, linked_vnet_ids, strict=True):
+                if not vnet_id:
+                    continue
+                vnet_name = self._extract_resource_name_from_id(vnet_id)
+
+                # Find the corresponding VNet resource
+                linked_vnet = vnets_by_name.get(vnet_name)
+                if linked_vnet is not None:
+                    vnet_link.add_dependency(
+                        linked_vnet.name,
+                        DependencyType.EXPLICIT,
+                        "Azure API - VNet link connection",
+                    )
                     logger.debug(
-                        f"Could not get VNet link details for '{vnet_link.name}': {e}",
+                        f"Added VNet dependency: {vnet_link.name} -> {linked_vnet.name}",
                     )
-                    continue
 
             # Create relationships from Private DNS Zones to VNets they serve (through VNet links)
             for private_dns_zone in private_dns_zones:
@@ -1092,6 +2136,60 @@ class AzureClient:
         except Exception as e:
             logger.warning(f"Failed to discover Private DNS relationships: {e}")
 
+    def _get_linked_vnet_id(self, vnet_link: AzureResource) -> str | None:
+        """Get the ID of the virtual network a private DNS zone link points to.
+
+        Args:
+            vnet_link: Private DNS zone virtual network link resource.
+
+        Returns:
+            Virtual network resource ID, or None if it can't be read.
+        """
+        try:
+            # Get VNet link details to find the connected VNet
+            dns_zone_name = (
+                vnet_link.name.split("/")[0]
+                if "/" in vnet_link.name
+                else vnet_link.name
+            )
+            link_name = (
+                vnet_link.name.split("/")[-1]
+                if "/" in vnet_link.name
+                else vnet_link.name
+            )
+
+            # Read the link through the generic resources API, which
+            # needs no private DNS SDK package or 'az' process
+            link_id = (
+                f"/subscriptions/{self.subscription_id}/resourceGroups/{vnet_link.resource_group}"
+                f"/providers/Microsoft.Network/privateDnsZones/{dns_zone_name}"
+                f"/virtualNetworkLinks/{link_name}"
+            )
+            try:
+                vnet_link_details = self.resource_client.resources.get_by_id(
+                    link_id,
+                    api_version=_PRIVATE_DNS_API_VERSION,
+                )
+            except ResourceNotFoundError:
+                logger.debug(
+                    f"VNet link '{vnet_link.name}' references non-existent resource group or has been deleted - skipping",
+                )
+                return None
+            except AzureError as e:
+                logger.warning(
+                    f"Could not get VNet link details for '{vnet_link.name}': {e}",
+                )
+                return None
+
+            link_properties = vnet_link_details.properties or {}
+            return (link_properties.get("virtualNetwork") or {}).get("id")
+
+        except Exception as e:
+            logger.debug(
+                f"Could not get VNet link details for '{vnet_link.name}': {e}",
+            )
+            return None
+
     def _discover_route_table_relationships(
         self, resources: list[AzureResource]
     ) -> None:
@@ -1118,7 +2216,8 @@ class AzureClient:
             for route_table in route_tables:
                 try:
                     # Get route table details to find associated subnets
-                    route_table_details = self.network_client.route_tables.get(
+                    route_table_details = self._get_resource_model(
+                        "Microsoft.Network/routeTables",
                         route_table.resource_group,
                         route_table.name,
                     )
@@ -1129,32 +2228,27 @@ class AzureClient:
                         and route_table_details.subnets
                     ):
                         for subnet_ref in route_table_details.subnets:
-                            if subnet_ref.id:
-                                # Extract subnet name from resource ID
-                                # Format: /subscriptions/{sub}/resourceGroups/{rg}/providers/Microsoft.Network/virtualNetworks/{vnet}/subnets/{subnet}
-                                id_parts = subnet_ref.id.split("/")
-                                if len(id_parts) >= 11 and "subnets" in id_parts:
-                                    vnet_index = id_parts.index("virtualNetworks")
-                                    subnet_index = id_parts.index("subnets")
-                                    if vnet_index + 1 < len(
-                                        id_parts,
-                                    ) and subnet_index + 1 < len(id_parts):
-                                        vnet_name = id_parts[vnet_index + 1]
-                                        subnet_name = id_parts[subnet_index + 1]
-                                        full_subnet_name = f"{vnet_name}/{subnet_name}"
-
-                                        # Find the corresponding subnet resource
-                                        for subnet in subnets:
-                                            if subnet.name == full_subnet_name:
-                                                subnet.add_dependency(
-                                                    route_table.name,
-                                                    DependencyType.EXPLICIT,
-                                                    "Azure API - route table association",
-                                                )
-                                                logger.debug(
-                                                    f"Added route table dependency: {subnet.name} -> {route_table.name}",
-                                                )
-                                                break
+                            # Extract VNet and subnet names from resource ID
+                            names = (
+                                _subnet_names_from_id(subnet_ref.id)
+                                if subnet_ref.id
+                                else None
+                            )
+                            if names:
+                                full_subnet_name = f"{names[0]}/{names[1]}"
+
+                                # Find the corresponding subnet resource
+                                for subnet in subnets:
+                                    if subnet.name == full_subnet_name:
+                                        subnet.add_dependency(
+                                            route_table.name,
+                                            DependencyType.EXPLICIT,
+                                            "Azure API - route table association",
+                                        )
+                                        logger.debug(
+                                            f"Added route table dependency: {subnet.name} -> {route_table.name}",
+                                        )
+                                        break
 
                 except Exception as e:
                     logger.warning(
@@ -1187,22 +2281,13 @@ class AzureClient:
             all_master_vms = []
 
             # First, get resources from the current list
-            load_balancers = [
-                r
-                for r in resources
-                if r.resource_type == "Microsoft.Network/loadBalancers"
-            ]
-            public_ips = [
-                r
-                for r in resources
-                if r.resource_type == "Microsoft.Network/publicIPAddresses"
-            ]
-            master_vms = [
-                r
-                for r in resources
-                if r.resource_type == "Microsoft.Compute/virtualMachines"
-                and "master" in r.name.lower()
-            ]
+            load_balancers, public_ips, vms = _select_by_types(
+                resources,
+                "Microsoft.Network/loadBalancers",
+                "Microsoft.Network/publicIPAddresses",
+                "Microsoft.Compute/virtualMachines",
+            )
+            master_vms = [vm for vm in vms if "master" in vm.name_lower]
 
             all_load_balancers.extend(load_balancers)
             all_public_ips.extend(public_ips)
@@ -1261,7 +2346,7 @@ class AzureClient:
                     for cluster_name in cluster_names:
                         # Connect to load balancers with matching cluster name
                         for lb in all_load_balancers:
-                            if cluster_name in lb.name.lower():
+                            if cluster_name in lb.name_lower:
                                 dns_zone.add_dependency(
                                     lb.name,
                                     DependencyType.DERIVED,
@@ -1273,7 +2358,7 @@ class AzureClient:
 
                         # Connect to public IPs with matching cluster name
                         for pip in all_public_ips:
-                            if cluster_name in pip.name.lower():
+                            if cluster_name in pip.name_lower:
                                 dns_zone.add_dependency(
                                     pip.name,
                                     DependencyType.DERIVED,
@@ -1285,7 +2370,7 @@ class AzureClient:
 
                         # Connect to master VMs with matching cluster name (they serve the API)
                         for master_vm in all_master_vms:
-                            if cluster_name in master_vm.name.lower():
+                            if cluster_name in master_vm.name_lower:
                                 dns_zone.add_dependency(
                                     master_vm.name,
                                     DependencyType.DERIVED,
@@ -1319,16 +2404,14 @@ class AzureClient:
             for r in resources
             if r.resource_type == "Microsoft.Network/networkInterfaces"
         ]
-        private_endpoints = [
-            r
-            for r in resources
-            if r.resource_type == "Microsoft.Network/privateEndpoints"
-        ]
-        private_link_services = [
-            r
-            for r in resources
-            if r.resource_type == "Microsoft.Network/privateLinkServices"
-        ]
+        private_endpoints = _index_by_name(
+            resources,
+            "Microsoft.Network/privateEndpoints",
+        )
+        private_link_services = _index_by_name(
+            resources,
+            "Microsoft.Network/privateLinkServices",
+        )
 
         if not nics:
             return
@@ -1337,7 +2420,8 @@ class AzureClient:
             # For each NIC, check if it's attached to a private endpoint or private link service
             for nic in nics:
                 try:
-                    nic_details = self.network_client.network_interfaces.get(
+                    nic_details = self._get_resource_model(
+                        "Microsoft.Network/networkInterfaces",
                         nic.resource_group,
                         nic.name,
                     )
@@ -1354,17 +2438,16 @@ class AzureClient:
                             )
 
                             # Find the corresponding private endpoint resource
-                            for pe in private_endpoints:
-                                if pe.name == pe_name:
-                                    pe.add_dependency(
-                                        nic.name,
-                                        DependencyType.EXPLICIT,
-                                        "Azure API - private endpoint NIC",
-                                    )
-                                    logger.debug(
-                                        f"Added NIC dependency: {pe.name} -> {nic.name}",
-                                    )
-                                    break
+                            pe = private_endpoints.get(pe_name)
+                            if pe is not None:
+                                pe.add_dependency(
+                                    nic.name,
+                                    DependencyType.EXPLICIT,
+                                    "Azure API - private endpoint NIC",
+                                )
+                                logger.debug(
+                                    f"Added NIC dependency: {pe.name} -> {nic.name}",
+                                )
 
                     # Check if this NIC belongs to a private link service
                     elif (
@@ -1378,17 +2461,16 @@ class AzureClient:
                             )
 
                             # Find the corresponding private link service resource
-                            for pls in private_link_services:
-                                if pls.name == pls_name:
-                                    pls.add_dependency(
-                                        nic.name,
-                                        DependencyType.EXPLICIT,
-                                        "Azure API - private link service NIC",
-                                    )
-                                    logger.debug(
-                                        f"Added NIC dependency: {pls.name} -> {nic.name}",
-                                    )
-                                    break
+                            pls = private_link_services.get(pls_name)
+                            if pls is not None:
+                                pls.add_dependency(
+                                    nic.name,
+                                    DependencyType.EXPLICIT,
+                                    "Azure API - private link service NIC",
+                                )
+                                logger.debug(
+                                    f"Added NIC dependency: {pls.name} -> {nic.name}",
+                                )
 
                 except Exception as e:
                     logger.warning(f"Could not get NIC details for '{nic.name}': {e}")
@@ -1414,9 +2496,7 @@ class AzureClient:
             for r in resources
             if r.resource_type == "Microsoft.Network/privateLinkServices"
         ]
-        load_balancers = [
-            r for r in resources if r.resource_type == "Microsoft.Network/loadBalancers"
-        ]
+        load_balancers = _index_by_name(resources, "Microsoft.Network/loadBalancers")
 
         if not private_link_services or not load_balancers:
             return
@@ -1425,7 +2505,8 @@ class AzureClient:
             # For each private link service, check its load balancer frontend configuration
             for pls in private_link_services:
                 try:
-                    pls_details = self.network_client.private_link_services.get(
+                    pls_details = self._get_resource_model(
+                        "Microsoft.Network/privateLinkServices",
                         pls.resource_group,
                         pls.name,
                     )
@@ -1438,27 +2519,25 @@ class AzureClient:
                         for (
                             frontend_config
                         ) in pls_details.load_balancer_frontend_ip_configurations:
-                            if frontend_config.id:
-                                # Extract load balancer name from the frontend IP configuration ID
-                                # Format: /subscriptions/{sub}/resourceGroups/{rg}/providers/Microsoft.Network/loadBalancers/{lb_name}/frontendIPConfigurations/{config_name}
-                                id_parts = frontend_config.id.split("/")
-                                if len(id_parts) >= 9 and "loadBalancers" in id_parts:
-                                    lb_index = id_parts.index("loadBalancers")
-                                    if lb_index + 1 < len(id_parts):
-                                        lb_name = id_parts[lb_index + 1]
-
-                                        # Find the corresponding load balancer resource
-                                        for lb in load_balancers:
-                                            if lb.name == lb_name:
-                                                pls.add_dependency(
-                                                    lb.name,
-                                                    DependencyType.EXPLICIT,
-                                                    "Azure API - private link service load balancer",
-                                                )
-                                                logger.debug(
-                                                    f"Added load balancer dependency: {pls.name} -> {lb.name}",
-                                                )
-                                                break
+                            # Extract load balancer name from the frontend IP configuration ID
+                            # Format: /subscriptions/{sub}/resourceGroups/{rg}/providers/Microsoft.Network/loadBalancers/{lb_name}/frontendIPConfigurations/{config_name}
+                            parsed = (
+                                _parse_arm_id(frontend_config.id)
+                                if frontend_config.id
+                                else None
+                            )
+                            if parsed and parsed["type"].lower() == "loadbalancers":
+                                # Find the corresponding load balancer resource
+                                lb = load_balancers.get(parsed["name"])
+                                if lb is not None:
+                                    pls.add_dependency(
+                                        lb.name,
+                                        DependencyType.EXPLICIT,
+                                        "Azure API - private link service load balancer",
+                                    )
+                                    logger.debug(
+                                        f"Added load balancer dependency: {pls.name} -> {lb.name}",
+                                    )
 
                 except Exception as e:
                     logger.warning(
@@ -1478,85 +2557,139 @@ class AzureClient:
             resources: List of Azure resources to analyze.
         """
         try:
-            # Get all VNets in the subscription to find subnets
-            vnets = []
+            subnets = self._list_subscription_subnets()
+            if subnets is None:
+                return
+
+            # Subnets already known (e.g. from PE discovery) are not duplicated
+            existing_subnets = {
+                r.name
+                for r in resources
+                if r.resource_type == "Microsoft.Network/virtualNetworks/subnets"
+            }
+            for subnet in subnets:
+                self._add_virtual_subnet(resources, existing_subnets, **subnet)
+
+        except Exception as e:
+            logger.warning(f"Failed to discover all subnets: {e}")
+
+    def _list_subscription_subnets(self) -> list[dict[str, str]] | None:
+        """List every VNet subnet in the subscription, once per client.
+
+        Uses a single Resource Graph query when azure-mgmt-resourcegraph is
+        installed, otherwise lists VNets through the network provider; the
+        listing already includes each VNet's subnets.
+
+        Returns:
+            List of dictionaries with vnet_name, vnet_rg, location,
+            subnet_name and address_prefix keys, or None if VNets could
+            not be listed.
+        """
+        if self._subscription_subnets is not None:
+            return self._subscription_subnets
+
+        try:
+            rows = self._query_resource_graph(_SUBNETS_QUERY)
+        except Exception as e:
+            logger.warning(f"Resource Graph subnet query failed: {e}")
+            rows = None
+
+        subnets: list[dict[str, str]] = []
+        if rows is not None:
+            for row in rows:
+                parsed = _parse_arm_id(row["id"]) if row.get("id") else None
+                if parsed and row.get("vnet") and row.get("subnetName"):
+                    subnets.append(
+                        {
+                            "vnet_name": row["vnet"],
+                            "vnet_rg": parsed["rg"],
+                            "location": row.get("loc") or "unknown",
+                            "subnet_name": row["subnetName"],
+                            "address_prefix": row.get("prefix") or "unknown",
+                        },
+                    )
+        else:
             try:
                 # Get all VNets in the subscription (not just the current resource group)
-                for vnet in self.network_client.virtual_networks.list_all():
-                    vnets.append(vnet)
-                    logger.debug(
-                        f"Found VNet: {vnet.name} in RG: {vnet.id.split('/')[4] if vnet.id and '/' in vnet.id else 'unknown'}",
-                    )
+                vnets = list(self.network_client.virtual_networks.list_all())
             except Exception as e:
                 logger.warning(f"Could not list VNets: {e}")
-                return
+                return None
 
-            # Process each VNet and its subnets
             for vnet in vnets:
-                try:
-                    vnet_name = vnet.name
-                    vnet_rg = (
-                        vnet.id.split("/")[4]
-                        if vnet.id and "/" in vnet.id
-                        else "unknown"
-                    )
-
-                    # Skip if we couldn't determine the resource group
-                    if vnet_rg == "unknown" or not vnet_name:
-                        continue
-
-                    # Get detailed VNet information including subnets
-                    vnet_details = self.network_client.virtual_networks.get(
-                        vnet_rg,
-                        vnet_name,
+                parsed = _parse_arm_id(vnet.id) if vnet.id else None
+                # Skip if we couldn't determine the resource group
+                if parsed is None or not vnet.name:
+                    continue
+                logger.debug("Found VNet: %s in RG: %s", vnet.name, parsed["rg"])
+
+                for subnet in vnet.subnets or []:
+                    prefixes = subnet.address_prefixes or ["unknown"]
+                    subnets.append(
+                        {
+                            "vnet_name": vnet.name,
+                            "vnet_rg": parsed["rg"],
+                            "location": vnet.location or "unknown",
+                            "subnet_name": subnet.name,
+                            "address_prefix": subnet.address_prefix or prefixes[0],
+                        },
                     )
 
-                    if hasattr(vnet_details, "subnets") and vnet_details.subnets:
-                        for subnet in vnet_details.subnets:
-                            subnet_name = subnet.name
-                            subnet_full_name = f"{vnet_name}/{subnet_name}"
-
-                            # Check if we already have this subnet (from PE discovery)
-                            subnet_exists = any(
-                                r.name == subnet_full_name
-                                for r in resources
-                                if r.resource_type
-                                == "Microsoft.Network/virtualNetworks/subnets"
-                            )
+        self._subscription_subnets = subnets
+        return subnets
 
-                            if not subnet_exists:
-                                # Create virtual subnet resource
-                                virtual_subnet = AzureResource(
-                                    name=subnet_full_name,
-                                    resource_type="Microsoft.Network/virtualNetworks/subnets",
-                                    category="Network",
-                                    location=vnet.location or "unknown",
-                                    resource_group=vnet_rg,
-                                    subscription_id=self.subscription_id,
-                                    properties={
-                                        "vnet_name": vnet_name,
-                                        "subnet_name": subnet_name,
-                                        "address_prefix": getattr(
-                                            subnet,
-                                            "address_prefix",
-                                            "unknown",
-                                        ),
-                                        "is_virtual": True,
-                                    },
-                                    tags={},
-                                    dependencies=[],
-                                )
-                                resources.append(virtual_subnet)
-                                logger.debug(
-                                    f"Created virtual subnet resource: {subnet_full_name} (prefix: {getattr(subnet, 'address_prefix', 'unknown')})",
-                                )
+    def _add_virtual_subnet(
+        self,
+        resources: list[AzureResource],
+        existing_subnets: set[str],
+        *,
+        vnet_name: str,
+        vnet_rg: str,
+        location: str,
+        subnet_name: str,
+        address_prefix: str,
+    ) -> None:
+        """Append a virtual subnet resource unless it already exists.
 
-                except Exception as e:
-                    logger.warning(f"Could not process VNet '{vnet.name}': {e}")
-                    continue
+        Args:
+            resources: List of Azure resources to extend.
+            existing_subnets: Full names of subnets already in resources; updated.
+            vnet_name: Name of the parent VNet.
+            vnet_rg: Resource group of the parent VNet.
+            location: Location of the parent VNet.
+            subnet_name: Name of the subnet.
+            address_prefix: Address prefix of the subnet.
+        """
+        subnet_full_name = f"{vnet_name}/{subnet_name}"
+        if subnet_full_name in existing_subnets:
+            return
 
-        except Exception as e:
-            logger.warning(f"Failed to discover all subnets: {e}")
+        # Create virtual subnet resource
+        virtual_subnet = AzureResource(
+            name=subnet_full_name,
+            resource_type="Microsoft.Network/virtualNetworks/subnets",
+            category="Network",
+            location=location,
+            resource_group=vnet_rg,
+            subscription_id=self.subscription_id,
+            properties={
+                "vnet_name": vnet_name,
+                "subnet_name": subnet_name,
+                "address_prefix": address_prefix,
+                "is_virtual": True,
+            },
+            tags={},
+            dependencies=[],
+        )
+        resources.append(virtual_subnet)
+        existing_subnets.add(subnet_full_name)
+        # Runs for every subnet in the subscription, so the message is only
+        # formatted when debug logging is enabled
+        logger.debug(
+            "Created virtual subnet resource: %s (prefix: %s)",
+            subnet_full_name,
+            address_prefix,
+        )
 
     def _discover_private_endpoint_subnet_relationships(
         self,
@@ -1581,7 +2714,8 @@ class AzureClient:
             # For each private endpoint, get its subnet information
             for pe in private_endpoints:
                 try:
-                    pe_details = self.network_client.private_endpoints.get(
+                    pe_details = self._get_resource_model(
+                        "Microsoft.Network/privateEndpoints",
                         pe.resource_group,
                         pe.name,
                     )
@@ -1595,36 +2729,25 @@ class AzureClient:
                         subnet_id = pe_details.subnet.id
                         # Extract VNet and subnet names from ID
                         # Format: /subscriptions/{sub}/resourceGroups/{rg}/providers/Microsoft.Network/virtualNetworks/{vnet}/subnets/{subnet}
-                        id_parts = subnet_id.split("/")
-                        if (
-                            len(id_parts) >= 11
-                            and "virtualNetworks" in id_parts
-                            and "subnets" in id_parts
-                        ):
-                            vnet_index = id_parts.index("virtualNetworks")
-                            subnet_index = id_parts.index("subnets")
-
-                            if vnet_index + 1 < len(
-                                id_parts,
-                            ) and subnet_index + 1 < len(id_parts):
-                                vnet_name = id_parts[vnet_index + 1]
-                                subnet_name = id_parts[subnet_index + 1]
-
-                                # Store subnet information in PE properties for later visualization
-                                pe.properties["subnet_name"] = subnet_name
-                                pe.properties["vnet_name"] = vnet_name
-                                pe.properties["subnet_id"] = subnet_id
-
-                                # Add dependency from PE to subnet (subnet should already exist from _discover_all_subnets)
-                                subnet_full_name = f"{vnet_name}/{subnet_name}"
-                                pe.add_dependency(
-                                    subnet_full_name,
-                                    DependencyType.EXPLICIT,
-                                    "Azure API - private endpoint subnet placement",
-                                )
-                                logger.debug(
-                                    f"Added subnet dependency: {pe.name} -> {subnet_full_name}",
-                                )
+                        names = _subnet_names_from_id(subnet_id)
+                        if names:
+                            vnet_name, subnet_name = names
+
+                            # Store subnet information in PE properties for later visualization
+                            pe.properties["subnet_name"] = subnet_name
+                            pe.properties["vnet_name"] = vnet_name
+                            pe.properties["subnet_id"] = subnet_id
+
+                            # Add dependency from PE to subnet (subnet should already exist from _discover_all_subnets)
+                            subnet_full_name = f"{vnet_name}/{subnet_name}"
+                            pe.add_dependency(
+                                subnet_full_name,
+                                DependencyType.EXPLICIT,
+                                "Azure API - private endpoint subnet placement",
+                            )
+                            logger.debug(
+                                f"Added subnet dependency: {pe.name} -> {subnet_full_name}",
+                            )
 
                     # Check for private link service connections (both automatic and manual)
                     pls_connections = []
@@ -1656,12 +2779,10 @@ class AzureClient:
                             pls_name = self._extract_resource_name_from_id(pls_id)
 
                             # Extract resource group from the PLS ID to determine if external
-                            id_parts = pls_id.split("/")
-                            if len(id_parts) >= 5:
-                                pls_rg = id_parts[4]
-                                pls_subscription = (
-                                    id_parts[2] if len(id_parts) >= 3 else None
-                                )
+                            parsed = _parse_arm_id(pls_id)
+                            if parsed:
+                                pls_rg = parsed["rg"]
+                                pls_subscription = parsed["sub"]
 
                                 external_connections.append(
                                     {
@@ -1717,7 +2838,8 @@ class AzureClient:
             # For each NIC, get its subnet information
             for nic in nics:
                 try:
-                    nic_details = self.network_client.network_interfaces.get(
+                    nic_details = self._get_resource_model(
+                        "Microsoft.Network/networkInterfaces",
                         nic.resource_group,
                         nic.name,
                     )
@@ -1735,32 +2857,20 @@ class AzureClient:
                             ):
                                 subnet_id = ip_config.subnet.id
                                 # Extract VNet and subnet names from ID
-                                id_parts = subnet_id.split("/")
-                                if (
-                                    len(id_parts) >= 11
-                                    and "virtualNetworks" in id_parts
-                                    and "subnets" in id_parts
-                                ):
-                                    vnet_index = id_parts.index("virtualNetworks")
-                                    subnet_index = id_parts.index("subnets")
-
-                                    if vnet_index + 1 < len(
-                                        id_parts,
-                                    ) and subnet_index + 1 < len(id_parts):
-                                        vnet_name = id_parts[vnet_index + 1]
-                                        subnet_name = id_parts[subnet_index + 1]
-                                        subnet_full_name = f"{vnet_name}/{subnet_name}"
-
-                                        # Add dependency from NIC to subnet
-                                        nic.add_dependency(
-                                            subnet_full_name,
-                                            DependencyType.EXPLICIT,
-                                            "Azure API - NIC subnet placement",
-                                        )
-                                        logger.debug(
-                                            f"Added subnet dependency: {nic.name} -> {subnet_full_name}",
-                                        )
-                                        break  # Only need one subnet per NIC
+                                names = _subnet_names_from_id(subnet_id)
+                                if names:
+                                    subnet_full_name = f"{names[0]}/{names[1]}"
+
+                                    # Add dependency from NIC to subnet
+                                    nic.add_dependency(
+                                        subnet_full_name,
+                                        DependencyType.EXPLICIT,
+                                        "Azure API - NIC subnet placement",
+                                    )
+                                    logger.debug(
+                                        f"Added subnet dependency: {nic.name} -> {subnet_full_name}",
+                                    )
+                                    break  # Only need one subnet per NIC
 
                 except Exception as e:
                     logger.warning(f"Could not get NIC details for '{nic.name}': {e}")
@@ -1780,21 +2890,11 @@ class AzureClient:
         """
         try:
             # Find public IPs and NSGs
-            public_ips = [
-                r
-                for r in resources
-                if r.resource_type == "Microsoft.Network/publicIPAddresses"
-            ]
-            nsgs = [
-                r
-                for r in resources
-                if r.resource_type == "Microsoft.Network/networkSecurityGroups"
-            ]
-            subnets = [
-                r
-                for r in resources
-                if r.resource_type == "Microsoft.Network/virtualNetworks/subnets"
-            ]
+            public_ips, nsgs = _select_by_types(
+                resources,
+                "Microsoft.Network/publicIPAddresses",
+                "Microsoft.Network/networkSecurityGroups",
+            )
 
             # Add internet resource if we have public IPs
             if public_ips:
@@ -1828,7 +2928,8 @@ class AzureClient:
             # Discover NSG-to-subnet relationships
             for nsg in nsgs:
                 try:
-                    nsg_details = self.network_client.network_security_groups.get(
+                    nsg_details = self._get_resource_model(
+                        "Microsoft.Network/networkSecurityGroups",
                         nsg.resource_group,
                         nsg.name,
                     )
@@ -1836,33 +2937,26 @@ class AzureClient:
                     # Check for subnet associations
                     if hasattr(nsg_details, "subnets") and nsg_details.subnets:
                         for subnet_ref in nsg_details.subnets:
-                            if subnet_ref.id:
-                                # Extract VNet and subnet names from ID
-                                id_parts = subnet_ref.id.split("/")
-                                if (
-                                    len(id_parts) >= 11
-                                    and "virtualNetworks" in id_parts
-                                    and "subnets" in id_parts
-                                ):
-                                    vnet_index = id_parts.index("virtualNetworks")
-                                    subnet_index = id_parts.index("subnets")
-
-                                    if vnet_index + 1 < len(
-                                        id_parts,
-                                    ) and subnet_index + 1 < len(id_parts):
-                                        vnet_name = id_parts[vnet_index + 1].lower()
-                                        subnet_name = id_parts[subnet_index + 1].lower()
-                                        subnet_full_name = f"{vnet_name}/{subnet_name}"
-
-                                        # Add dependency from NSG to subnet
-                                        nsg.add_dependency(
-                                            subnet_full_name,
-                                            DependencyType.EXPLICIT,
-                                            "Azure API - NSG subnet association",
-                                        )
-                                        logger.debug(
-                                            f"Added subnet dependency: {nsg.name} -> {subnet_full_name}",
-                                        )
+                            # Extract VNet and subnet names from ID
+                            names = (
+                                _subnet_names_from_id(subnet_ref.id)
+                                if subnet_ref.id
+                                else None
+                            )
+                            if names:
+                                subnet_full_name = (
+                                    f"{names[0].lower()}/{names[1].lower()}"
+                                )
+
+                                # Add dependency from NSG to subnet
+                                nsg.add_dependency(
+                                    subnet_full_name,
+                                    DependencyType.EXPLICIT,
+                                    "Azure API - NSG subnet association",
+                                )
+                                logger.debug(
+                                    f"Added subnet dependency: {nsg.name} -> {subnet_full_name}",
+                                )
 
                 except Exception as e:
                     logger.warning(f"Could not get NSG details for '{nsg.name}': {e}")
@@ -1883,94 +2977,83 @@ class AzureClient:
         """
         try:
             # Find storage accounts and VMs
-            storage_accounts = [
-                r
-                for r in resources
-                if r.resource_type == "Microsoft.Storage/storageAccounts"
-            ]
-            vms = [
-                r
-                for r in resources
-                if r.resource_type == "Microsoft.Compute/virtualMachines"
-            ]
+            storage_accounts, vms = _select_by_types(
+                resources,
+                "Microsoft.Storage/storageAccounts",
+                "Microsoft.Compute/virtualMachines",
+            )
 
             if not storage_accounts:
                 return
 
+            storage_accounts_by_name = _index_by_name(
+                storage_accounts,
+                "Microsoft.Storage/storageAccounts",
+            )
+
             # For each VM, check if it uses any storage accounts
             for vm in vms:
                 try:
-                    vm_details = self.compute_client.virtual_machines.get(
+                    vm_details = self._get_resource_model(
+                        "Microsoft.Compute/virtualMachines",
                         vm.resource_group,
                         vm.name,
                     )
 
-                    # Check boot diagnostics storage
-                    if (
-                        hasattr(vm_details, "diagnostics_profile")
-                        and vm_details.diagnostics_profile
-                        and hasattr(vm_details.diagnostics_profile, "boot_diagnostics")
-                        and vm_details.diagnostics_profile.boot_diagnostics
-                        and hasattr(
-                            vm_details.diagnostics_profile.boot_diagnostics,
-                            "storage_uri",
-                        )
-                        and vm_details.diagnostics_profile.boot_diagnostics.storage_uri
-                    ):
-                        storage_uri = (
-                            vm_details.diagnostics_profile.boot_diagnostics.storage_uri
-                        )
+                    # Check boot diagnostics storage (missing profiles are None)
+                    boot_diagnostics = getattr(
+                        getattr(vm_details, "diagnostics_profile", None),
+                        "boot_diagnostics",
+                        None,
+                    )
+                    storage_uri = getattr(boot_diagnostics, "storage_uri", None)
+                    if storage_uri:
                         # Extract storage account name from URI (format: https://storageaccount.blob.core.windows.net/)
-                        if storage_uri:
-                            storage_name = (
-                                storage_uri.split("//")[1].split(".")[0]
-                                if "//" in storage_uri
-                                else None
+                        storage_name = _host_label(storage_uri)
+                        # Find the corresponding storage account
+                        sa = (
+                            storage_accounts_by_name.get(storage_name)
+                            if storage_name
+                            else None
+                        )
+                        if sa:
+                            vm.add_dependency(
+                                sa.name,
+                                DependencyType.EXPLICIT,
+                                "Azure API - VM boot diagnostics storage",
+                            )
+                            logger.debug(
+                                f"Added storage dependency: {vm.name} -> {sa.name} (boot diagnostics)",
                             )
-                            if storage_name:
-                                # Find the corresponding storage account
-                                for sa in storage_accounts:
-                                    if sa.name == storage_name:
-                                        vm.add_dependency(
-                                            sa.name,
-                                            DependencyType.EXPLICIT,
-                                            "Azure API - VM boot diagnostics storage",
-                                        )
-                                        logger.debug(
-                                            f"Added storage dependency: {vm.name} -> {sa.name} (boot diagnostics)",
-                                        )
-                                        break
 
                     # Check for unmanaged disks (if any VMs still use them)
-                    if (
-                        hasattr(vm_details, "storage_profile")
-                        and vm_details.storage_profile
-                        and hasattr(vm_details.storage_profile, "os_disk")
-                        and vm_details.storage_profile.os_disk
-                        and hasattr(vm_details.storage_profile.os_disk, "vhd")
-                        and vm_details.storage_profile.os_disk.vhd
-                        and hasattr(vm_details.storage_profile.os_disk.vhd, "uri")
-                    ):
-                        vhd_uri = vm_details.storage_profile.os_disk.vhd.uri
-                        if vhd_uri:
-                            storage_name = (
-                                vhd_uri.split("//")[1].split(".")[0]
-                                if "//" in vhd_uri
-                                else None
+                    vhd = getattr(
+                        getattr(
+                            getattr(vm_details, "storage_profile", None),
+                            "os_disk",
+                            None,
+                        ),
+                        "vhd",
+                        None,
+                    )
+                    vhd_uri = getattr(vhd, "uri", None)
+                    if vhd_uri:
+                        storage_name = _host_label(vhd_uri)
+                        # Find the corresponding storage account
+                        sa = (
+                            storage_accounts_by_name.get(storage_name)
+                            if storage_name
+                            else None
+                        )
+                        if sa:
+                            vm.add_dependency(
+                                sa.name,
+                                DependencyType.EXPLICIT,
+                                "Azure API - VM unmanaged disk storage",
+                            )
+                            logger.debug(
+                                f"Added storage dependency: {vm.name} -> {sa.name} (unmanaged disk)",
                             )
-                            if storage_name:
-                                # Find the corresponding storage account
-                                for sa in storage_accounts:
-                                    if sa.name == storage_name:
-                                        vm.add_dependency(
-                                            sa.name,
-                                            DependencyType.EXPLICIT,
-                                            "Azure API - VM unmanaged disk storage",
-                                        )
-                                        logger.debug(
-                                            f"Added storage dependency: {vm.name} -> {sa.name} (unmanaged disk)",
-                                        )
-                                        break
 
                 except Exception as e:
                     logger.warning(f"Could not get VM details for '{vm.name}': {e}")
@@ -1978,10 +3061,10 @@ class AzureClient:
 
             # Add pattern-based storage account relationships for accounts that might be VM-related
             for sa in storage_accounts:
-                sa_name_lower = sa.name.lower()
+                sa_name_lower = sa.name_lower
                 # Look for VMs with similar naming patterns
                 for vm in vms:
-                    vm_name_lower = vm.name.lower()
+                    vm_name_lower = vm.name_lower
 
                     # Check for common naming patterns:
                     # 1. Storage account contains VM name (e.g., "winansible4697" contains "win")
@@ -2002,7 +3085,7 @@ class AzureClient:
                             or sa_base in vm_base
                         ):
                             # Avoid already connected dependencies
-                            if sa.name not in vm.get_dependency_names():
+                            if not vm.has_dependency(sa.name):
                                 vm.add_dependency(
                                     sa.name,
                                     DependencyType.DERIVED,
@@ -2017,7 +3100,7 @@ class AzureClient:
                             vm_prefix = vm_base[:4]
                             sa_prefix = sa_base[:4]
                             if vm_prefix == sa_prefix:
-                                if sa.name not in vm.get_dependency_names():
+                                if not vm.has_dependency(sa.name):
                                     vm.add_dependency(
                                         sa.name,
                                         DependencyType.DERIVED,
@@ -2030,40 +3113,36 @@ class AzureClient:
             # For ARO/OpenShift clusters, connect storage accounts to master nodes
             # as they typically manage cluster storage
             if storage_accounts and vms:
+                # Look for common prefixes in VM names that might match storage
+                # account names; they only depend on the VMs, so collect once
+                vm_prefixes = set()
+                for vm in vms:
+                    if "master" in vm.name_lower or "worker" in vm.name_lower:
+                        # Extract cluster name from VM name (e.g., "byoid-fp64f" from "byoid-fp64f-master-0")
+                        parts = vm.name_lower.split("-")
+                        if len(parts) >= 3:  # e.g., ["byoid", "fp64f", "master", "0"]
+                            potential_cluster_name = "-".join(
+                                parts[:-2],
+                            )  # "byoid-fp64f"
+                            # Remove hyphens for storage account name comparison
+                            cluster_name_no_hyphen = potential_cluster_name.replace(
+                                "-", ""
+                            )
+                            vm_prefixes.add(cluster_name_no_hyphen)
+
                 # Look for storage accounts that appear to be cluster-related
                 cluster_storage_accounts = []
                 for sa in storage_accounts:
                     # Check if storage account name suggests cluster usage
-                    sa_name_lower = sa.name.lower()
+                    sa_name_lower = sa.name_lower
                     if any(
                         keyword in sa_name_lower
                         for keyword in ["cluster", "registry", "image"]
                     ):
                         cluster_storage_accounts.append(sa)
                     # Also check for naming patterns that include cluster/resource group names
-                    # Extract potential cluster identifier from resource group or VM names
-                    elif vms:
-                        # Look for common prefixes in VM names that might match storage account name
-                        vm_prefixes = set()
-                        for vm in vms:
-                            if (
-                                "master" in vm.name.lower()
-                                or "worker" in vm.name.lower()
-                            ):
-                                # Extract cluster name from VM name (e.g., "byoid-fp64f" from "byoid-fp64f-master-0")
-                                parts = vm.name.lower().split("-")
-                                if (
-                                    len(parts) >= 3
-                                ):  # e.g., ["byoid", "fp64f", "master", "0"]
-                                    potential_cluster_name = "-".join(
-                                        parts[:-2],
-                                    )  # "byoid-fp64f"
-                                    # Remove hyphens for storage account name comparison
-                                    cluster_name_no_hyphen = (
-                                        potential_cluster_name.replace("-", "")
-                                    )
-                                    vm_prefixes.add(cluster_name_no_hyphen)
-
+                    # extracted from the VM names
+                    else:
                         # Check if storage account name contains any of these cluster prefixes
                         for prefix in vm_prefixes:
                             if (
@@ -2077,7 +3156,7 @@ class AzureClient:
 
                 if cluster_storage_accounts:
                     # Connect cluster storage to master nodes (they manage cluster resources)
-                    master_vms = [vm for vm in vms if "master" in vm.name.lower()]
+                    master_vms = [vm for vm in vms if "master" in vm.name_lower]
                     if master_vms:
                         # Connect to ALL master nodes since they all manage cluster resources
                         for master_vm in master_vms:
@@ -2096,7 +3175,7 @@ class AzureClient:
                             vm
                             for vm in vms
                             if any(
-                                keyword in vm.name.lower()
+                                keyword in vm.name_lower
                                 for keyword in ["control", "manage"]
                             )
                         ]
@@ -2127,21 +3206,12 @@ class AzureClient:
         """
         try:
             # Find existing subnets, private endpoints, and real VNets
-            subnets = [
-                r
-                for r in resources
-                if r.resource_type == "Microsoft.Network/virtualNetworks/subnets"
-            ]
-            private_endpoints = [
-                r
-                for r in resources
-                if r.resource_type == "Microsoft.Network/privateEndpoints"
-            ]
-            existing_vnets = [
-                r
-                for r in resources
-                if r.resource_type == "Microsoft.Network/virtualNetworks"
-            ]
+            subnets, private_endpoints, existing_vnets = _select_by_types(
+                resources,
+                "Microsoft.Network/virtualNetworks/subnets",
+                "Microsoft.Network/privateEndpoints",
+                "Microsoft.Network/virtualNetworks",
+            )
 
             # Track VNets we've already created (including existing real VNets)
             created_vnets = {}
@@ -2153,61 +3223,65 @@ class AzureClient:
 
             # Create VNet resources based on subnets (only if not already existing)
             for subnet in subnets:
-                if "vnet_name" in subnet.properties:
-                    vnet_name = subnet.properties["vnet_name"]
-
-                    if vnet_name not in created_vnets:
-                        # Create virtual VNet resource
-                        virtual_vnet = AzureResource(
-                            name=vnet_name,
-                            resource_type="Microsoft.Network/virtualNetworks",
-                            category="Network",
-                            location=subnet.location,
-                            resource_group=subnet.resource_group,
-                            subscription_id=self.subscription_id,
-                            properties={
-                                "is_virtual": True,
-                                "vnet_name": vnet_name,
-                            },
-                            tags={},
-                            dependencies=[],
-                        )
-                        resources.append(virtual_vnet)
-                        created_vnets[vnet_name] = virtual_vnet
-                        logger.debug(f"Created virtual VNet resource: {vnet_name}")
+                vnet_name = subnet.properties.get("vnet_name")
+                if vnet_name is None:
+                    continue
 
-                    # Add dependency from VNet to subnet
-                    created_vnets[vnet_name].add_dependency(
-                        subnet.name,
-                        DependencyType.EXPLICIT,
-                        "Azure API - VNet subnet containment",
-                    )
-                    logger.debug(
-                        f"Added subnet dependency: {vnet_name} -> {subnet.name}",
+                vnet_resource = created_vnets.get(vnet_name)
+                if vnet_resource is None:
+                    # Create virtual VNet resource
+                    vnet_resource = AzureResource(
+                        name=vnet_name,
+                        resource_type="Microsoft.Network/virtualNetworks",
+                        category="Network",
+                        location=subnet.location,
+                        resource_group=subnet.resource_group,
+                        subscription_id=self.subscription_id,
+                        properties={
+                            "is_virtual": True,
+                            "vnet_name": vnet_name,
+                        },
+                        tags={},
+                        dependencies=[],
                     )
+                    resources.append(vnet_resource)
+                    created_vnets[vnet_name] = vnet_resource
+                    logger.debug(f"Created virtual VNet resource: {vnet_name}")
+
+                # Add dependency from VNet to subnet
+                vnet_resource.add_dependency(
+                    subnet.name,
+                    DependencyType.EXPLICIT,
+                    "Azure API - VNet subnet containment",
+                )
+                logger.debug(
+                    f"Added subnet dependency: {vnet_name} -> {subnet.name}",
+                )
 
             # Establish PE → VNet relationships (PE belongs to VNet, not directly to subnet)
             for pe in private_endpoints:
-                if "vnet_name" in pe.properties:
-                    vnet_name = pe.properties["vnet_name"]
-                    if vnet_name in created_vnets:
-                        # Add dependency from VNet to PE (VNet contains PE)
-                        created_vnets[vnet_name].add_dependency(
-                            pe.name,
-                            DependencyType.EXPLICIT,
-                            "Azure API - VNet private endpoint containment",
-                        )
-                        logger.debug(f"Added PE dependency: {vnet_name} -> {pe.name}")
+                vnet_name = pe.properties.get("vnet_name")
+                vnet_resource = (
+                    created_vnets.get(vnet_name) if vnet_name is not None else None
+                )
+                if vnet_resource is None:
+                    continue
 
-                        # Remove direct PE → subnet dependency since PE now belongs to VNet
-                        subnet_full_name = (
-                            f"{vnet_name}/{pe.properties.get('subnet_name', '')}"
-                        )
-                        if subnet_full_name in pe.dependencies:
-                            pe.dependencies.remove(subnet_full_name)
-                            logger.debug(
-                                f"Removed direct subnet dependency: {pe.name} -/-> {subnet_full_name}",
-                            )
+                # Add dependency from VNet to PE (VNet contains PE)
+                vnet_resource.add_dependency(
+                    pe.name,
+                    DependencyType.EXPLICIT,
+                    "Azure API - VNet private endpoint containment",
+                )
+                logger.debug(f"Added PE dependency: {vnet_name} -> {pe.name}")
+
+                # Remove direct PE → subnet dependency since PE now belongs to VNet
+                subnet_full_name = f"{vnet_name}/{pe.properties.get('subnet_name', '')}"
+                if subnet_full_name in pe.dependencies:
+                    pe.dependencies.remove(subnet_full_name)
+                    logger.debug(
+                        f"Removed direct subnet dependency: {pe.name} -/-> {subnet_full_name}",
+                    )
 
         except Exception as e:
             logger.warning(f"Failed to add VNets and establish network hierarchy: {e}")
@@ -2231,33 +3305,56 @@ class AzureClient:
             return
 
         # Find related resources
-        vnets = [
-            r
-            for r in resources
-            if r.resource_type == "Microsoft.Network/virtualNetworks"
-        ]
-        subnets = [
-            r
-            for r in resources
-            if r.resource_type == "Microsoft.Network/virtualNetworks/subnets"
+        vnets, subnets, storage_accounts, nics, vms, load_balancers = _select_by_types(
+            resources,
+            "Microsoft.Network/virtualNetworks",
+            "Microsoft.Network/virtualNetworks/subnets",
+            "Microsoft.Storage/storageAccounts",
+            "Microsoft.Network/networkInterfaces",
+            "Microsoft.Compute/virtualMachines",
+            "Microsoft.Network/loadBalancers",
+        )
+
+        # Fetch OpenShift cluster details to extract DNS configuration; each
+        # call only updates its own cluster, so clusters are fetched concurrently
+        max_workers = min(_MAX_WORKERS, len(openshift_clusters))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(
+                executor.map(
+                    self._extract_openshift_dns_configuration,
+                    openshift_clusters,
+                ),
+            )
+
+        # Keyword matches do not depend on the cluster, so classify every
+        # name once; per cluster only the cluster name is searched
+        node_keywords = _name_pattern("master", "worker", "openshift", "aro")
+        storage_keywords = _name_pattern("registry", "cluster", "openshift", "aro")
+        lb_keywords = _name_pattern("openshift", "aro")
+        node_roles = _name_pattern("master", "worker")
+
+        vnet_matches = [(vnet, "openshift" in vnet.name_lower) for vnet in vnets]
+        subnet_matches = [
+            (subnet, bool(node_keywords.search(subnet.name_lower)))
+            for subnet in subnets
         ]
-        storage_accounts = [
-            r
-            for r in resources
-            if r.resource_type == "Microsoft.Storage/storageAccounts"
+        sa_matches = [
+            (sa, bool(storage_keywords.search(sa.name_lower)))
+            for sa in storage_accounts
         ]
-        nics = [
-            r
-            for r in resources
-            if r.resource_type == "Microsoft.Network/networkInterfaces"
+        vm_matches = [
+            (
+                vm,
+                "openshift" in vm.name_lower
+                or ("aro" in vm.name_lower and bool(node_roles.search(vm.name_lower))),
+            )
+            for vm in vms
         ]
-        vms = [
-            r
-            for r in resources
-            if r.resource_type == "Microsoft.Compute/virtualMachines"
+        nic_matches = [
+            (nic, bool(node_keywords.search(nic.name_lower))) for nic in nics
         ]
-        load_balancers = [
-            r for r in resources if r.resource_type == "Microsoft.Network/loadBalancers"
+        lb_matches = [
+            (lb, bool(lb_keywords.search(lb.name_lower))) for lb in load_balancers
         ]
 
         try:
@@ -2267,24 +3364,14 @@ class AzureClient:
                         f"Discovering dependencies for OpenShift cluster: {cluster.name}",
                     )
 
-                    # Fetch OpenShift cluster details to extract DNS configuration
-                    self._extract_openshift_dns_configuration(cluster)
-
                     # OpenShift clusters often have resources in different resource groups
                     # Look for resources with the cluster name pattern across all resource groups
-                    cluster_name_base = cluster.name.lower()
+                    cluster_name_base = cluster.name_lower
+                    cluster_name_no_hyphen = cluster_name_base.replace("-", "")
 
                     # Find VNets that match the cluster name (often named vnet-{cluster-name})
-                    for vnet in vnets:
-                        vnet_name_lower = vnet.name.lower()
-                        if (
-                            cluster_name_base in vnet_name_lower
-                            or (
-                                vnet_name_lower.startswith("vnet-")
-                                and cluster_name_base in vnet_name_lower
-                            )
-                            or "openshift" in vnet_name_lower
-                        ):
+                    for vnet, keyword_match in vnet_matches:
+                        if keyword_match or cluster_name_base in vnet.name_lower:
                             cluster.add_dependency(
                                 vnet.name,
                                 DependencyType.DERIVED,
@@ -2297,15 +3384,8 @@ class AzureClient:
                     # Find subnets that likely belong to this cluster
                     # Look for patterns like cluster-name, master, worker subnets
                     cluster_subnets = []
-                    for subnet in subnets:
-                        subnet_name_lower = subnet.name.lower()
-                        if (
-                            cluster_name_base in subnet_name_lower
-                            or "master" in subnet_name_lower
-                            or "worker" in subnet_name_lower
-                            or "openshift" in subnet_name_lower
-                            or "aro" in subnet_name_lower
-                        ):
+                    for subnet, keyword_match in subnet_matches:
+                        if keyword_match or cluster_name_base in subnet.name_lower:
                             cluster_subnets.append(subnet)
                             cluster.add_dependency(
                                 subnet.name,
@@ -2318,15 +3398,8 @@ class AzureClient:
 
                     # Find storage accounts that belong to this cluster
                     # Look for registry, cluster storage accounts
-                    for sa in storage_accounts:
-                        sa_name_lower = sa.name.lower()
-                        if (
-                            "registry" in sa_name_lower
-                            or "cluster" in sa_name_lower
-                            or cluster_name_base.replace("-", "") in sa_name_lower
-                            or "openshift" in sa_name_lower
-                            or "aro" in sa_name_lower
-                        ):
+                    for sa, keyword_match in sa_matches:
+                        if keyword_match or cluster_name_no_hyphen in sa.name_lower:
                             cluster.add_dependency(
                                 sa.name,
                                 DependencyType.DERIVED,
@@ -2338,15 +3411,9 @@ class AzureClient:
 
                     # Find VMs that are part of this cluster (master and worker nodes)
                     cluster_vms = []
-                    for vm in vms:
-                        vm_name_lower = vm.name.lower()
+                    for vm, keyword_match in vm_matches:
                         # Look for VMs with cluster name pattern or master/worker patterns
-                        if (
-                            cluster_name_base in vm_name_lower
-                            or ("master" in vm_name_lower and "aro" in vm_name_lower)
-                            or ("worker" in vm_name_lower and "aro" in vm_name_lower)
-                            or "openshift" in vm_name_lower
-                        ):
+                        if keyword_match or cluster_name_base in vm.name_lower:
                             cluster_vms.append(vm)
                             cluster.add_dependency(
                                 vm.name,
@@ -2358,15 +3425,8 @@ class AzureClient:
                             )
 
                     # Find NICs that belong to cluster VMs or infrastructure
-                    for nic in nics:
-                        nic_name_lower = nic.name.lower()
-                        if (
-                            cluster_name_base in nic_name_lower
-                            or "master" in nic_name_lower
-                            or "worker" in nic_name_lower
-                            or "openshift" in nic_name_lower
-                            or "aro" in nic_name_lower
-                        ):
+                    for nic, keyword_match in nic_matches:
+                        if keyword_match or cluster_name_base in nic.name_lower:
                             cluster.add_dependency(
                                 nic.name,
                                 DependencyType.DERIVED,
@@ -2377,13 +3437,8 @@ class AzureClient:
                             )
 
                     # Find load balancers that belong to this cluster
-                    for lb in load_balancers:
-                        lb_name_lower = lb.name.lower()
-                        if (
-                            cluster_name_base in lb_name_lower
-                            or "openshift" in lb_name_lower
-                            or "aro" in lb_name_lower
-                        ):
+                    for lb, keyword_match in lb_matches:
+                        if keyword_match or cluster_name_base in lb.name_lower:
                             cluster.add_dependency(
                                 lb.name,
                                 DependencyType.DERIVED,
@@ -2612,22 +3667,12 @@ class AzureClient:
             return
 
         # Find related resources
-        public_ips = [
-            r
-            for r in resources
-            if r.resource_type == "Microsoft.Network/publicIPAddresses"
-        ]
-        subnets = [
-            r
-            for r in resources
-            if r.resource_type == "Microsoft.Network/virtualNetworks/subnets"
-        ]
-        waf_policies = [
-            r
-            for r in resources
-            if r.resource_type
-            == "Microsoft.Network/applicationGatewayWebApplicationFirewallPolicies"
-        ]
+        public_ips, subnets, waf_policies = _select_by_types(
+            resources,
+            "Microsoft.Network/publicIPAddresses",
+            "Microsoft.Network/virtualNetworks/subnets",
+            "Microsoft.Network/applicationGatewayWebApplicationFirewallPolicies",
+        )
 
         try:
             for app_gw in app_gateways:
@@ -2637,9 +3682,10 @@ class AzureClient:
                     )
 
                     # Get Application Gateway details
-                    app_gw_details = self.network_client.application_gateways.get(
-                        resource_group_name=app_gw.resource_group,
-                        application_gateway_name=app_gw.name,
+                    app_gw_details = self._get_resource_model(
+                        "Microsoft.Network/applicationGateways",
+                        app_gw.resource_group,
+                        app_gw.name,
                     )
 
                     # Extract WAF policy relationship
@@ -2821,9 +3867,9 @@ class AzureClient:
             return ""
 
         # Azure resource ID format: /subscriptions/{sub}/resourceGroups/{rg}/providers/{provider}/{type}/{name}
-        parts = resource_id.split("/")
-        if len(parts) >= 9:
-            return parts[-1]  # Last part is the resource name
+        # The last segment is the resource name, also for child resources
+        if resource_id.count("/") >= 8:
+            return resource_id.rpartition("/")[2]
 
         return resource_id
 
@@ -2900,6 +3946,7 @@ class AzureClient:
         # Return specific API version if available, otherwise use a recent generic version
         return api_versions.get(resource_type.lower(), "2023-07-01")
 
+    @_cached
     def get_network_topology(
         self,
         resource_group_name: str,
@@ -2923,6 +3970,8 @@ class AzureClient:
                 )
                 return NetworkTopology()
 
+            from azure.mgmt.network.models import TopologyParameters
+
             # Get topology information
             topology_params = TopologyParameters(
                 target_resource_group_name=resource_group_name
@@ -2949,24 +3998,35 @@ class AzureClient:
         Returns:
             Dictionary with network watcher info or None if not found.
         """
-        try:
-            for nw in self.network_client.network_watchers.list_all():
-                if (
-                    nw.location
-                    and nw.location.replace(" ", "").lower()
-                    == location.replace(" ", "").lower()
-                ):
-                    return {
+        if self._network_watchers_by_location is None:
+            try:
+                network_watchers = list(
+                    self.network_client.network_watchers.list_all(),
+                )
+            except AzureError as e:
+                logger.error(f"Failed to find Network Watcher: {e}")
+                return None
+
+            # Watchers are listed once per client and indexed by normalized region
+            watchers_by_location: dict[str, dict[str, str]] = {}
+            for nw in network_watchers:
+                if not nw.location:
+                    continue
+                watchers_by_location.setdefault(
+                    nw.location.replace(" ", "").lower(),
+                    {
                         "name": nw.name or "",
                         "resource_group": nw.id.split("/")[4]
                         if nw.id
                         else "",  # Extract RG from resource ID
-                        "location": nw.location or "",
-                    }
-            return None
-        except AzureError as e:
-            logger.error(f"Failed to find Network Watcher: {e}")
-            return None
+                        "location": nw.location,
+                    },
+                )
+            self._network_watchers_by_location = watchers_by_location
+
+        return self._network_watchers_by_location.get(
+            location.replace(" ", "").lower(),
+        )
 
     def _parse_network_topology(self, topology: Any) -> NetworkTopology:
         """Parse Network Watcher topology response.
@@ -2982,65 +4042,45 @@ class AzureClient:
         if not topology or not topology.resources:
             return network_topology
 
-        # Parse resources by type
-        for resource in topology.resources:
-            # Safely extract resource type - handle different API response formats
-            resource_type = ""
-            try:
-                if hasattr(resource, "type") and resource.type:
-                    resource_type = resource.type.lower()
-                elif hasattr(resource, "resource_type") and resource.resource_type:
-                    resource_type = resource.resource_type.lower()
-            except AttributeError:
-                logger.debug(
-                    f"Could not determine resource type for resource: {resource}",
-                )
-                continue
-
-            resource_dict = {
-                "id": getattr(resource, "id", ""),
-                "name": getattr(resource, "name", ""),
-                "type": getattr(
-                    resource,
-                    "type",
-                    getattr(resource, "resource_type", ""),
-                ),
-                "location": getattr(resource, "location", ""),
-                "associations": getattr(resource, "associations", []) or [],
-            }
+        buckets = {
+            kind: getattr(network_topology, bucket_name)
+            for kind, bucket_name in _TOPOLOGY_BUCKETS.items()
+        }
 
-            if "virtualnetworks" in resource_type:
-                network_topology.virtual_networks.append(resource_dict)
-            elif "networkinterfaces" in resource_type:
-                network_topology.network_interfaces.append(resource_dict)
-            elif "publicipaddresses" in resource_type:
-                network_topology.public_ips.append(resource_dict)
-            elif "loadbalancers" in resource_type:
-                network_topology.load_balancers.append(resource_dict)
-            elif "networksecuritygroups" in resource_type:
-                network_topology.network_security_groups.append(resource_dict)
-
-        # Parse associations for all resources
+        # Single pass: snapshot each resource's attributes once, then bucket it
+        # and record its associations
         for resource in topology.resources:
-            associations = getattr(resource, "associations", []) or []
-            if associations:
-                for assoc in associations:
-                    try:
-                        network_topology.associations.append(
-                            {
-                                "source_id": getattr(resource, "id", ""),
-                                "target_id": getattr(assoc, "resource_id", ""),
-                                "association_type": getattr(
-                                    assoc,
-                                    "association_type",
-                                    "",
-                                ),
-                                "name": getattr(assoc, "name", ""),
-                            },
-                        )
-                    except AttributeError as e:
-                        logger.debug(f"Could not parse association: {e}")
-                        continue
+            resource_id = getattr(resource, "id", "") or ""
+            resource_type = (
+                getattr(resource, "type", None)
+                or getattr(resource, "resource_type", None)
+                or ""
+            )
+            associations = getattr(resource, "associations", None) or []
+
+            entry = TopologyEntry(
+                id=resource_id,
+                name=getattr(resource, "name", "") or "",
+                type=resource_type,
+                location=getattr(resource, "location", "") or "",
+                associations=associations,
+            )
+
+            # "Microsoft.Network/<kind>[/...]" -> "<kind>"
+            kind = resource_type.partition("/")[2].partition("/")[0].lower()
+            bucket = buckets.get(kind)
+            if bucket is not None:
+                bucket.append(entry)
+
+            for assoc in associations:
+                network_topology.associations.append(
+                    TopologyAssociation(
+                        source_id=resource_id,
+                        target_id=getattr(assoc, "resource_id", "") or "",
+                        association_type=getattr(assoc, "association_type", "") or "",
+                        name=getattr(assoc, "name", "") or "",
+                    ),
+                )
 
         return network_topology
 
@@ -3076,35 +4116,6 @@ class AzureClient:
             logger.debug(f"Could not get power state for VM '{vm_name}': {e}")
             return None
 
-    def _extract_category(self, resource_type: str) -> str:
-        """Extract category from Azure resource type.
-
-        Args:
-            resource_type: Full Azure resource type (e.g., Microsoft.Compute/virtualMachines).
-
-        Returns:
-            Resource category (e.g., Compute).
-        """
-        if not resource_type:
-            return "Unknown"
-
-        # Special case mappings for better logical categorization
-        special_mappings = {
-            "microsoft.redhatopenshift/openshiftclusters": "Container",
-            "microsoft.containerservice/managedclusters": "Container",
-            "microsoft.kubernetes/connectedclusters": "Container",
-        }
-
-        resource_type_lower = resource_type.lower()
-        if resource_type_lower in special_mappings:
-            return special_mappings[resource_type_lower]
-
-        parts = resource_type.split("/")
-        if len(parts) >= 2:
-            provider = parts[0].replace("Microsoft.", "")
-            return provider.title()
-        return "Unknown"
-
     def _discover_cross_resource_group_dependencies(
         self,
         resources: list[AzureResource],
@@ -3116,6 +4127,8 @@ class AzureClient:
         """
         try:
             external_resource_ids = set()
+            # Resources with a private link service connection, by target ID
+            connected_resources: dict[str, list[AzureResource]] = defaultdict(list)
 
             # Collect all external resource references
             for resource in resources:
@@ -3126,6 +4139,7 @@ class AzureClient:
                     )
                     for conn in resource.properties["external_pls_connections"]:
                         external_resource_ids.add(conn["id"])
+                        connected_resources[conn["id"]].append(resource)
                         logger.info(
                             f"Found external PLS dependency: {resource.name} -> {conn['name']} (RG: {conn['resource_group']})",
                         )
@@ -3163,9 +4177,19 @@ class AzureClient:
                 f"Total external resource IDs to process: {len(external_resource_ids)}",
             )
 
-            # Fetch and add external resources
-            for resource_id in external_resource_ids:
-                external_resource = self._fetch_external_resource(resource_id)
+            if not external_resource_ids:
+                return
+
+            # Results are added to the resource list in this thread
+            resource_ids = list(external_resource_ids)
+            external_resources = self._fetch_external_resources(resource_ids)
+
+            # Add external resources
+            for resource_id, external_resource in zip(
+                resource_ids,
+                external_resources,
+                strict=True,
+            ):
                 if external_resource:
                     resources.append(external_resource)
                     logger.info(
@@ -3173,18 +4197,15 @@ class AzureClient:
                     )
 
                     # Create dependencies from private endpoints to external resources
-                    for resource in resources:
-                        if "external_pls_connections" in resource.properties:
-                            for conn in resource.properties["external_pls_connections"]:
-                                if conn["id"] == resource_id:
-                                    resource.add_dependency(
-                                        external_resource.name,
-                                        DependencyType.EXPLICIT,
-                                        "Azure API - cross-resource group connection",
-                                    )
-                                    logger.debug(
-                                        f"Added dependency: {resource.name} -> {external_resource.name}",
-                                    )
+                    for resource in connected_resources.get(resource_id, []):
+                        resource.add_dependency(
+                            external_resource.name,
+                            DependencyType.EXPLICIT,
+                            "Azure API - cross-resource group connection",
+                        )
+                        logger.debug(
+                            f"Added dependency: {resource.name} -> {external_resource.name}",
+                        )
                 else:
                     # External resource fetch failed, check if it's a cross-tenant issue and create placeholder
                     is_cross_tenant = self._check_cross_tenant_resource(resource_id)
@@ -3205,20 +4226,15 @@ class AzureClient:
                         )
 
                         # Create dependencies to placeholder
-                        for resource in resources:
-                            if "external_pls_connections" in resource.properties:
-                                for conn in resource.properties[
-                                    "external_pls_connections"
-                                ]:
-                                    if conn["id"] == resource_id:
-                                        resource.add_dependency(
-                                            placeholder_resource.name,
-                                            DependencyType.EXPLICIT,
-                                            "Azure API - cross-resource group connection (placeholder)",
-                                        )
-                                        logger.info(
-                                            f"Added dependency to placeholder: {resource.name} -> {placeholder_resource.name}",
-                                        )
+                        for resource in connected_resources.get(resource_id, []):
+                            resource.add_dependency(
+                                placeholder_resource.name,
+                                DependencyType.EXPLICIT,
+                                "Azure API - cross-resource group connection (placeholder)",
+                            )
+                            logger.info(
+                                f"Added dependency to placeholder: {resource.name} -> {placeholder_resource.name}",
+                            )
                     else:
                         logger.warning(
                             f"Failed to create placeholder for {resource_id}",
@@ -3227,6 +4243,137 @@ class AzureClient:
         except Exception as e:
             logger.warning(f"Failed to discover cross-resource-group dependencies: {e}")
 
+    def _fetch_external_resources(
+        self,
+        resource_ids: list[str],
+    ) -> list[AzureResource | None]:
+        """Fetch several external resources by their full resource IDs.
+
+        Resources are looked up with batched Resource Graph queries when
+        that support is installed. IDs it does not return (or all IDs,
+        without Resource Graph) are fetched from ARM concurrently.
+
+        Args:
+            resource_ids: Full Azure resource IDs.
+
+        Returns:
+            AzureResource or None for each ID, in the order given.
+        """
+        found: dict[str, AzureResource] = {}
+        try:
+            found = self._query_external_resources(resource_ids)
+        except Exception as e:
+            logger.warning(f"Resource Graph external resource query failed: {e}")
+
+        missing = [rid for rid in resource_ids if rid.lower() not in found]
+        if missing:
+            max_workers = min(_MAX_WORKERS, len(missing))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for resource_id, resource in zip(
+                    missing,
+                    executor.map(self._fetch_external_resource, missing),
+                    strict=True,
+                ):
+                    if resource:
+                        found[resource_id.lower()] = resource
+
+        return [found.get(rid.lower()) for rid in resource_ids]
+
+    def _query_external_resources(
+        self,
+        resource_ids: list[str],
+    ) -> dict[str, AzureResource]:
+        """Look up external resources through Azure Resource Graph.
+
+        Args:
+            resource_ids: Full Azure resource IDs.
+
+        Returns:
+            Dictionary mapping lowercase resource ID to resource for the IDs
+            Resource Graph returned. Empty if Resource Graph support is not
+            installed.
+        """
+        if self.resource_graph_client is None:
+            return {}
+
+        parsed_ids = {}
+        for resource_id in resource_ids:
+            parsed = _parse_arm_id(resource_id)
+            if parsed is not None:
+                parsed_ids[resource_id.lower()] = (resource_id, parsed)
+        subscriptions = sorted({parsed["sub"] for _, parsed in parsed_ids.values()})
+
+        found: dict[str, AzureResource] = {}
+        ids = list(parsed_ids)
+        for start in range(0, len(ids), _RESOURCE_GRAPH_ID_BATCH):
+            quoted_ids = ", ".join(
+                "'" + rid.replace("\\", "\\\\").replace("'", "\\'") + "'"
+                for rid in ids[start : start + _RESOURCE_GRAPH_ID_BATCH]
+            )
+            rows = self._query_resource_graph(
+                f"Resources | where id in~ ({quoted_ids})"
+                " | project id, name, location, properties, tags",
+                subscriptions=subscriptions,
+            )
+            for row in rows or []:
+                key = str(row.get("id", "")).lower()
+                if key not in parsed_ids:
+                    continue
+                # Resource Graph lowercases types, so keep the casing of the
+                # referencing ID
+                resource_id, parsed = parsed_ids[key]
+                found[key] = self._build_external_resource(
+                    resource_id,
+                    parsed,
+                    name=row.get("name") or parsed["name"],
+                    location=row.get("location") or "",
+                    properties=row.get("properties") or {},
+                    tags=row.get("tags") or {},
+                )
+        return found
+
+    def _build_external_resource(
+        self,
+        resource_id: str,
+        parsed: dict[str, str],
+        *,
+        name: str,
+        location: str,
+        properties: dict[str, Any],
+        tags: dict[str, str],
+    ) -> AzureResource:
+        """Create the AzureResource for a resource from another resource group.
+
+        Args:
+            resource_id: Full Azure resource ID.
+            parsed: Components of the resource ID from _parse_arm_id.
+            name: Resource name.
+            location: Resource location.
+            properties: Resource properties.
+            tags: Resource tags.
+
+        Returns:
+            AzureResource marked as external dependency.
+        """
+        full_type = f"{parsed['ns']}/{parsed['type']}"
+        azure_resource = AzureResource(
+            name=name,
+            resource_type=full_type,
+            category=_extract_category(full_type),
+            location=location,
+            resource_group=parsed["rg"],
+            subscription_id=self.subscription_id,
+            properties=dict(properties),
+            tags=dict(tags),
+            dependencies=[],
+        )
+
+        # Mark as external dependency for visualization
+        azure_resource.properties["is_external_dependency"] = True
+        azure_resource.properties["source_resource_id"] = resource_id
+
+        return azure_resource
+
     def _fetch_external_resource(self, resource_id: str) -> AzureResource | None:
         """Fetch an external resource by its full resource ID.
 
@@ -3239,16 +4386,14 @@ class AzureClient:
         try:
             # Parse resource ID to extract components
             # Format: /subscriptions/{sub}/resourceGroups/{rg}/providers/{provider}/{type}/{name}
-            id_parts = resource_id.split("/")
-            if len(id_parts) < 9:
+            parsed = _parse_arm_id(resource_id)
+            if parsed is None:
                 logger.warning(f"Invalid resource ID format: {resource_id}")
                 return None
 
-            resource_group = id_parts[4]
-            provider = id_parts[6]
-            resource_type = id_parts[7]
-            resource_name = id_parts[8]
-            full_type = f"{provider}/{resource_type}"
+            resource_group = parsed["rg"]
+            resource_name = parsed["name"]
+            full_type = f"{parsed['ns']}/{parsed['type']}"
 
             logger.debug(
                 f"Fetching external resource: {resource_name} of type {full_type} from RG {resource_group}",
@@ -3256,30 +4401,29 @@ class AzureClient:
 
             # Use Resource Management API to get the resource details
             # Use appropriate API version based on resource type
+            # Several resource groups can reference the same external
+            # resource; fetch it (or learn it is missing or forbidden) once
+            # per client. Throttling and transient errors are fetched again
             api_version = self._get_api_version_for_resource_type(full_type)
-            resource = self.resource_client.resources.get_by_id(
-                resource_id,
-                api_version=api_version,
+            resource = self._fetch_once(
+                self._external_models,
+                resource_id.lower(),
+                lambda: self.resource_client.resources.get_by_id(
+                    resource_id,
+                    api_version=api_version,
+                ),
+                remember_failure=_is_definitive_failure,
             )
 
-            azure_resource = AzureResource(
+            return self._build_external_resource(
+                resource_id,
+                parsed,
                 name=resource.name,
-                resource_type=full_type,
-                category=self._extract_category(full_type),
                 location=resource.location,
-                resource_group=resource_group,
-                subscription_id=self.subscription_id,
                 properties=resource.properties or {},
                 tags=resource.tags or {},
-                dependencies=[],
             )
 
-            # Mark as external dependency for visualization
-            azure_resource.properties["is_external_dependency"] = True
-            azure_resource.properties["source_resource_id"] = resource_id
-
-            return azure_resource
-
         except AzureError as e:
             # Provide more specific error messages for common issues
             error_msg = str(e)
@@ -3313,17 +4457,9 @@ class AzureClient:
         Returns:
             True if the resource appears to be in a different subscription (potential cross-tenant).
         """
-        try:
-            # Extract subscription ID from resource ID
-            id_parts = resource_id.split("/")
-            if len(id_parts) >= 3 and id_parts[1] == "subscriptions":
-                external_subscription_id = id_parts[2]
-                # If the subscription ID is different from our current one, it might be cross-tenant
-                return external_subscription_id != self.subscription_id
-            return False
-        except Exception:
-            # If we can't parse the resource ID, assume it might be cross-tenant
-            return True
+        # IDs outside our subscription (or that can't be parsed) don't carry
+        # its prefix and might be cross-tenant
+        return not resource_id.lower().startswith(self._own_sub_prefix)
 
     def _create_placeholder_external_resource(
         self,
@@ -3343,34 +4479,27 @@ class AzureClient:
         """
         try:
             # Parse resource ID to extract components
-            id_parts = resource_id.split("/")
-            if len(id_parts) < 9:
+            parsed = _parse_arm_id(resource_id)
+            if parsed is None:
                 logger.warning(
                     f"Invalid resource ID format for placeholder: {resource_id}",
                 )
                 return None
 
-            resource_group = id_parts[4]
-            provider = id_parts[6]
-            resource_type = id_parts[7]
-            resource_name = id_parts[8]
-            full_type = f"{provider}/{resource_type}"
+            resource_group = parsed["rg"]
+            resource_name = parsed["name"]
+            full_type = f"{parsed['ns']}/{parsed['type']}"
 
             # Determine location and access note based on cross-tenant status
-            if is_cross_tenant:
-                location = "external-tenant"
-                access_note = "External resource (outside tenant)"
-                tenant_note = "This resource is in a different Azure tenant and cannot be accessed"
-            else:
-                location = "external"
-                access_note = "External resource (limited access)"
-                tenant_note = "This resource could not be accessed due to permissions"
+            location, access_note, tenant_note = _PLACEHOLDER_NOTES[
+                bool(is_cross_tenant)
+            ]
 
             # Create placeholder resource
             placeholder_resource = AzureResource(
                 name=resource_name,
                 resource_type=full_type,
-                category=self._extract_category(full_type),
+                category=_extract_category(full_type),
                 location=location,
                 resource_group=resource_group,
                 subscription_id=self.subscription_id,
@@ -3381,15 +4510,10 @@ class AzureClient:
                     "source_resource_id": resource_id,
                     "access_note": access_note,
                     "tenant_note": tenant_note,
-                    "error_summary": (
-                        error_message[:200] if error_message else ""
-                    ),  # Truncated error for reference
-                },
-                tags={
-                    "external_dependency": "true",
-                    "cross_tenant": str(is_cross_tenant).lower(),
-                    "access_status": "placeholder",
+                    # Truncated error for reference
+                    "error_summary": error_message[:200],
                 },
+                tags=dict(_PLACEHOLDER_TAGS[bool(is_cross_tenant)]),
                 dependencies=[],
             )
 
@@ -3408,128 +4532,118 @@ class AzureClient:
             cluster: OpenShift cluster resource to extract DNS configuration from.
         """
         try:
-            # Get OpenShift cluster details using Azure CLI (most reliable method)
-            import json
-            import subprocess
-
+            # Get OpenShift cluster details through the generic resources API;
+            # the properties are the same JSON document 'az resource show' returns
             cluster_resource_id = f"/subscriptions/{self.subscription_id}/resourceGroups/{cluster.resource_group}/providers/Microsoft.RedHatOpenShift/OpenShiftClusters/{cluster.name}"
 
-            result = subprocess.run(
-                [
-                    "az",
-                    "resource",
-                    "show",
-                    "--subscription",
-                    self.subscription_id,
-                    "--ids",
-                    cluster_resource_id,
-                    "--query",
-                    "properties",
-                    "-o",
-                    "json",
-                ],
-                capture_output=True,
-                text=True,
-                check=True,
+            cluster_details = self.resource_client.resources.get_by_id(
+                cluster_resource_id,
+                api_version=_OPENSHIFT_API_VERSION,
             )
-
-            cluster_properties = json.loads(result.stdout)
+            cluster_properties = cluster_details.properties or {}
+            apiserver_profile = cluster_properties.get("apiserverProfile") or {}
+            ingress_profiles = cluster_properties.get("ingressProfiles") or []
 
             # Extract DNS domains from cluster configuration
-            dns_domains = []
+            dns_domains: set[str] = set()
 
             # From API server profile
-            if (
-                "apiserverProfile" in cluster_properties
-                and "url" in cluster_properties["apiserverProfile"]
-            ):
-                api_url = cluster_properties["apiserverProfile"]["url"]
+            api_url = apiserver_profile.get("url")
+            if api_url:
                 # Extract domain from URL: https://api.hypershift-mgmt-hyp01.eastus.aroapp.io:6443/
-                if "://" in api_url:
-                    domain_part = api_url.split("://")[1].split(":")[0].split("/")[0]
-                    dns_domains.append(domain_part)
+                domain_part = _url_host(api_url)
+                if domain_part:
+                    dns_domains.add(domain_part)
                     logger.info(
-                        f"Extracted API DNS domain for {cluster.name}: {domain_part}",
+                        "Extracted API DNS domain for %s: %s",
+                        cluster.name,
+                        domain_part,
                     )
 
             # From console profile
-            if (
-                "consoleProfile" in cluster_properties
-                and "url" in cluster_properties["consoleProfile"]
-            ):
-                console_url = cluster_properties["consoleProfile"]["url"]
+            console_url = (cluster_properties.get("consoleProfile") or {}).get("url")
+            if console_url:
                 # Extract domain from URL: https://console-openshift-console.apps.hypershift-mgmt-hyp01.eastus.aroapp.io/
-                if "://" in console_url:
-                    domain_part = console_url.split("://")[1].split("/")[0]
-                    dns_domains.append(domain_part)
+                domain_part = _url_host(console_url)
+                if domain_part:
+                    dns_domains.add(domain_part)
                     logger.info(
-                        f"Extracted console DNS domain for {cluster.name}: {domain_part}",
+                        "Extracted console DNS domain for %s: %s",
+                        cluster.name,
+                        domain_part,
                     )
 
             # From cluster profile domain
-            if (
-                "clusterProfile" in cluster_properties
-                and "domain" in cluster_properties["clusterProfile"]
-            ):
-                cluster_domain = cluster_properties["clusterProfile"]["domain"]
-                dns_domains.append(cluster_domain)
+            cluster_domain = (cluster_properties.get("clusterProfile") or {}).get(
+                "domain"
+            )
+            if cluster_domain:
+                dns_domains.add(cluster_domain)
                 logger.info(
-                    f"Extracted cluster domain for {cluster.name}: {cluster_domain}",
+                    "Extracted cluster domain for %s: %s",
+                    cluster.name,
+                    cluster_domain,
                 )
 
             # Check for any custom ingress domains or wildcard domains
-            if "ingressProfiles" in cluster_properties:
-                for ingress_profile in cluster_properties["ingressProfiles"]:
-                    if "domain" in ingress_profile:
-                        custom_domain = ingress_profile["domain"]
-                        dns_domains.append(custom_domain)
-                        logger.info(
-                            f"Found custom ingress domain for {cluster.name}: {custom_domain}",
-                        )
+            for ingress_profile in ingress_profiles:
+                custom_domain = ingress_profile.get("domain")
+                if custom_domain:
+                    dns_domains.add(custom_domain)
+                    logger.info(
+                        "Found custom ingress domain for %s: %s",
+                        cluster.name,
+                        custom_domain,
+                    )
 
-                    # Check for wildcard domains in ingress configuration
-                    if "wildcardPolicy" in ingress_profile:
-                        logger.info(
-                            f"Ingress wildcard policy for {cluster.name}: {ingress_profile['wildcardPolicy']}",
-                        )
+                # Check for wildcard domains in ingress configuration
+                wildcard_policy = ingress_profile.get("wildcardPolicy")
+                if wildcard_policy is not None:
+                    logger.info(
+                        "Ingress wildcard policy for %s: %s",
+                        cluster.name,
+                        wildcard_policy,
+                    )
 
             # Store extracted DNS domains in cluster properties
             if dns_domains:
-                cluster.properties["openshift_dns_domains"] = list(
-                    set(dns_domains),
-                )  # Remove duplicates
+                domains = sorted(dns_domains)
+                cluster.properties["openshift_dns_domains"] = domains
                 logger.info(
-                    f"Stored {len(set(dns_domains))} DNS domains for OpenShift cluster {cluster.name}: {list(set(dns_domains))}",
+                    "Stored %d DNS domains for OpenShift cluster %s: %s",
+                    len(domains),
+                    cluster.name,
+                    domains,
                 )
 
                 # Also store the cluster's IP endpoints for DNS record matching
-                cluster_ips = []
-                if (
-                    "apiserverProfile" in cluster_properties
-                    and "ip" in cluster_properties["apiserverProfile"]
-                ):
-                    cluster_ips.append(cluster_properties["apiserverProfile"]["ip"])
-
-                if "ingressProfiles" in cluster_properties:
-                    for ingress_profile in cluster_properties["ingressProfiles"]:
-                        if "ip" in ingress_profile:
-                            cluster_ips.append(ingress_profile["ip"])
+                cluster_ips = {
+                    profile.get("ip")
+                    for profile in (apiserver_profile, *ingress_profiles)
+                }
+                cluster_ips.discard(None)
 
                 if cluster_ips:
-                    cluster.properties["openshift_cluster_ips"] = list(set(cluster_ips))
-                    logger.info(f"Stored cluster IPs for {cluster.name}: {cluster_ips}")
+                    ips = sorted(cluster_ips)
+                    cluster.properties["openshift_cluster_ips"] = ips
+                    logger.info("Stored cluster IPs for %s: %s", cluster.name, ips)
             else:
                 logger.warning(
-                    f"No DNS domains found for OpenShift cluster {cluster.name}",
+                    "No DNS domains found for OpenShift cluster %s",
+                    cluster.name,
                 )
 
-        except subprocess.CalledProcessError as e:
+        except AzureError as e:
             logger.warning(
-                f"Failed to extract OpenShift DNS configuration for {cluster.name}: {e}",
+                "Failed to extract OpenShift DNS configuration for %s: %s",
+                cluster.name,
+                e,
             )
         except Exception as e:
             logger.warning(
-                f"Error extracting OpenShift DNS configuration for {cluster.name}: {e}"
+                "Error extracting OpenShift DNS configuration for %s: %s",
+                cluster.name,
+                e,
             )
 
     def _get_vm_details(
@@ -3545,8 +4659,10 @@ class AzureClient:
             Dictionary of VM details or None if unavailable.
         """
         try:
-            vm = self.compute_client.virtual_machines.get(
-                resource_group_name=resource_group_name, vm_name=vm_name
+            vm = self._get_resource_model(
+                "Microsoft.Compute/virtualMachines",
+                resource_group_name,
+                vm_name,
             )
 
             details = {}
@@ -3605,8 +4721,10 @@ class AzureClient:
             Dictionary of disk details or None if unavailable.
         """
         try:
-            disk = self.compute_client.disks.get(
-                resource_group_name=resource_group_name, disk_name=disk_name
+            disk = self._get_resource_model(
+                "Microsoft.Compute/disks",
+                resource_group_name,
+                disk_name,
             )
 
             details = {}
@@ -3650,14 +4768,10 @@ class AzureClient:
             Dictionary of storage details or None if unavailable.
         """
         try:
-            from azure.mgmt.storage import StorageManagementClient
-
-            storage_client = StorageManagementClient(
-                credential=self.credential, subscription_id=self.subscription_id
-            )
-
-            storage = storage_client.storage_accounts.get_properties(
-                resource_group_name=resource_group_name, account_name=storage_name
+            storage = self._get_resource_model(
+                "Microsoft.Storage/storageAccounts",
+                resource_group_name,
+                storage_name,
             )
 
             details = {}
@@ -3697,8 +4811,10 @@ class AzureClient:
             Dictionary of NIC details or None if unavailable.
         """
         try:
-            nic = self.network_client.network_interfaces.get(
-                resource_group_name=resource_group_name, network_interface_name=nic_name
+            nic = self._get_resource_model(
+                "Microsoft.Network/networkInterfaces",
+                resource_group_name,
+                nic_name,
             )
 
             details = {}
@@ -3725,11 +4841,9 @@ class AzureClient:
                 # Associated subnet
                 if primary_ip_config.subnet:
                     subnet_id = primary_ip_config.subnet.id
-                    if subnet_id:
-                        subnet_name = subnet_id.split("/")[-1]
-                        vnet_name = subnet_id.split("/")[-3]
-                        details["subnet_name"] = subnet_name
-                        details["vnet_name"] = vnet_name
+                    names = _subnet_names_from_id(subnet_id) if subnet_id else None
+                    if names:
+                        details["vnet_name"], details["subnet_name"] = names
 
             # Network security group
             if nic.network_security_group:
@@ -3761,8 +4875,10 @@ class AzureClient:
             Dictionary of public IP details or None if unavailable.
         """
         try:
-            pip = self.network_client.public_ip_addresses.get(
-                resource_group_name=resource_group_name, public_ip_address_name=pip_name
+            pip = self._get_resource_model(
+                "Microsoft.Network/publicIPAddresses",
+                resource_group_name,
+                pip_name,
             )
 
             details = {}
@@ -3789,12 +4905,10 @@ class AzureClient:
                 ip_config_id = pip.ip_configuration.id
                 if ip_config_id:
                     # Extract associated resource info from IP configuration ID
-                    id_parts = ip_config_id.split("/")
-                    if len(id_parts) >= 9:
-                        resource_type = f"{id_parts[6]}/{id_parts[7]}"
-                        resource_name = id_parts[8]
+                    parsed = _parse_arm_id(ip_config_id)
+                    if parsed:
                         details["associated_resource"] = (
-                            f"{resource_name} ({resource_type})"
+                            f"{parsed['name']} ({parsed['ns']}/{parsed['type']})"
                         )
 
             return details
@@ -3816,8 +4930,10 @@ class AzureClient:
             Dictionary of VNet details or None if unavailable.
         """
         try:
-            vnet = self.network_client.virtual_networks.get(
-                resource_group_name=resource_group_name, virtual_network_name=vnet_name
+            vnet = self._get_resource_model(
+                "Microsoft.Network/virtualNetworks",
+                resource_group_name,
+                vnet_name,
             )
 
             details = {}
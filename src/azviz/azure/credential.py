@@ -0,0 +1,88 @@
+"""Token caching for Azure credentials shared by several SDK clients."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from azure.core.credentials import AccessToken, TokenCredential
+
+# Tokens are refreshed this many seconds before they expire
+_TOKEN_REFRESH_SKEW = 300
+
+
+class CachedTokenCredential:
+    """Credential wrapper that reuses access tokens until shortly before expiry.
+
+    Every management client has its own authentication policy and asks the
+    credential for a token on its first request. Credentials such as
+    AzureCliCredential do not cache tokens themselves and spawn an ``az``
+    process per request, so the wrapper shares one token per scope set and
+    request options (such as ``enable_cae``) between all clients.
+    """
+
+    def __init__(
+        self,
+        credential: TokenCredential,
+        refresh_skew: int = _TOKEN_REFRESH_SKEW,
+    ):
+        """Initialize cached credential.
+
+        Args:
+            credential: Credential used to acquire new tokens.
+            refresh_skew: Seconds before expiry at which a token is renewed.
+        """
+        self.credential = credential
+        self.refresh_skew = refresh_skew
+        self._tokens: dict[
+            tuple[tuple[str, ...], tuple[tuple[str, Any], ...]], AccessToken
+        ] = {}
+        self._lock = threading.Lock()
+
+    def get_token(
+        self,
+        *scopes: str,
+        claims: str | None = None,
+        tenant_id: str | None = None,
+        **kwargs: Any,
+    ) -> AccessToken:
+        """Get an access token, reusing a cached one while it is still valid.
+
+        Args:
+            scopes: Scopes the token is requested for.
+            claims: Additional claims from a claims challenge.
+            tenant_id: Tenant to request the token from.
+            **kwargs: Passed through to the wrapped credential.
+
+        Returns:
+            Access token for the scopes.
+        """
+        # Claims challenges and cross-tenant requests always need a new token
+        if claims or tenant_id:
+            return self.credential.get_token(
+                *scopes,
+                claims=claims,
+                tenant_id=tenant_id,
+                **kwargs,
+            )
+
+        # Options such as enable_cae change the token that is issued, so
+        # requests with different options do not share a cache slot
+        key = (scopes, tuple(sorted(kwargs.items())))
+
+        # Holding the lock while acquiring means concurrent first requests
+        # wait for a single credential chain probe instead of racing
+        with self._lock:
+            token = self._tokens.get(key)
+            if token is None or token.expires_on - self.refresh_skew <= time.time():
+                token = self.credential.get_token(*scopes, **kwargs)
+                self._tokens[key] = token
+            return token
+
+    def close(self) -> None:
+        """Close the wrapped credential if it supports closing."""
+        close = getattr(self.credential, "close", None)
+        if close is not None:
+            close()
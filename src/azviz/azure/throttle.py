@@ -0,0 +1,106 @@
+"""Proactive pacing of ARM reads based on the quota headers ARM returns."""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from azure.core.pipeline import PipelineResponse
+
+logger = logging.getLogger(__name__)
+
+# Remaining subscription reads below which requests start being slowed down;
+# ARM allows roughly 12000 reads per hour and refills the bucket continuously
+_LOW_READS_WATERMARK = 100
+
+# Longest pause added after a single response while the ARM read quota is low
+_MAX_DELAY = 1.0
+
+# Longest pause added after a single response once the Resource Graph quota is
+# used up; longer reset windows are left to the SDK's 429 retries, since every
+# pool worker with a request in flight sleeps in the hook
+_MAX_QUOTA_RESET_DELAY = 5.0
+
+
+def _parse_reset_after(value: str) -> float | None:
+    """Parse an x-ms-user-quota-resets-after value ("hh:mm:ss") into seconds."""
+    try:
+        hours, minutes, seconds = value.split(":")
+        return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+    except ValueError:
+        return None
+
+
+class ReadQuotaThrottle:
+    """Response hook that slows callers down before ARM starts throttling.
+
+    ARM reports the remaining read quota on every response. Waiting a little
+    while the quota is low spreads requests out, instead of running into 429
+    responses whose Retry-After can stall discovery for much longer.
+
+    Installed on the management clients as their ``raw_response_hook``; the
+    pause happens in the thread that issued the request, so concurrent
+    fan-outs slow down together.
+    """
+
+    def __init__(
+        self,
+        low_watermark: int = _LOW_READS_WATERMARK,
+        max_delay: float = _MAX_DELAY,
+        max_reset_delay: float = _MAX_QUOTA_RESET_DELAY,
+    ):
+        """Initialize read quota throttle.
+
+        Args:
+            low_watermark: Remaining reads below which requests are delayed.
+            max_delay: Delay in seconds applied when no reads are left.
+            max_reset_delay: Longest delay in seconds spent waiting for an
+                exhausted Resource Graph quota to reset.
+        """
+        self.low_watermark = low_watermark
+        self.max_delay = max_delay
+        self.max_reset_delay = max_reset_delay
+
+    def __call__(self, response: PipelineResponse) -> None:
+        """Pause the calling thread if the read quota is running low.
+
+        Args:
+            response: Pipeline response of an ARM request.
+        """
+        delay = self.get_delay(response.http_response.headers)
+        if delay > 0:
+            logger.debug(f"ARM read quota low, pausing {delay:.2f}s")
+            time.sleep(delay)
+
+    def get_delay(self, headers: dict[str, str]) -> float:
+        """Get the pause warranted by the quota headers of a response.
+
+        Args:
+            headers: Response headers.
+
+        Returns:
+            Delay in seconds, 0 if the quota is not running low.
+        """
+        delay = 0.0
+
+        remaining_reads = headers.get("x-ms-ratelimit-remaining-subscription-reads")
+        if remaining_reads and remaining_reads.isdigit():
+            remaining = int(remaining_reads)
+            if remaining < self.low_watermark:
+                delay = self.max_delay * (1 - remaining / self.low_watermark)
+
+        # Resource Graph uses a small per-user quota that resets in windows
+        remaining_queries = headers.get("x-ms-user-quota-remaining")
+        if remaining_queries and remaining_queries.isdigit():
+            if int(remaining_queries) == 0:
+                reset_after = _parse_reset_after(
+                    headers.get("x-ms-user-quota-resets-after", ""),
+                )
+                delay = max(
+                    delay,
+                    min(reset_after or self.max_delay, self.max_reset_delay),
+                )
+
+        return delay
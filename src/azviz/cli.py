@@ -10,6 +10,7 @@ from rich.console import Console
 from rich.logging import RichHandler
 from rich.table import Table
 
+from ._version import __version__
 from .core import AzViz, Direction, LabelVerbosity, OutputFormat, Splines, Theme
 
 # Setup rich console
@@ -43,7 +44,7 @@ def setup_logging(verbose: bool = False) -> None:
     "-s",
     help="Azure subscription ID or name. If not specified, uses the first available subscription from your Azure credentials.",
 )
-@click.version_option()
+@click.version_option(version=__version__)
 @click.pass_context
 def cli(ctx: click.Context, verbose: bool, subscription: str | None) -> None:
     """Python AzViz - Azure resource topology visualization tool.
@@ -148,6 +149,17 @@ def cli(ctx: click.Context, verbose: bool, subscription: str | None) -> None:
     help="Show only compute resources and their directly related resources (VMs, disks, SSH keys, etc.)",
 )
 @click.option("--save-dot", is_flag=True, help="Save DOT source file alongside output")
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False),
+    help="Cache Azure discovery responses in this directory to speed up repeated exports",
+)
+@click.option(
+    "--cache-ttl",
+    type=click.IntRange(min=0),
+    default=60,
+    help="Seconds cached discovery responses stay fresh (default: 60)",
+)
 @click.option(
     "--subscription",
     "-s",
@@ -169,6 +181,8 @@ def export(
     no_power_state: bool,
     compute_only: bool,
     save_dot: bool,
+    cache_dir: str | None,
+    cache_ttl: int,
     subscription: str | None,
 ) -> None:
     """Export Azure resource topology diagram.
@@ -185,6 +199,7 @@ def export(
       python-azviz export -g my-rg --format html --output topology.html  # Interactive HTML output
       python-azviz export -g my-rg --no-power-state       # Disable VM power state display
       python-azviz export -g my-rg --compute-only         # Show only compute resources and dependencies
+      python-azviz export -g my-rg --cache-dir .azviz_cache  # Reuse discovery results across runs
       python-azviz export -g my-rg --subscription "12345678-1234-1234-1234-123456789012"
       python-azviz export -g my-rg --subscription "My Production Subscription"
     """
@@ -196,7 +211,11 @@ def export(
         # Initialize AzViz
         if verbose_mode:
             console.print("🔄 Initializing Azure connection...", style="blue")
-        azviz = AzViz(subscription_identifier=final_subscription)
+        azviz = AzViz(
+            subscription_identifier=final_subscription,
+            cache_dir=cache_dir,
+            cache_ttl=cache_ttl,
+        )
 
         # Validate prerequisites
         prereqs = azviz.validate_prerequisites()
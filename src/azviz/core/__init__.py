@@ -13,6 +13,8 @@ from .models import (
     Splines,
     Theme,
     ThemeConfig,
+    TopologyAssociation,
+    TopologyEntry,
     VisualizationConfig,
 )
 
@@ -29,5 +31,7 @@ __all__ = [
     "Splines",
     "Theme",
     "ThemeConfig",
+    "TopologyAssociation",
+    "TopologyEntry",
     "VisualizationConfig",
 ]
@@ -31,6 +31,8 @@ class AzViz:
         subscription_identifier: str | None = None,
         credential: Any | None = None,
         icon_directory: str | Path | None = None,
+        cache_dir: str | Path | None = None,
+        cache_ttl: int = 60,
     ):
         """Initialize AzViz instance.
 
@@ -38,8 +40,15 @@ class AzViz:
             subscription_identifier: Azure subscription ID or name. If None, uses first available.
             credential: Azure credential object. If None, uses DefaultAzureCredential.
             icon_directory: Path to Azure service icons. If None, uses package icons.
+            cache_dir: Directory for caching Azure discovery responses. If None, caching is disabled.
+            cache_ttl: Seconds a cached discovery response stays fresh.
         """
-        self.azure_client = AzureClient(subscription_identifier, credential)
+        self.azure_client = AzureClient(
+            subscription_identifier,
+            credential,
+            cache_dir=cache_dir,
+            cache_ttl=cache_ttl,
+        )
         self.icon_manager = IconManager(icon_directory)
 
         # Verify Azure authentication
@@ -128,15 +137,17 @@ class AzViz:
             set()
         )  # Track unique resources by (name, resource_type, resource_group)
 
-        for rg_name in resource_groups:
-            logger.info(f"Discovering resources in resource group: {rg_name}")
+        logger.info(f"Discovering resources in resource groups: {resource_groups}")
 
-            # Get resources
-            resources = self.azure_client.get_resources_in_group(
-                rg_name,
-                config.show_power_state,
-            )
+        # Get resources for all resource groups concurrently. Exclusions are
+        # applied by GraphBuilder, after compute-only filtering and relationship
+        # discovery have seen the excluded types (e.g. NICs that link subnets).
+        resources_by_group = self.azure_client.get_resources_in_groups(
+            resource_groups,
+            config.show_power_state,
+        )
 
+        for rg_name, resources in resources_by_group.items():
             # Deduplicate resources - only add if not seen before
             for resource in resources:
                 resource_key = (
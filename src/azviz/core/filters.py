@@ -0,0 +1,79 @@
+"""Resource type filtering shared by discovery and graph building."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+def matches_type_pattern(resource_type: str, pattern: str) -> bool:
+    """Check if resource type matches a type pattern.
+
+    Args:
+        resource_type: Azure resource type.
+        pattern: Resource type, optionally with a single '*' wildcard.
+
+    Returns:
+        True if resource type matches pattern.
+    """
+    # Simple wildcard matching
+    if "*" in pattern:
+        pattern_parts = pattern.lower().split("*")
+        resource_type_lower = resource_type.lower()
+
+        if len(pattern_parts) == 1:
+            return pattern_parts[0] in resource_type_lower
+
+        # Check if starts with first part and ends with last part
+        if len(pattern_parts) == 2:
+            start, end = pattern_parts
+            return resource_type_lower.startswith(
+                start
+            ) and resource_type_lower.endswith(end)
+
+    return resource_type.lower() == pattern.lower()
+
+
+def is_type_selected(
+    resource_type: str,
+    include_types: Iterable[str] | None = None,
+    exclude_types: Iterable[str] | None = None,
+) -> bool:
+    """Check if a resource type passes include and exclude patterns.
+
+    Args:
+        resource_type: Azure resource type.
+        include_types: Patterns of types to keep. If empty or None, all types are kept.
+        exclude_types: Patterns of types to drop.
+
+    Returns:
+        True if the resource type should be kept.
+    """
+    if include_types and not any(
+        matches_type_pattern(resource_type, pattern) for pattern in include_types
+    ):
+        return False
+    return not (
+        exclude_types
+        and any(
+            matches_type_pattern(resource_type, pattern) for pattern in exclude_types
+        )
+    )
+
+
+def build_type_filter(include_types: Iterable[str] | None) -> str | None:
+    """Build an ARM $filter expression selecting the given resource types.
+
+    Args:
+        include_types: Resource types to select.
+
+    Returns:
+        OData filter expression, or None if the types cannot be filtered
+        server-side (none given or wildcards used).
+    """
+    types = sorted(set(include_types or ()))
+    if not types or any("*" in t or "'" in t for t in types):
+        return None
+    return " or ".join(f"resourceType eq '{t}'" for t in types)
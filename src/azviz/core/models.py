@@ -57,7 +57,7 @@ class DependencyType(str, Enum):
     DERIVED = "derived"  # Inferred from patterns/heuristics
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceDependency:
     """Represents a dependency between Azure resources."""
 
@@ -66,7 +66,7 @@ class ResourceDependency:
     description: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AzureResource:
     """Represents an Azure resource."""
 
@@ -79,6 +79,20 @@ class AzureResource:
     properties: dict[str, Any] = field(default_factory=dict)
     tags: dict[str, str] = field(default_factory=dict)
     dependencies: list[str | ResourceDependency] = field(default_factory=list)
+    # Lowercase name for the case-insensitive name matching done by discovery
+    name_lower: str = field(init=False, repr=False, compare=False)
+    # Target names in dependencies, so repeated discovery of an edge is O(1)
+    _dependency_names: set[str] = field(
+        default_factory=set,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        """Derive the lowercase name and index constructor dependencies."""
+        self.name_lower = self.name.lower()
+        self._dependency_names.update(self.get_dependency_names())
 
     def add_dependency(
         self,
@@ -86,10 +100,21 @@ class AzureResource:
         dependency_type: DependencyType = DependencyType.EXPLICIT,
         description: str | None = None,
     ) -> None:
-        """Add a dependency with type information."""
+        """Add a dependency with type information.
+
+        Dependencies on a target that is already present are ignored, so
+        relationships found by several discovery passes produce one edge.
+        """
+        if target_name in self._dependency_names:
+            return
+        self._dependency_names.add(target_name)
         dependency = ResourceDependency(target_name, dependency_type, description)
         self.dependencies.append(dependency)
 
+    def has_dependency(self, target_name: str) -> bool:
+        """Check whether a dependency on the target is already present."""
+        return target_name in self._dependency_names
+
     def get_dependency_names(self) -> list[str]:
         """Get all dependency target names (for backward compatibility)."""
         names = []
@@ -101,17 +126,38 @@ class AzureResource:
         return names
 
 
+@dataclass(slots=True)
+class TopologyEntry:
+    """Network resource reported by Network Watcher topology."""
+
+    id: str
+    name: str
+    type: str
+    location: str
+    associations: list[Any] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class TopologyAssociation:
+    """Association between two network resources in a topology."""
+
+    source_id: str
+    target_id: str
+    association_type: str
+    name: str
+
+
 @dataclass
 class NetworkTopology:
     """Network topology information."""
 
-    virtual_networks: list[dict[str, Any]] = field(default_factory=list)
-    subnets: list[dict[str, Any]] = field(default_factory=list)
-    network_interfaces: list[dict[str, Any]] = field(default_factory=list)
-    public_ips: list[dict[str, Any]] = field(default_factory=list)
-    load_balancers: list[dict[str, Any]] = field(default_factory=list)
-    network_security_groups: list[dict[str, Any]] = field(default_factory=list)
-    associations: list[dict[str, Any]] = field(default_factory=list)
+    virtual_networks: list[TopologyEntry] = field(default_factory=list)
+    subnets: list[TopologyEntry] = field(default_factory=list)
+    network_interfaces: list[TopologyEntry] = field(default_factory=list)
+    public_ips: list[TopologyEntry] = field(default_factory=list)
+    load_balancers: list[TopologyEntry] = field(default_factory=list)
+    network_security_groups: list[TopologyEntry] = field(default_factory=list)
+    associations: list[TopologyAssociation] = field(default_factory=list)
 
 
 @dataclass
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 from collections import defaultdict
 
 import networkx as nx
 
+from ..core.filters import matches_type_pattern
 from ..core.models import (
     AzureResource,
     DependencyType,
@@ -21,6 +23,30 @@ from ..core.models import (
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=4096)
+def _make_node_id(category: str, name: str, resource_type: str) -> str:
+    """Build the graph node ID for a resource.
+
+    The resource type suffix is included to avoid ID collisions between
+    resources with the same name but different types. Cached because every
+    resource's ID is derived again for each edge that touches it.
+
+    Args:
+        category: Resource category.
+        name: Resource name.
+        resource_type: Full Azure resource type.
+
+    Returns:
+        DOT-safe node ID.
+    """
+    resource_type_suffix = resource_type.rsplit("/", 1)[-1].lower()
+    return (
+        f"{category.lower()}_{name.lower()}_{resource_type_suffix}".replace(" ", "_")
+        .replace("-", "_")
+        .replace(".", "_")
+    )
+
+
 class GraphBuilder:
     """Builds NetworkX graphs from Azure resources and network topology."""
 
@@ -221,7 +247,7 @@ class GraphBuilder:
                 compute_resource.resource_type.lower()
                 == "microsoft.compute/virtualmachines"
             ):
-                vm_name = compute_resource.name.lower()
+                vm_name = compute_resource.name_lower
 
                 # Look for related networking resources by name patterns
                 for resource in resources:
@@ -229,7 +255,7 @@ class GraphBuilder:
                         resource.resource_type.lower() in compute_related_types
                         and resource.name not in related_resource_names
                     ):
-                        resource_name = resource.name.lower()
+                        resource_name = resource.name_lower
 
                         # Check for common naming patterns
                         if (
@@ -282,22 +308,7 @@ class GraphBuilder:
         Returns:
             True if resource type matches pattern.
         """
-        # Simple wildcard matching
-        if "*" in pattern:
-            pattern_parts = pattern.lower().split("*")
-            resource_type_lower = resource_type.lower()
-
-            if len(pattern_parts) == 1:
-                return pattern_parts[0] in resource_type_lower
-
-            # Check if starts with first part and ends with last part
-            if len(pattern_parts) == 2:
-                start, end = pattern_parts
-                return resource_type_lower.startswith(
-                    start
-                ) and resource_type_lower.endswith(end)
-
-        return resource_type.lower() == pattern.lower()
+        return matches_type_pattern(resource_type, pattern)
 
     def _group_resources(
         self, resources: list[AzureResource]
@@ -373,6 +384,17 @@ class GraphBuilder:
             },
         )
 
+    def _get_node_id(self, resource: AzureResource) -> str:
+        """Get the graph node ID for a resource.
+
+        Args:
+            resource: Azure resource.
+
+        Returns:
+            Node ID shared by the resource's node and all edges touching it.
+        """
+        return _make_node_id(resource.category, resource.name, resource.resource_type)
+
     def _create_resource_node(self, resource: AzureResource) -> GraphNode:
         """Create a graph node from an Azure resource.
 
@@ -382,19 +404,7 @@ class GraphBuilder:
         Returns:
             GraphNode representing the resource.
         """
-        # Include resource type to avoid ID collisions between resources with same name but different types
-        resource_type_suffix = (
-            resource.resource_type.split("/")[-1].lower()
-            if "/" in resource.resource_type
-            else resource.resource_type.lower()
-        )
-        node_id = (
-            f"{resource.category.lower()}_{resource.name.lower()}_{resource_type_suffix}".replace(
-                " ", "_"
-            )
-            .replace("-", "_")
-            .replace(".", "_")
-        )
+        node_id = self._get_node_id(resource)
         label = self._build_node_label(
             resource.name, [resource.name], resource.category, resource.resource_type
         )
@@ -551,83 +561,33 @@ class GraphBuilder:
             network_topology: Network topology information.
             resources: List of Azure resources.
         """
-        # Create a more specific mapping to avoid name collisions
+        # Map constructed resource IDs to resources, plus a name index for
+        # topology IDs that do not match exactly (first resource wins per name)
         resource_by_id = {}
+        resource_by_name: dict[str, AzureResource] = {}
         for r in resources:
-            # Construct resource ID from available information
             resource_id = f"/subscriptions/{r.subscription_id}/resourceGroups/{r.resource_group}/providers/{r.resource_type}/{r.name}"
             resource_by_id[resource_id] = r
-            # Also map by name for backward compatibility, but with type suffix to avoid collisions
-            resource_type_suffix = (
-                r.resource_type.split("/")[-1].lower()
-                if "/" in r.resource_type
-                else r.resource_type.lower()
-            )
-            unique_name_key = f"{r.name}_{resource_type_suffix}"
-            resource_by_id[unique_name_key] = r
+            resource_by_name.setdefault(r.name, r)
 
         for association in network_topology.associations:
-            source_id = association["source_id"]
-            target_id = association["target_id"]
-
-            # Try to find resources by full ID first, then by name
-            source_resource = None
-            target_resource = None
-
-            # Try full resource ID lookup first
-            if source_id in resource_by_id:
-                source_resource = resource_by_id[source_id]
-            else:
-                # Fall back to name-based lookup
-                source_name = self._extract_resource_name_from_id(source_id)
-                # Try to find by unique name key (name + type suffix)
-                for key, resource in resource_by_id.items():
-                    if (
-                        key.startswith(f"{source_name}_")
-                        and resource.name == source_name
-                    ):
-                        source_resource = resource
-                        break
+            source_id = association.source_id
+            target_id = association.target_id
 
-            if target_id in resource_by_id:
-                target_resource = resource_by_id[target_id]
-            else:
-                # Fall back to name-based lookup
-                target_name = self._extract_resource_name_from_id(target_id)
-                # Try to find by unique name key (name + type suffix)
-                for key, resource in resource_by_id.items():
-                    if (
-                        key.startswith(f"{target_name}_")
-                        and resource.name == target_name
-                    ):
-                        target_resource = resource
-                        break
+            # Try full resource ID lookup first, then fall back to the name
+            source_resource = resource_by_id.get(source_id) or resource_by_name.get(
+                self._extract_resource_name_from_id(source_id),
+            )
+            target_resource = resource_by_id.get(target_id) or resource_by_name.get(
+                self._extract_resource_name_from_id(target_id),
+            )
 
             # Only create edges for resources we have
             if source_resource and target_resource:
-                # Use same node ID generation logic as _create_resource_node
-                source_type_suffix = (
-                    source_resource.resource_type.split("/")[-1].lower()
-                    if "/" in source_resource.resource_type
-                    else source_resource.resource_type.lower()
-                )
-                target_type_suffix = (
-                    target_resource.resource_type.split("/")[-1].lower()
-                    if "/" in target_resource.resource_type
-                    else target_resource.resource_type.lower()
-                )
                 edge = GraphEdge(
-                    source=f"{source_resource.category.lower()}_{source_resource.name.lower()}_{source_type_suffix}".replace(
-                        " ", "_"
-                    )
-                    .replace("-", "_")
-                    .replace(".", "_"),
-                    target=f"{target_resource.category.lower()}_{target_resource.name.lower()}_{target_type_suffix}".replace(
-                        " ", "_"
-                    )
-                    .replace("-", "_")
-                    .replace(".", "_"),
-                    label=association.get("association_type", ""),
+                    source=self._get_node_id(source_resource),
+                    target=self._get_node_id(target_resource),
+                    label=association.association_type,
                     edge_type="association",
                     attributes={"style": "solid", "color": "blue"},
                 )
@@ -1033,28 +993,9 @@ class GraphBuilder:
                         edge_attrs = {"style": "dashed", "color": "red"}
                         label = "depends on"
 
-                    # Use same node ID generation logic as _create_resource_node
-                    source_type_suffix = (
-                        resource.resource_type.split("/")[-1].lower()
-                        if "/" in resource.resource_type
-                        else resource.resource_type.lower()
-                    )
-                    target_type_suffix = (
-                        dep_resource.resource_type.split("/")[-1].lower()
-                        if "/" in dep_resource.resource_type
-                        else dep_resource.resource_type.lower()
-                    )
                     edge = GraphEdge(
-                        source=f"{resource.category.lower()}_{resource.name.lower()}_{source_type_suffix}".replace(
-                            " ", "_"
-                        )
-                        .replace("-", "_")
-                        .replace(".", "_"),
-                        target=f"{dep_resource.category.lower()}_{dep_name.lower()}_{target_type_suffix}".replace(
-                            " ", "_"
-                        )
-                        .replace("-", "_")
-                        .replace(".", "_"),
+                        source=self._get_node_id(resource),
+                        target=self._get_node_id(dep_resource),
                         label=label,
                         edge_type="dependency",
                         attributes=edge_attrs,
@@ -1124,22 +1065,22 @@ class GraphBuilder:
                     else:
                         # For other resources, use naming pattern matching
                         name_matches = (
-                            base_name.lower() in resource.name.lower()
+                            base_name.lower() in resource.name_lower
                             or
                             # Look for common patterns between DNS zone and resource names
                             any(
-                                part in dns_zone.name.lower()
-                                and part in resource.name.lower()
+                                part in dns_zone.name_lower
+                                and part in resource.name_lower
                                 for part in ["hypershift", "mgmt"]
                                 if len(part) > 3
                             )
                             or
                             # Extract any meaningful parts from DNS zone name and check if they appear in resource name
                             any(
-                                part in resource.name.lower()
-                                for part in dns_zone.name.lower()
-                                .replace(".", " ")
-                                .split()
+                                part in resource.name_lower
+                                for part in dns_zone.name_lower.replace(
+                                    ".", " "
+                                ).split()
                                 if len(part) >= 4 and part.isalnum()
                             )
                         )
@@ -1183,28 +1124,9 @@ class GraphBuilder:
                         }
                         label = "provides DNS for"
 
-                    # Use same node ID generation logic as _create_resource_node
-                    source_type_suffix = (
-                        dns_zone.resource_type.split("/")[-1].lower()
-                        if "/" in dns_zone.resource_type
-                        else dns_zone.resource_type.lower()
-                    )
-                    target_type_suffix = (
-                        resource.resource_type.split("/")[-1].lower()
-                        if "/" in resource.resource_type
-                        else resource.resource_type.lower()
-                    )
                     edge = GraphEdge(
-                        source=f"{dns_zone.category.lower()}_{dns_zone.name.lower()}_{source_type_suffix}".replace(
-                            " ", "_"
-                        )
-                        .replace("-", "_")
-                        .replace(".", "_"),
-                        target=f"{resource.category.lower()}_{resource.name.lower()}_{target_type_suffix}".replace(
-                            " ", "_"
-                        )
-                        .replace("-", "_")
-                        .replace(".", "_"),
+                        source=self._get_node_id(dns_zone),
+                        target=self._get_node_id(resource),
                         label=label,
                         edge_type="dns_service",
                         attributes=edge_attrs,
@@ -1437,19 +1359,7 @@ class GraphBuilder:
         for rg_name, rg_resources in rg_groups.items():
             subgraph_nodes = []
             for resource in rg_resources:
-                # Use same node ID generation logic as _create_resource_node
-                resource_type_suffix = (
-                    resource.resource_type.split("/")[-1].lower()
-                    if "/" in resource.resource_type
-                    else resource.resource_type.lower()
-                )
-                node_id = (
-                    f"{resource.category.lower()}_{resource.name.lower()}_{resource_type_suffix}".replace(
-                        " ", "_"
-                    )
-                    .replace("-", "_")
-                    .replace(".", "_")
-                )
+                node_id = self._get_node_id(resource)
                 if node_id in self.graph:
                     subgraph_nodes.append(node_id)
 
@@ -0,0 +1,467 @@
+"""Tests for AzureClient helpers that do not require Azure access."""
+
+import json
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+from azure.core.exceptions import HttpResponseError
+
+from azviz.azure.cache import ResponseCache
+from azviz.azure.client import _RETRY_OPTIONS, AzureClient
+from azviz.core.models import AzureResource
+
+
+def make_client() -> AzureClient:
+    """Create an AzureClient without authenticating against Azure."""
+    client = AzureClient.__new__(AzureClient)
+    client.subscription_id = "00000000-0000-0000-0000-000000000000"
+    client.subscription_name = "test-subscription"
+    client._own_sub_prefix = f"/subscriptions/{client.subscription_id}/"
+    client._cache = None
+    client._network_watchers_by_location = None
+    client._subscription_subnets = None
+    client._resource_models = {}
+    client._external_models = {}
+    client._resource_models_lock = threading.Lock()
+    client._subscription_names = {}
+    return client
+
+
+def test_get_resources_in_groups_preserves_order():
+    """Test that concurrent multi-RG discovery returns groups in input order."""
+    client = make_client()
+    client.get_resources_in_group = Mock(side_effect=lambda name, *_: [name])
+
+    result = client.get_resources_in_groups(["rg-b", "rg-a", "rg-c"])
+
+    assert list(result) == ["rg-b", "rg-a", "rg-c"]
+    assert result["rg-a"] == ["rg-a"]
+    assert client.get_resources_in_group.call_count == 3
+
+
+def test_retry_options_configure_sdk_retry_policy():
+    """Test that the shared retry settings are accepted by azure-core."""
+    from azure.core.pipeline.policies import RetryPolicy
+
+    policy = RetryPolicy(**_RETRY_OPTIONS)
+
+    assert policy.total_retries == _RETRY_OPTIONS["retry_total"]
+    assert policy.backoff_max == _RETRY_OPTIONS["retry_backoff_max"]
+
+
+def test_cached_serves_fresh_and_stale_responses(tmp_path):
+    """Test that discovery responses are cached and served stale on error."""
+    client = make_client()
+    client._cache = ResponseCache(tmp_path, ttl=60)
+    client.resource_client = Mock()
+    rg = Mock(location="eastus", tags={}, properties=None)
+    rg.name = "rg-a"
+    client.resource_client.resource_groups.list.return_value = [rg]
+
+    first = client.get_resource_groups()
+    second = client.get_resource_groups()
+    assert first == second
+    assert client.resource_client.resource_groups.list.call_count == 1
+
+    # Expire the entry, then fail the ARM call
+    client._cache.ttl = 0
+    client._cache.set((client.subscription_id, "get_resource_groups", (), ()), first)
+    client.resource_client.resource_groups.list.side_effect = HttpResponseError(
+        response=Mock(status_code=500, headers={}),
+    )
+    assert client.get_resource_groups() == first
+
+
+def test_iter_resources_in_group_streams_in_listing_order():
+    """Test that streamed resources keep listing order and merged details."""
+    client = make_client()
+    listed = []
+    for name, resource_type in [
+        ("vm1", "Microsoft.Compute/virtualMachines"),
+        ("kv1", "Microsoft.KeyVault/vaults"),
+        ("disk1", "Microsoft.Compute/disks"),
+    ]:
+        resource = Mock(type=resource_type, location="eastus", properties={}, tags={})
+        resource.name = name
+        listed.append(resource)
+    client.resource_client = Mock()
+    client.resource_client.resources.list_by_resource_group.return_value = listed
+    client._get_resource_details = Mock(
+        side_effect=lambda _rg, _type, name: {"detail": name},
+    )
+
+    resources = list(client.iter_resources_in_group("rg", show_power_state=False))
+
+    assert [r.name for r in resources] == ["vm1", "kv1", "disk1"]
+    assert "detail" not in resources[0].properties
+    assert resources[2].properties["detail"] == "disk1"
+
+
+def test_get_vm_power_states_batch():
+    """Test that VM power states are read from a single ARM batch response."""
+    client = make_client()
+    client.compute_client = Mock()
+    client.compute_client.send_request.return_value.content = json.dumps(
+        {
+            "responses": [
+                {
+                    "name": "0",
+                    "httpStatusCode": 200,
+                    "content": {"statuses": [{"code": "PowerState/running"}]},
+                },
+                {"name": "1", "httpStatusCode": 404, "content": {}},
+            ],
+        },
+    ).encode()
+
+    power_states = client._get_vm_power_states_batch("rg", ["vm1", "vm2"])
+
+    assert power_states == {"vm1": "running"}
+    assert client.compute_client.send_request.call_count == 1
+
+
+def test_find_network_watcher_lists_watchers_once():
+    """Test that Network Watchers are listed once and looked up by region."""
+    client = make_client()
+    watcher = Mock(
+        location="East US",
+        id="/subscriptions/sub/resourceGroups/NetworkWatcherRG/providers/"
+        "Microsoft.Network/networkWatchers/NetworkWatcher_eastus",
+    )
+    watcher.name = "NetworkWatcher_eastus"
+    client.network_client = Mock()
+    client.network_client.network_watchers.list_all.return_value = [watcher]
+
+    assert client._find_network_watcher("eastus")["resource_group"] == (
+        "NetworkWatcherRG"
+    )
+    assert client._find_network_watcher("westus") is None
+    assert client.network_client.network_watchers.list_all.call_count == 1
+
+
+def test_get_resource_model_fetches_each_resource_once():
+    """Test that repeated model lookups share a single ARM GET."""
+    client = make_client()
+    client.compute_client = Mock()
+    get = client.compute_client.virtual_machines.get
+
+    first = client._get_resource_model("Microsoft.Compute/virtualMachines", "rg", "vm1")
+    second = client._get_resource_model(
+        "microsoft.compute/virtualmachines", "RG", "vm1"
+    )
+
+    assert first is second
+    get.assert_called_once_with("rg", "vm1")
+
+
+def test_list_vm_power_states_fills_model_cache():
+    """Test that VMs listed for power states are reused as discovery models."""
+    client = make_client()
+    client.compute_client = Mock()
+    vm = Mock()
+    vm.name = "vm1"
+    vm.instance_view.statuses = [Mock(code="PowerState/running")]
+    client.compute_client.virtual_machines.list.return_value = [vm]
+
+    assert client._list_vm_power_states("rg") == {"vm1": "running"}
+    assert (
+        client._get_resource_model("Microsoft.Compute/virtualMachines", "rg", "vm1")
+        is vm
+    )
+    client.compute_client.virtual_machines.get.assert_not_called()
+
+
+def test_discover_all_subnets_from_resource_graph():
+    """Test that Resource Graph rows become virtual subnets without duplicates."""
+    client = make_client()
+    vnet_id = (
+        "/subscriptions/sub/resourceGroups/RG1/providers/"
+        "Microsoft.Network/virtualNetworks/vnet1"
+    )
+    client._query_resource_graph = Mock(
+        return_value=[
+            {
+                "vnet": "vnet1",
+                "subnetName": "default",
+                "prefix": "10.0.0.0/24",
+                "id": vnet_id,
+                "loc": "eastus",
+            },
+            {
+                "vnet": "vnet1",
+                "subnetName": "apps",
+                "prefix": "10.0.1.0/24",
+                "id": vnet_id,
+                "loc": "eastus",
+            },
+        ],
+    )
+    resources = [
+        AzureResource(
+            name="vnet1/default",
+            resource_type="Microsoft.Network/virtualNetworks/subnets",
+            category="Network",
+            location="eastus",
+            resource_group="RG1",
+            subscription_id=client.subscription_id,
+            properties={},
+            tags={},
+            dependencies=[],
+        ),
+    ]
+
+    client._discover_all_subnets(resources)
+
+    assert [r.name for r in resources] == ["vnet1/default", "vnet1/apps"]
+    assert resources[1].properties["address_prefix"] == "10.0.1.0/24"
+    # Resource group keeps the casing of the ARM id, not Resource Graph's
+    assert resources[1].resource_group == "RG1"
+
+
+def test_cached_token_credential_reuses_token_until_skew():
+    """Test that tokens are shared until they are close to expiry."""
+    from azure.core.credentials import AccessToken
+
+    from azviz.azure.credential import CachedTokenCredential
+
+    tokens = [
+        AccessToken("first", int(time.time()) + 3600),
+        AccessToken("second", int(time.time()) + 60),
+        AccessToken("third", int(time.time()) + 3600),
+        AccessToken("cae", int(time.time()) + 3600),
+    ]
+    inner = Mock()
+    inner.get_token.side_effect = tokens
+    credential = CachedTokenCredential(inner)
+
+    assert credential.get_token("scope/.default") is tokens[0]
+    assert credential.get_token("scope/.default") is tokens[0]
+    assert credential.get_token("other/.default") is tokens[1]
+    # Expires within the refresh skew, so it is renewed
+    assert credential.get_token("other/.default") is tokens[2]
+    # CAE tokens are cached separately from plain tokens for the same scope
+    assert credential.get_token("scope/.default", enable_cae=True) is tokens[3]
+    assert credential.get_token("scope/.default") is tokens[0]
+    assert credential.get_token("scope/.default", enable_cae=True) is tokens[3]
+    assert inner.get_token.call_count == 4
+
+
+def test_parse_arm_id():
+    """Test ARM resource ID parsing for top-level and child resources."""
+    from azviz.azure.client import _parse_arm_id, _subnet_names_from_id
+
+    vnet_id = (
+        "/subscriptions/sub1/resourceGroups/rg1/providers/"
+        "Microsoft.Network/virtualNetworks/vnet1"
+    )
+    parsed = _parse_arm_id(vnet_id)
+    assert parsed is not None
+    assert parsed["rg"] == "rg1"
+    assert parsed["type"] == "virtualNetworks"
+    assert parsed["name"] == "vnet1"
+    assert parsed["subname"] == ""
+
+    assert _subnet_names_from_id(f"{vnet_id}/subnets/default") == ("vnet1", "default")
+    assert _subnet_names_from_id(vnet_id) is None
+    assert _parse_arm_id("/subscriptions/sub1/resourceGroups/rg1") is None
+
+
+def test_url_host():
+    """Test that URL hosts keep their case and do not require a scheme."""
+    from azviz.azure.client import _url_host
+
+    assert _url_host("https://api.MyCluster.eastus.aroapp.io:6443/") == (
+        "api.MyCluster.eastus.aroapp.io"
+    )
+    assert _url_host("console.apps.example.com/path") == "console.apps.example.com"
+    assert _url_host("https:///path") is None
+
+
+def test_read_quota_throttle_delay():
+    """Test that the throttle only pauses while the read quota is low."""
+    from azviz.azure.throttle import ReadQuotaThrottle
+
+    throttle = ReadQuotaThrottle(low_watermark=100, max_delay=1.0, max_reset_delay=5.0)
+    header = "x-ms-ratelimit-remaining-subscription-reads"
+
+    assert throttle.get_delay({header: "11999"}) == 0
+    assert throttle.get_delay({header: "75"}) == pytest.approx(0.25)
+    assert throttle.get_delay({header: "0"}) == pytest.approx(1.0)
+    assert throttle.get_delay({}) == 0
+    assert throttle.get_delay(
+        {
+            "x-ms-user-quota-remaining": "0",
+            "x-ms-user-quota-resets-after": "00:00:03",
+        },
+    ) == pytest.approx(3.0)
+
+
+def test_read_quota_throttle_caps_exhausted_resource_graph_quota():
+    """Test that an exhausted Resource Graph quota pauses at most max_reset_delay."""
+    from azviz.azure.throttle import ReadQuotaThrottle
+
+    throttle = ReadQuotaThrottle(max_delay=1.0, max_reset_delay=5.0)
+
+    assert throttle.get_delay(
+        {
+            "x-ms-user-quota-remaining": "0",
+            "x-ms-user-quota-resets-after": "00:01:00",
+        },
+    ) == pytest.approx(5.0)
+    # Without a parsable reset window the regular maximum applies
+    assert throttle.get_delay({"x-ms-user-quota-remaining": "0"}) == pytest.approx(1.0)
+    assert throttle.get_delay({"x-ms-user-quota-remaining": "3"}) == 0
+
+
+def test_fetch_external_resources_uses_resource_graph():
+    """Test that external resources come from Resource Graph with ARM fallback."""
+    client = make_client()
+    client.resource_graph_client = Mock()
+    pls_id = (
+        "/subscriptions/sub2/resourceGroups/Other-RG/providers"
+        "/Microsoft.Network/privateLinkServices/pls1"
+    )
+    lb_id = (
+        "/subscriptions/sub2/resourceGroups/Other-RG/providers"
+        "/Microsoft.Network/loadBalancers/lb1"
+    )
+    client._query_resource_graph = Mock(
+        return_value=[
+            {
+                "id": pls_id.lower(),
+                "name": "pls1",
+                "location": "eastus",
+                "properties": {"fqdns": []},
+                "tags": {},
+            },
+        ],
+    )
+    fallback = Mock(name="lb1")
+    client._fetch_external_resource = Mock(return_value=fallback)
+
+    pls, lb = client._fetch_external_resources([pls_id, lb_id])
+
+    assert pls.name == "pls1"
+    assert pls.resource_type == "Microsoft.Network/privateLinkServices"
+    assert pls.resource_group == "Other-RG"
+    assert pls.properties["is_external_dependency"] is True
+    assert lb is fallback
+    client._fetch_external_resource.assert_called_once_with(lb_id)
+    assert client._query_resource_graph.call_args.kwargs["subscriptions"] == ["sub2"]
+
+
+def test_fetch_external_resource_retries_transient_failures():
+    """Test that throttled lookups are fetched again but 404s are remembered."""
+    from azure.core.exceptions import ResourceNotFoundError
+
+    client = make_client()
+    client.resource_client = Mock()
+    lb_id = (
+        "/subscriptions/sub2/resourceGroups/Other-RG/providers"
+        "/Microsoft.Network/loadBalancers/lb1"
+    )
+    pls_id = (
+        "/subscriptions/sub2/resourceGroups/Other-RG/providers"
+        "/Microsoft.Network/privateLinkServices/pls1"
+    )
+    lb = Mock(location="eastus", properties={}, tags={})
+    lb.name = "lb1"
+    throttled = HttpResponseError(response=Mock(status_code=429, headers={}))
+    client.resource_client.resources.get_by_id.side_effect = [
+        throttled,
+        lb,
+        ResourceNotFoundError("gone"),
+    ]
+
+    assert client._fetch_external_resource(lb_id) is None
+    assert client._fetch_external_resource(lb_id).name == "lb1"
+    assert client._fetch_external_resource(pls_id) is None
+    assert client._fetch_external_resource(pls_id) is None
+    assert client.resource_client.resources.get_by_id.call_count == 3
+
+
+def test_close_releases_shared_session_and_credential():
+    """Test that closing the client closes the pooled session and credential."""
+    client = make_client()
+    transport = Mock()
+    client._client_options = {"transport": transport}
+    client.credential = Mock()
+    client._owns_credential = True
+
+    with client as entered:
+        assert entered is client
+
+    transport.session.close.assert_called_once_with()
+    client.credential.close.assert_called_once_with()
+
+
+def test_close_leaves_caller_credential_open():
+    """Test that a credential passed in by the caller is not closed."""
+    credential = Mock()
+    credential.get_token.return_value = Mock(expires_on=int(time.time()) + 3600)
+    subscription = Mock(
+        subscription_id="00000000-0000-0000-0000-000000000000",
+        display_name="test-subscription",
+    )
+    with patch("azure.mgmt.subscription.SubscriptionClient") as subscription_client:
+        subscription_client.return_value.subscriptions.list.return_value = [
+            subscription,
+        ]
+        client = AzureClient(credential=credential)
+
+    client.close()
+
+    credential.close.assert_not_called()
+
+
+def test_resolve_subscription_id_without_listing():
+    """Test that a subscription ID is resolved with a single get call."""
+    from azure.core.exceptions import ResourceNotFoundError
+
+    client = make_client()
+    client._token_prefetch = Mock()
+    client._subscription_client = Mock()
+    subscription_id = "11111111-2222-3333-4444-555555555555"
+    client._subscription_client.subscriptions.get.return_value = Mock(
+        subscription_id=subscription_id,
+        display_name="Production",
+    )
+
+    assert client._resolve_subscription_identifier(subscription_id) == (
+        subscription_id,
+        "Production",
+    )
+    client._subscription_client.subscriptions.list.assert_not_called()
+
+    client._subscription_client.subscriptions.get.side_effect = ResourceNotFoundError(
+        "missing"
+    )
+    with pytest.raises(ValueError, match="not found"):
+        client._resolve_subscription_identifier(
+            "99999999-2222-3333-4444-555555555555",
+        )
+
+
+def test_subscription_names_are_scoped_to_the_credential():
+    """Test that a known subscription is only reused with the same credential."""
+    subscription_id = "22222222-3333-4444-5555-666666666666"
+    subscription = Mock(subscription_id=subscription_id, display_name="Shared")
+    first, second = Mock(), Mock()
+    for credential in (first, second):
+        credential.get_token.return_value = Mock(
+            expires_on=int(time.time()) + 3600,
+        )
+
+    with patch("azure.mgmt.subscription.SubscriptionClient") as subscription_client:
+        subscriptions = subscription_client.return_value.subscriptions
+        subscriptions.list.return_value = [subscription]
+        subscriptions.get.return_value = subscription
+
+        AzureClient(credential=first)
+        AzureClient(subscription_identifier=subscription_id, credential=first)
+        subscriptions.get.assert_not_called()
+
+        AzureClient(subscription_identifier=subscription_id, credential=second)
+        subscriptions.get.assert_called_once_with(subscription_id)
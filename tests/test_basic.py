@@ -116,8 +116,8 @@ def test_icon_manager_custom_mapping():
     assert mappings["custom.resource/type"] == "custom-icon.png"
 
 
-@patch("azviz.azure.client.DefaultAzureCredential")
-@patch("azviz.azure.client.SubscriptionClient")
+@patch("azure.identity.DefaultAzureCredential")
+@patch("azure.mgmt.subscription.SubscriptionClient")
 def test_azure_client_import(mock_subscription_client, mock_credential):
     """Test that AzureClient can be imported and basic functionality works."""
     from azviz.azure.client import AzureClient
@@ -185,3 +185,53 @@ def test_enums_values():
     # Test DependencyType enum
     assert DependencyType.EXPLICIT.value == "explicit"
     assert DependencyType.DERIVED.value == "derived"
+
+
+def test_resource_type_filters():
+    """Test include/exclude type patterns and ARM $filter construction."""
+    from azviz.core.filters import build_type_filter, is_type_selected
+
+    assert is_type_selected("Microsoft.Compute/virtualMachines")
+    assert not is_type_selected(
+        "Microsoft.Network/routeTables",
+        exclude_types={"Microsoft.Network/routeTables"},
+    )
+    assert not is_type_selected(
+        "Microsoft.Network/virtualNetworks/subnets",
+        exclude_types={"Microsoft.Network/*subnets"},
+    )
+    assert not is_type_selected(
+        "Microsoft.Compute/disks",
+        include_types={"Microsoft.Compute/virtualMachines"},
+    )
+
+    assert build_type_filter(None) is None
+    assert build_type_filter({"Microsoft.Compute/*"}) is None
+    assert build_type_filter(
+        {"Microsoft.Compute/disks", "Microsoft.Compute/virtualMachines"}
+    ) == (
+        "resourceType eq 'Microsoft.Compute/disks' or "
+        "resourceType eq 'Microsoft.Compute/virtualMachines'"
+    )
+
+
+def test_azure_resource_ignores_duplicate_dependencies():
+    """Test that the same dependency target is only added once."""
+    resource = AzureResource(
+        name="test-nic",
+        resource_type="Microsoft.Network/networkInterfaces",
+        category="Network",
+        location="eastus",
+        resource_group="test-rg",
+        subscription_id="test-sub",
+        dependencies=["vnet/default"],
+    )
+
+    resource.add_dependency("vnet/default", DependencyType.EXPLICIT, "NIC subnet")
+    resource.add_dependency("test-vm", DependencyType.EXPLICIT, "VM NIC")
+    resource.add_dependency("test-vm", DependencyType.DERIVED, "duplicate")
+
+    assert resource.get_dependency_names() == ["vnet/default", "test-vm"]
+    assert resource.has_dependency("test-vm")
+    assert not resource.has_dependency("test-disk")
+    assert resource.dependencies[1].description == "VM NIC"